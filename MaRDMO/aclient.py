@@ -0,0 +1,105 @@
+import asyncio
+import contextvars
+import threading
+import time
+
+from . import client
+from .config import http_connect_timeout, http_read_timeout, http_retries, http_deadline, http_pool_hosts, http_pool_size
+
+try:
+    import httpx
+except ImportError:
+    # Without httpx Requests run on Threads via the synchronous Client
+    httpx = None
+
+# AsyncClient of the running Event Loop (set by run)
+_client = contextvars.ContextVar('MaRDMO_aclient', default=None)
+
+def newClient():
+    '''Get new httpx AsyncClient with pooled Connections and default Timeouts'''
+    return httpx.AsyncClient(timeout=httpx.Timeout(http_read_timeout, connect=http_connect_timeout),
+                             limits=httpx.Limits(max_connections=http_pool_hosts * http_pool_size, max_keepalive_connections=http_pool_size),
+                             headers={'User-Agent': client.USER_AGENT})
+
+async def request(method, url, retries=None, idempotent=None, deadline=None, **kwargs):
+    '''Perform Request asynchronously, Retries as for client.request.
+
+       Uses httpx if installed, else the synchronous Client on a Thread.'''
+    if httpx is None:
+        return await asyncio.to_thread(client.request, method, url, retries=retries, idempotent=idempotent, deadline=deadline, **kwargs)
+
+    if retries is None:
+        retries = http_retries
+    if idempotent is None:
+        idempotent = method.upper() in client.IDEMPOTENT_METHODS
+    if not idempotent:
+        retries = 0
+    end = time.monotonic() + (http_deadline if deadline is None else deadline)
+    if isinstance(kwargs.get('data'), (str, bytes)):
+        # Raw Bodies (e.g. SPARQL Queries) are passed as content to httpx
+        kwargs['content'] = kwargs.pop('data')
+
+    session = _client.get()
+    if session is None:
+        async with newClient() as session:
+            return await _request(session, method, url, retries, end, **kwargs)
+    return await _request(session, method, url, retries, end, **kwargs)
+
+async def _request(session, method, url, retries, end, **kwargs):
+    connect, read = client.timeouts(kwargs.pop('timeout', None))
+    attempt = 0
+    while True:
+        left = end - time.monotonic()
+        try:
+            response = await session.request(method, url, timeout=httpx.Timeout(min(read, left), connect=min(connect, left)), **kwargs)
+        except httpx.TransportError:
+            delay = client.retryDelay(attempt, retries, end)
+            if delay is None:
+                raise
+        else:
+            if response.status_code not in client.RETRY_STATUS:
+                return response
+            delay = client.retryDelay(attempt, retries, end, response)
+            if delay is None:
+                return response
+            await response.aclose()
+        await asyncio.sleep(delay)
+        attempt += 1
+
+async def get(url, **kwargs):
+    return await request('GET', url, **kwargs)
+
+async def post(url, **kwargs):
+    return await request('POST', url, **kwargs)
+
+def run(*coroutines):
+    '''Sync Wrapper: run coroutines concurrently from synchronous Code and get their Results in order.
+
+       All Requests share one AsyncClient. Called within a running Event Loop,
+       the coroutines run on a separate Thread.'''
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(_gather(coroutines))
+    outcome = {}
+    def target():
+        try:
+            outcome['results'] = asyncio.run(_gather(coroutines))
+        except BaseException as error:
+            outcome['error'] = error
+    thread = threading.Thread(target=target)
+    thread.start()
+    thread.join()
+    if 'error' in outcome:
+        raise outcome['error']
+    return outcome['results']
+
+async def _gather(coroutines):
+    if httpx is None:
+        return await asyncio.gather(*coroutines)
+    async with newClient() as session:
+        token = _client.set(session)
+        try:
+            return await asyncio.gather(*coroutines)
+        finally:
+            _client.reset(token)
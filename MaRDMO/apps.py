@@ -5,6 +5,7 @@ class SensorConfig(AppConfig):
     name = 'MaRDMO'
     label = 'MaRDMO'
     verbose_name = 'MaRDMO Plugin'
+    default_auto_field = 'django.db.models.AutoField'
 
     def ready(self):
         from . import handlers
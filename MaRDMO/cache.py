@@ -0,0 +1,117 @@
+import hashlib
+import threading
+import time
+
+from collections import OrderedDict
+
+class TTLCache:
+    '''Thread-safe LRU Cache with Time-to-Live and optional Stale-While-Revalidate Refresh.
+
+       Entries younger than ttl are served directly. Entries older than ttl but
+       younger than ttl + stale are served as they are, while a background thread
+       refreshes them via the loader. Older entries are reloaded synchronously.'''
+
+    def __init__(self, ttl, maxsize, stale=0, cache_empty=True):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.stale = stale
+        self.cache_empty = cache_empty
+        self._data = OrderedDict()
+        self._lock = threading.RLock()
+        self._refreshing = set()
+
+    def get(self, key, loader=None):
+        '''Get Entry for key, use loader to (re)load missing, expired or stale Entries'''
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                value, stored = entry
+                age = now - stored
+                if age < self.ttl:
+                    self._data.move_to_end(key)
+                    return value
+                if age < self.ttl + self.stale and loader is not None:
+                    self._data.move_to_end(key)
+                    if key not in self._refreshing:
+                        self._refreshing.add(key)
+                        threading.Thread(target=self._refresh, args=(key, loader), daemon=True).start()
+                    return value
+        if loader is None:
+            return None
+        value = loader()
+        self.set(key, value)
+        return value
+
+    def set(self, key, value):
+        '''Store Entry for key and evict least recently used Entries'''
+        if not value and not self.cache_empty:
+            return
+        with self._lock:
+            self._data[key] = (value, time.monotonic())
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def invalidate(self, key=None):
+        '''Remove Entry for key or all Entries if no key is given'''
+        with self._lock:
+            if key is None:
+                self._data.clear()
+            else:
+                self._data.pop(key, None)
+
+    def invalidate_if(self, predicate):
+        '''Remove all Entries whose key satisfies predicate'''
+        with self._lock:
+            for key in [key for key in self._data if predicate(key)]:
+                del self._data[key]
+
+    def _refresh(self, key, loader):
+        try:
+            self.set(key, loader())
+        except Exception:
+            # Keep serving the stale Entry, next Request retries
+            pass
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+class PersistentCache:
+    '''Cache in a Django Cache Backend, shared by all Processes and kept across
+       Restarts if the Backend is persistent (e.g. database or file based).
+
+       Keys are hashed, so that any String is a valid Key for any Backend. All
+       Entries are dropped at once by moving to a new Generation of Keys.'''
+
+    def __init__(self, alias, prefix, ttl):
+        self.alias = alias
+        self.prefix = f'MaRDMO:{prefix}'
+        self.ttl = ttl
+
+    @property
+    def backend(self):
+        from django.core.cache import caches
+        return caches[self.alias]
+
+    def get(self, key):
+        '''Get Entry for key, None if missing or expired'''
+        return self.backend.get(self._key(key))
+
+    def set(self, key, value):
+        '''Store Entry for key for ttl seconds'''
+        self.backend.set(self._key(key), value, self.ttl)
+
+    def invalidate(self, key=None):
+        '''Remove Entry for key or all Entries if no key is given'''
+        if key is not None:
+            self.backend.delete(self._key(key))
+            return
+        try:
+            self.backend.incr(f'{self.prefix}:generation')
+        except ValueError:
+            self.backend.set(f'{self.prefix}:generation', 1, None)
+
+    def _key(self, key):
+        generation = self.backend.get_or_set(f'{self.prefix}:generation', 0, None)
+        return f'{self.prefix}:{generation}:' + hashlib.sha256(key.encode()).hexdigest()
@@ -0,0 +1,77 @@
+import threading
+import time
+
+from django.dispatch import receiver
+from django.db.models.signals import post_save, post_delete
+
+from rdmo.domain.models import Attribute
+from rdmo.options.models import Option
+
+from .config import catalog_cache_ttl
+
+class CatalogCache:
+    '''Per-process Cache of Catalog Objects (Attributes, Options) keyed by URI.
+
+       The Cache is cleared whenever an Object of the Model is saved or deleted
+       in this process, and after catalog_cache_ttl seconds to pick up changes
+       made by other processes.'''
+
+    def __init__(self, model, ttl):
+        self.model = model
+        self.ttl = ttl
+        self._objects = {}
+        self._loaded = time.monotonic()
+        self._lock = threading.Lock()
+
+    def get(self, uri):
+        '''Get Object by URI, raises model.DoesNotExist like objects.get'''
+        obj = self._fresh().get(uri)
+        if obj is None:
+            obj = self.model.objects.get(uri=uri)
+            with self._lock:
+                self._objects[uri] = obj
+        return obj
+
+    def get_many(self, uris):
+        '''Get dict URI -> Object for all existing Objects, missing Objects are fetched with one Query'''
+        objects = self._fresh()
+        found = {uri: objects[uri] for uri in uris if uri in objects}
+        missing = [uri for uri in uris if uri not in found]
+        if missing:
+            fetched = {obj.uri: obj for obj in self.model.objects.filter(uri__in=missing)}
+            with self._lock:
+                self._objects.update(fetched)
+            found.update(fetched)
+        return found
+
+    def clear(self):
+        with self._lock:
+            self._objects = {}
+            self._loaded = time.monotonic()
+
+    def _fresh(self):
+        if time.monotonic() - self._loaded > self.ttl:
+            self.clear()
+        return self._objects
+
+attributes = CatalogCache(Attribute, catalog_cache_ttl)
+options = CatalogCache(Option, catalog_cache_ttl)
+
+def getAttribute(uri):
+    '''Get Attribute by URI (cached)'''
+    return attributes.get(uri)
+
+def getOption(uri):
+    '''Get Option by URI (cached)'''
+    return options.get(uri)
+
+@receiver(post_save, sender=Attribute)
+@receiver(post_delete, sender=Attribute)
+def clearAttributes(sender, **kwargs):
+    # URIs of descendants change with their parent, drop all Attributes
+    attributes.clear()
+
+@receiver(post_save, sender=Option)
+@receiver(post_delete, sender=Option)
+def clearOptions(sender, **kwargs):
+    options.clear()
@@ -0,0 +1,132 @@
+import threading
+import time
+
+from email.utils import parsedate_to_datetime
+from http.cookiejar import DefaultCookiePolicy
+
+import requests
+
+from requests.adapters import HTTPAdapter
+
+from .config import http_connect_timeout, http_read_timeout, http_retries, http_backoff, http_max_delay, http_deadline, http_pool_hosts, http_pool_size
+
+USER_AGENT = 'MaRDMO_0.1 (https://zib.de; reidelbach@zib.de)'
+
+# Status Codes worth a Retry (rate limiting and temporary server errors)
+RETRY_STATUS = frozenset([429, 500, 502, 503, 504])
+
+IDEMPOTENT_METHODS = frozenset(['GET', 'HEAD', 'OPTIONS'])
+
+class ClientSession(requests.Session):
+    '''Session with pooled keep-alive Connections per Host and default Timeouts'''
+
+    def __init__(self):
+        super().__init__()
+        adapter = HTTPAdapter(pool_connections=http_pool_hosts, pool_maxsize=http_pool_size)
+        self.mount('https://', adapter)
+        self.mount('http://', adapter)
+        self.headers['User-Agent'] = USER_AGENT
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault('timeout', (http_connect_timeout, http_read_timeout))
+        return super().request(method, url, **kwargs)
+
+_session = None
+_sessionLock = threading.Lock()
+
+def session():
+    '''Get Session shared by all stateless Requests of the Process.
+
+       Cookies are not stored, so that no State leaks between Requests.'''
+    global _session
+    if _session is None:
+        with _sessionLock:
+            if _session is None:
+                shared = ClientSession()
+                shared.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+                _session = shared
+    return _session
+
+def newSession():
+    '''Get new Session for stateful Requests (e.g. Login), pooled and with Timeouts but without Retries'''
+    return ClientSession()
+
+def request(method, url, retries=None, idempotent=None, deadline=None, **kwargs):
+    '''Perform Request through the shared Session.
+
+       Idempotent Requests (GET, HEAD, OPTIONS or idempotent=True, e.g. SPARQL
+       queries sent via POST) are retried on connection errors, timeouts and
+       429/5xx responses with exponential Backoff, honouring Retry-After up to
+       http_max_delay. All Attempts and Waits of a Call share deadline seconds
+       (http_deadline by default): Timeouts of later Attempts are shortened to
+       the Time left and no Retry is started that would end after it.
+       Interactive Callers pass retries=0 and fail fast instead.'''
+    if retries is None:
+        retries = http_retries
+    if idempotent is None:
+        idempotent = method.upper() in IDEMPOTENT_METHODS
+    if not idempotent:
+        retries = 0
+    end = time.monotonic() + (http_deadline if deadline is None else deadline)
+    connect, read = timeouts(kwargs.pop('timeout', None))
+
+    attempt = 0
+    while True:
+        left = end - time.monotonic()
+        try:
+            response = session().request(method, url, timeout=(min(connect, left), min(read, left)), **kwargs)
+        except (requests.ConnectionError, requests.Timeout):
+            delay = retryDelay(attempt, retries, end)
+            if delay is None:
+                raise
+        else:
+            if response.status_code not in RETRY_STATUS:
+                return response
+            delay = retryDelay(attempt, retries, end, response)
+            if delay is None:
+                return response
+            response.close()
+        time.sleep(delay)
+        attempt += 1
+
+def get(url, **kwargs):
+    return request('GET', url, **kwargs)
+
+def post(url, **kwargs):
+    return request('POST', url, **kwargs)
+
+def timeouts(timeout):
+    '''Get (connect, read) Timeouts of a Request, defaults for None'''
+    if timeout is None:
+        return http_connect_timeout, http_read_timeout
+    if isinstance(timeout, (tuple, list)):
+        return timeout
+    return timeout, timeout
+
+def retryDelay(attempt, retries, end, response=None):
+    '''Get Delay before the next Attempt, None if there is none: Retries are used up,
+       Retry-After asks for more than http_max_delay or the Retry would end after the Deadline'''
+    if attempt >= retries:
+        return None
+    delay = retryAfter(response) if response is not None else None
+    if delay is None:
+        delay = min(http_backoff * 2 ** attempt, http_max_delay)
+    elif delay > http_max_delay:
+        return None
+    if time.monotonic() + delay >= end:
+        return None
+    return delay
+
+def retryAfter(response):
+    '''Get Delay in seconds requested by the Retry-After Header (seconds or HTTP date)'''
+    value = response.headers.get('Retry-After')
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
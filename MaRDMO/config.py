@@ -17,3 +17,90 @@ mathmoddb_update = 'https://sparql.mtsr2024.m1.mardi.ovh/mathalgodb/update'
 #SPARQL Prefixes
 wd = '<https://portal.mardi4nfdi.de/entity/>'
 wdt = '<https://portal.mardi4nfdi.de/prop/direct/>'
+
+#Optional Settings (overwrite in config/settings/local.py)
+try:
+    # Django only keeps UPPERCASE names, read the lowercase ones from the settings module of RDMO
+    import config.settings as rdmo_settings
+except ModuleNotFoundError as error:
+    if error.name not in ('config', 'config.settings'):
+        raise
+    # Outside of an RDMO instance (e.g. benchmarks) all defaults apply
+    rdmo_settings = None
+
+def setting(name, default):
+    '''Get optional setting from config/settings/local.py, fall back to default'''
+    return getattr(rdmo_settings, name, default)
+
+#MathModDB Class Listings (new entities pulled every mathmoddb_cache_ttl seconds, full reload every mathmoddb_cache_full seconds, IRIs probed per pull query,
+#stale listings served for further mathmoddb_cache_stale seconds while reloaded in the background, max. number of listings)
+mathmoddb_cache_ttl = setting('mathmoddb_cache_ttl', 300)
+mathmoddb_cache_full = setting('mathmoddb_cache_full', 3600)
+mathmoddb_cache_window = setting('mathmoddb_cache_window', 50)
+mathmoddb_cache_stale = setting('mathmoddb_cache_stale', 3600)
+mathmoddb_cache_size = setting('mathmoddb_cache_size', 32)
+
+#MathModDB Searches sent while a class listing is not cached yet (max. number of matches)
+mathmoddb_search_limit = setting('mathmoddb_search_limit', 100)
+
+#Attribute / Option Cache (max. age in seconds, changes in other processes are picked up afterwards)
+catalog_cache_ttl = setting('catalog_cache_ttl', 3600)
+
+#Outbound HTTP Requests (timeouts and delays in seconds, connection pools per host)
+http_connect_timeout = setting('http_connect_timeout', 5)
+http_read_timeout = setting('http_read_timeout', 30)
+http_retries = setting('http_retries', 2)
+http_backoff = setting('http_backoff', 0.5)
+http_max_delay = setting('http_max_delay', 10)
+http_deadline = setting('http_deadline', 45)
+http_pool_hosts = setting('http_pool_hosts', 16)
+http_pool_size = setting('http_pool_size', 10)
+
+#Concurrent Searches (worker threads per process, time budget of a search in seconds)
+search_workers = setting('search_workers', 8)
+search_timeout = setting('search_timeout', 5)
+search_cache_ttl = setting('search_cache_ttl', 60)
+
+#Concurrent Lookups of Exports (worker threads per process, separate from the search workers)
+export_workers = setting('export_workers', 4)
+
+#wbsearchentities Lookup Cache (TTL for results and empty results in seconds, max. number of lookups)
+entity_cache_ttl = setting('entity_cache_ttl', 3600)
+entity_cache_negative_ttl = setting('entity_cache_negative_ttl', 300)
+entity_cache_size = setting('entity_cache_size', 1024)
+
+#Model Subgraph fetched at once when a Model is selected (depth in relations, 3 covers all information shown, 0 sends separate queries instead)
+mathmoddb_subgraph_depth = setting('mathmoddb_subgraph_depth', 3)
+
+#Local Mirror of MathModDB (N-Triples file, None to read from MathModDB only; reads: mirror first or fallback if MathModDB fails; timeout of a sync in seconds)
+mathmoddb_mirror = setting('mathmoddb_mirror', None)
+mathmoddb_mirror_reads = setting('mathmoddb_mirror_reads', 'fallback')
+mathmoddb_mirror_timeout = setting('mathmoddb_mirror_timeout', 300)
+#Local Mirror of MathModDB (seconds between merging new Entities into it, None to update it by syncs only; read timeout of MathModDB in seconds while the mirror can answer instead)
+mathmoddb_mirror_interval = setting('mathmoddb_mirror_interval', 300)
+mathmoddb_mirror_budget = setting('mathmoddb_mirror_budget', 3)
+
+#Shape of MathModDB Class Queries when documenting Models (union, subselect or optional)
+mathmoddb_query_shape = setting('mathmoddb_query_shape', 'union')
+
+#Format of SPARQL SELECT Results (tsv or csv are parsed row by row while they are read, json as a whole)
+sparql_results_format = setting('sparql_results_format', 'tsv')
+
+#Batched Label / Description Lookups on the MaRDI Portal (max. number of items per SPARQL query)
+sparql_batch_size = setting('sparql_batch_size', 100)
+
+#Citation Lookups by DOI (overall time budget in seconds)
+citation_timeout = setting('citation_timeout', 30)
+
+#Publication Information Cache (alias in CACHES, TTL in seconds)
+citation_cache = setting('citation_cache', 'default')
+citation_cache_ttl = setting('citation_cache_ttl', 30 * 24 * 3600)
+
+#Background Jobs for slow Handlers (backend: sync, thread, database or dotted path of a queue class; worker threads of the thread backend; poll interval of database workers and time after which their running jobs are queued again in seconds)
+job_backend = setting('job_backend', 'thread')
+job_workers = setting('job_workers', 2)
+job_poll_interval = setting('job_poll_interval', 1)
+job_timeout = setting('job_timeout', 600)
+
+#Failed Background Jobs (kept for their status in seconds)
+job_retention = setting('job_retention', 7 * 24 * 3600)
@@ -1,16 +1,13 @@
 import re
-import requests
-import os, json
+import os
 import time
+from functools import partial
 from django.http import HttpResponse
 from django.shortcuts import render
 from django.utils.translation import gettext_lazy as _
 from django.template import Template, Context
 
 from rdmo.projects.exports import Export
-from rdmo.domain.models import Attribute
-from rdmo.options.models import Option
-from rdmo.projects.models import Value
 
 from wikibaseintegrator import wbi_login, WikibaseIntegrator
 from wikibaseintegrator.datatypes import ExternalID, Item, String, Time, MonolingualText, Quantity
@@ -19,9 +16,16 @@ from wikibaseintegrator.models import Qualifiers
 
 from .config import mardi_wiki, mardi_endpoint, mardi_api, mathmoddb_update, mathmoddb_uri, BASE_URI
 from .id import *
+from . import client, jobs
+from .search import entitySearch
+from .results import accept, rows
+from .pool import gather, exportExecutor
+from .registry import loadData
+from .catalog import getAttribute
+from .values import ValueWriter
 from .sparql import query_base, mini, mbody2, quote_sparql, res_obj_sparql, res_disc_sparql, mmsio_sparql, queryModelDocumentation
 from .handlers import Author_Search
-from .mathmoddb import ModelRetriever, queryMathModDB 
+from .mathmoddb import find_items, ModelRetriever, queryMathModDB, refreshMathModDBListings
 
 try:
     # Get login credentials if available 
@@ -48,19 +52,21 @@ class MaRDIExport(Export):
                 'error': 'Questionnaire \'{}\' not suitable for MaRDI Export!'.format(str(self.project.catalog).split('/')[-1])
                 }, status=200)
 
+### Check that no Answers are processed in the Background ########################################################################################################################################
+
+        pending = jobs.status(self.project.pk)
+        if pending['queued'] or pending['running']:
+            return render(self.request,'MaRDMO/workflowError.html', {
+                'error': '{} Answer(s) still processed in the Background, please try again in a Moment!'.format(pending['queued'] + pending['running'])
+                }, status=200)
+
 ### Load MaRDMO Options ##########################################################################################################################################################################
 
-        path = os.path.join(os.path.dirname(__file__), 'data', 'questions.json')
-        with open(path, "r") as json_file:
-            questions = json.load(json_file)
+        questions = loadData('questions')
 
-        path = os.path.join(os.path.dirname(__file__), 'data', 'mathmoddb.json')
-        with open(path, "r") as json_file:
-            mathmoddb = json.load(json_file)
+        mathmoddb = loadData('mathmoddb')
 
-        path = os.path.join(os.path.dirname(__file__), 'data', 'options.json')
-        with open(path, "r") as json_file:
-            option = json.load(json_file)
+        option = loadData('options')
 
 ### Gather all User Answers in Dictionary ########################################################################################################################################################
 
@@ -372,15 +378,19 @@ class MaRDIExport(Export):
                     query = generate_sparql_insert_with_new_ids(triple_list)
                     
                     # Add Model to MathModDB
-                    response = requests.post(mathmoddb_update, data=query, headers={
-                                            "Content-Type": "application/sparql-update",
-                                            "Accept": "text/turtle"},
-                                            auth=(mathmoddb_username, mathmoddb_password),
-                                            verify = False
+                    response = client.post(mathmoddb_update, data=query, headers={
+                                          "Content-Type": "application/sparql-update",
+                                          "Accept": "text/turtle"},
+                                          auth=(mathmoddb_username, mathmoddb_password),
+                                          verify = False
                                         )        
                     # Get MathModDB ID of newly created Entities
                     if response.status_code == 204:
 
+                        # New Entities in MathModDB, add them to cached Class Listings
+                        refreshMathModDBListings()
+
+                        writer = ValueWriter(self.project)
                         for key in ids.keys():
                             if not ids[key].startswith('https://mardi4nfdi.de/mathmoddb#'):
                                 results = queryMathModDB(queryModelDocumentation['IDCheck'].format(f"'{key}'"))
@@ -389,22 +399,23 @@ class MaRDIExport(Export):
                                     setName = ids[key][-2:]
                                     setID = ids[key][:-2]
                                     if setName == 'RF':
-                                        self.valueEditor(f'{BASE_URI}domain/ResearchFieldMathModDBID', f"{key}", f"{results[0]['ID']['value']} <|> {key}", None, None, setID)                                        
+                                        writer.add(f'{BASE_URI}domain/ResearchFieldMathModDBID', f"{key}", f"{results[0]['ID']['value']} <|> {key}", None, None, setID)                                        
                                     elif setName == 'RP':
-                                        self.valueEditor(f'{BASE_URI}domain/ResearchProblemMathModDBID', f"{key}", f"{results[0]['ID']['value']} <|> {key}", None, None, setID)
+                                        writer.add(f'{BASE_URI}domain/ResearchProblemMathModDBID', f"{key}", f"{results[0]['ID']['value']} <|> {key}", None, None, setID)
                                     elif setName == 'MM':
-                                        self.valueEditor(f'{BASE_URI}domain/MathematicalModelMathModDBID', f"{key}", f"{results[0]['ID']['value']} <|> {key}", None, None, setID)
+                                        writer.add(f'{BASE_URI}domain/MathematicalModelMathModDBID', f"{key}", f"{results[0]['ID']['value']} <|> {key}", None, None, setID)
                                     elif setName == 'MF':
-                                        self.valueEditor(f'{BASE_URI}domain/MathematicalFormulationMathModDBID', f"{key}", f"{results[0]['ID']['value']} <|> {key}", None, None, setID)
+                                        writer.add(f'{BASE_URI}domain/MathematicalFormulationMathModDBID', f"{key}", f"{results[0]['ID']['value']} <|> {key}", None, None, setID)
                                     elif setName == 'TA':
-                                        self.valueEditor(f'{BASE_URI}domain/TaskMathModDBID', f"{key}", f"{results[0]['ID']['value']} <|> {key}", None, None, setID)
+                                        writer.add(f'{BASE_URI}domain/TaskMathModDBID', f"{key}", f"{results[0]['ID']['value']} <|> {key}", None, None, setID)
                                     elif setName == 'PU':
-                                        self.valueEditor(f'{BASE_URI}domain/PublicationMathModDBID', f"{key}", f"{results[0]['ID']['value']} <|> {key}", None, None, setID)
+                                        writer.add(f'{BASE_URI}domain/PublicationMathModDBID', f"{key}", f"{results[0]['ID']['value']} <|> {key}", None, None, setID)
                                     elif setName == 'QQ':
                                         if results[0]['qC']['value'].split('#')[1] == 'Quantity':
-                                            self.valueEditor(f'{BASE_URI}domain/QuantityOrQuantityKindMathModDBID', f"{key} (Quantity)", f"{results[0]['ID']['value']} <|> {key} <|> Quantity", None, None, setID)
+                                            writer.add(f'{BASE_URI}domain/QuantityOrQuantityKindMathModDBID', f"{key} (Quantity)", f"{results[0]['ID']['value']} <|> {key} <|> Quantity", None, None, setID)
                                         elif results[0]['qC']['value'].split('#')[1] == 'QuantityKind':
-                                            self.valueEditor(f'{BASE_URI}domain/QuantityOrQuantityKindMathModDBID', f"{key} (Quantity Kind)", f"{results[0]['ID']['value']} <|> {key} <|> QuantityKind", None, None, setID)
+                                            writer.add(f'{BASE_URI}domain/QuantityOrQuantityKindMathModDBID', f"{key} (Quantity Kind)", f"{results[0]['ID']['value']} <|> {key} <|> QuantityKind", None, None, setID)
+                        writer.flush()
 
                         results = queryMathModDB(queryModelDocumentation['IDCheck'].format(f"'{answers['Models'][0]['Name']}'"))
                         if results and results[0].get('ID').get('value'):
@@ -772,14 +783,16 @@ class MaRDIExport(Export):
                     # Generate query for MathModDB KG
                     query = generate_sparql_insert_with_new_ids(triple_list)
                     
-                    response = requests.post(mathmoddb_update, data=query, headers={
-                                            "Content-Type": "application/sparql-update",
-                                            "Accept": "text/turtle"},
-                                            auth=(mathmoddb_username, mathmoddb_password),
-                                            verify = False
+                    response = client.post(mathmoddb_update, data=query, headers={
+                                          "Content-Type": "application/sparql-update",
+                                          "Accept": "text/turtle"},
+                                          auth=(mathmoddb_username, mathmoddb_password),
+                                          verify = False
                                         )
                     
                     if response.status_code == 204:
+                        # New Entities in MathModDB, add them to cached Class Listings
+                        refreshMathModDBListings()
                         return render(self.request,'MaRDMO/modelExport.html', {
                             'KGLink': mathmoddb_uri + answers['Models'][0]['MathModID'].split('#')[-1]
                             }, status=200)
@@ -882,7 +895,7 @@ class MaRDIExport(Export):
     def wikipage_export(self,title,content): 
         '''Genereic Mediawiki Example'''
 
-        S = requests.Session()
+        S = client.newSession()
 
         URL = mardi_api
 
@@ -976,12 +989,16 @@ class MaRDIExport(Export):
             
         item.write()
 
+        # New Entity, drop cached Lookups of its Label
+        entitySearch.invalidate(mardi_api, label)
+
         return item.id
 
     def get_results(self,endpoint_url, query):
         '''Perform SPARQL Queries via Get requests'''
-        req=requests.get(endpoint_url, params = {'format': 'json', 'query': query}, headers = {'User-Agent': 'MaRDMO_0.1 (https://zib.de; reidelbach@zib.de)'}).json()
-        return req["results"]["bindings"]
+        response=client.get(endpoint_url, params = {'query': query}, headers = {'User-Agent': 'MaRDMO_0.1 (https://zib.de; reidelbach@zib.de)', 'Accept': accept()}, stream = True)
+        with response:
+            return list(rows(response))
     
     def portal_wikidata_check(self,answers,public,preview,option):
         '''Function checks if an entry is on MaRDI portal and returns its QID
@@ -1022,9 +1039,7 @@ class MaRDIExport(Export):
                     # If supplement on Wikidata check if similar entity exist in MarDI KG and use or create dummy Wikidata entry
                     req = {}
                     try:
-                        req = requests.get(mardi_api+'?action=wbsearchentities&format=json&language=en&type=item&limit=10&search={0}'.format(prop[1]),
-                                           headers = {'User-Agent': 'MaRDMO_0.1 (https://zib.de; reidelbach@zib.de)'}
-                                          ).json()['search'][0]
+                        req = entitySearch.search(mardi_api, prop[1])[0]
                     except (KeyError,IndexError):
                         # KeyError: search string is empty
                         # IndexError: no result found for string
@@ -1041,9 +1056,7 @@ class MaRDIExport(Export):
                     # If supplement not on MaRDI KG or Wikidata check if Entity with standard label and description exists and use it or create it
                     req = {}
                     try:
-                        req = requests.get(mardi_api+'?action=wbsearchentities&format=json&language=en&type=item&limit=10&search={0}'.format(prop[1]),
-                                           headers = {'User-Agent': 'MaRDMO_0.1 (https://zib.de; reidelbach@zib.de)'}
-                                          ).json()['search'][0]
+                        req = entitySearch.search(mardi_api, prop[1])[0]
                     except (KeyError,IndexError):
                         # KeyError: search string is empty
                         # IndexError: no result found for string
@@ -1067,6 +1080,14 @@ class MaRDIExport(Export):
         entities = ['NonMathematicalDiscipline','Models','Software','DataSet','Method','Hardware','ExperimentalDevice','ResearchField',
                     'ResearchProblem','MathematicalModel','MathematicalFormulation','Quantity','Task','PublicationModel']
 
+        # Collect all Names and Descriptions to look up on the MaRDI Portal and resolve them concurrently
+        found = self.find_items(self.refine_candidates(answers, entities))
+
+        def find_item(Name, Description):
+            if (Name, Description) in found:
+                return found[(Name, Description)]
+            return self.find_item(Name, Description)
+
         for entity in entities:
             for key in answers[entity]:
                 # Refining IDs, Names and Descriptions of entities
@@ -1076,7 +1097,7 @@ class MaRDIExport(Export):
                         if re.match(r"mardi:Q[0-9]+", ID): 
                             answers[entity][key].update({'ID':ID, 'Name':Name, 'Description':Description})
                         else:
-                            mardiID = self.find_item(Name,Description)
+                            mardiID = find_item(Name,Description)
                             if mardiID:
                                 answers[entity][key].update({'ID':f"mardi:{mardiID}", 'Name':Name, 'Description':Description})
                             else:
@@ -1087,14 +1108,14 @@ class MaRDIExport(Export):
                             if re.match(r"mardi:Q[0-9]+", ID):
                                 answers[entity][key]['ID'].update({ikey:{'ID':ID, 'Name':Name, 'Description':Description}})
                             else:
-                                mardiID = self.find_item(Name,Description)
+                                mardiID = find_item(Name,Description)
                                 if mardiID:
                                     answers[entity][key]['ID'].update({ikey:{'ID':f"mardi:{mardiID}", 'Name':Name, 'Description':Description}})
                                 else:
                                     answers[entity][key]['ID'].update({ikey:{'ID':ID, 'Name':Name, 'Description':Description}})
                 else:
                     if answers[entity][key].get('Name') and answers[entity][key].get('Description'):
-                        mardiID = self.find_item(answers[entity][key]['Name'],answers[entity][key]['Description'])
+                        mardiID = find_item(answers[entity][key]['Name'],answers[entity][key]['Description'])
                         if mardiID:
                             answers[entity][key].update({'ID':f"mardi:{mardiID}"})
                         else:
@@ -1108,7 +1129,7 @@ class MaRDIExport(Export):
                         if re.match(r"mardi:Q[0-9]+", ID):
                             answers[entity][key]['SubProperty'].update({ikey:{'ID':ID, 'Name':Name, 'Description':Description}})
                         else:
-                            mardiID = self.find_item(Name,Description)
+                            mardiID = find_item(Name,Description)
                             if mardiID:
                                 answers[entity][key]['SubProperty'].update({ikey:{'ID':f"mardi:{mardiID}", 'Name':Name, 'Description':Description}})
                             else:
@@ -1119,7 +1140,7 @@ class MaRDIExport(Export):
                         if re.match(r"mardi:Q[0-9]+", ID):
                             answers[entity][key]['SubProperty2'].update({ikey:{'ID':ID, 'Name':Name, 'Description':Description}})
                         else:
-                            mardiID = self.find_item(Name,Description)
+                            mardiID = find_item(Name,Description)
                             if mardiID:
                                 answers[entity][key]['SubProperty2'].update({ikey:{'ID':f"mardi:{mardiID}", 'Name':Name, 'Description':Description}})
                             else:
@@ -1137,6 +1158,36 @@ class MaRDIExport(Export):
                             answers[entity].setdefault('MathModID',{}).update({ikey:{'MathModID':ID, 'Name':Name}})
         return answers
 
+    def refine_candidates(self, answers, entities):
+        '''Collect (Name, Description) Pairs of Entities refine looks up on the MaRDI Portal.'''
+        pairs = set()
+        for entity in entities:
+            for item in answers[entity].values():
+                values = []
+                if item.get('ID') and item.get('ID') != 'not in MathModDB':
+                    values += [item['ID']] if type(item['ID']) == str else list(item['ID'].values())
+                elif item.get('Name') and item.get('Description'):
+                    pairs.add((item['Name'], item['Description']))
+                for prop in ['SubProperty', 'SubProperty2']:
+                    if item.get(prop):
+                        values += list(item[prop].values())
+                for value in values:
+                    if type(value) == str and len(value.split(' <|> ')) == 3:
+                        ID, Name, Description = value.split(' <|> ')
+                        if not re.match(r"mardi:Q[0-9]+", ID):
+                            pairs.add((Name, Description))
+        return pairs
+
+    def find_items(self, pairs):
+        '''Look up (Name, Description) Pairs with batched SPARQL Queries, Pairs without exact Match or of failed Queries
+           concurrently via find_item on the Export Executor, returns dict Pair -> QID (or None if not on the Portal). Failed Lookups are left out.'''
+        found = find_items(pairs)
+        pairs = [pair for pair in pairs if pair not in found]
+        failed = object()
+        results = gather([partial(self.find_item, Name, Description) for Name, Description in pairs], timeout=None, default=failed, pool=exportExecutor)
+        found.update({pair: result for pair, result in zip(pairs, results) if result is not failed})
+        return found
+
     def Entry_Generator(self,Type,Generate,Relations,answers,option):
         '''Function queries Wikidata/MaRDI KG, uses and generates entries in MaRDI Knowledge Graph.'''
         
@@ -1269,17 +1320,9 @@ class MaRDIExport(Export):
             
     def find_item(self, label, description, api=mardi_api, language="en"):
         # Perform label-based search
-        response = requests.get(api, params={
-            'action': 'wbsearchentities',
-            'format': 'json',
-            'language': 'en',
-            'type': 'item',
-            'limit': 10,
-            'search': label
-        }, headers={'User-Agent': 'MaRDMO_0.1 (https://zib.de; reidelbach@zib.de)'})
-        data = response.json()
+        data = entitySearch.search(api, label)
         # Filter results based on description
-        matched_items = [item for item in data['search'] if item.get('description') == description] 
+        matched_items = [item for item in data if item.get('description') == description] 
         if matched_items:
             # Return the ID of the first matching item
             return matched_items[0]['id']
@@ -1291,7 +1334,7 @@ class MaRDIExport(Export):
         '''Function that retrieves individual User answers'''
         val.setdefault(uName, {})
         try:
-            values = self.project.values.filter(snapshot=None, attribute=Attribute.objects.get(uri=Id))
+            values = self.project.values.filter(snapshot=None, attribute=getAttribute(Id))
         except:
             values = []
         for value in values:
@@ -1475,60 +1518,9 @@ class MaRDIExport(Export):
 
     def valueEditor(self, uri, text=None, external_id=None, option=None, collection_index=None, set_index=None, set_prefix=None):
         
-        attribute_object = Attribute.objects.get(uri=uri)
-
-        # Prepare the defaults dictionary
-        defaults = {
-            'project': self.project,
-            'attribute': attribute_object,
-        }
-
-        if text is not None:
-            defaults['text'] = text
-
-        if external_id is not None:
-            defaults['external_id'] = external_id
-
-        if option is not None:
-            defaults['option'] = Option.objects.get(uri=option)
-
-        # Handle collection_index if provided
-        if collection_index is not None and set_index is not None and set_prefix is None:
-            obj, created = Value.objects.update_or_create(
-                project=self.project,
-                attribute=attribute_object,
-                collection_index=collection_index,
-                set_index=set_index,
-                defaults=defaults
-            )
-        elif collection_index is not None and set_index is None and set_prefix is None:
-            obj, created = Value.objects.update_or_create(
-                project=self.project,
-                attribute=attribute_object,
-                collection_index=collection_index,
-                defaults=defaults
-            )
-        elif set_index is not None and collection_index is None and set_prefix is None:
-            obj, created = Value.objects.update_or_create(
-                project=self.project,
-                attribute=attribute_object,
-                set_index=set_index,
-                defaults=defaults
-            )
-        elif set_index is not None and collection_index is None and set_prefix is not None:
-            obj, created = Value.objects.update_or_create(
-                project=self.project,
-                attribute=attribute_object,
-                set_prefix=set_prefix,
-                set_index=set_index,
-                defaults=defaults
-            )
-        else:
-            obj, created = Value.objects.update_or_create(
-                project=self.project,
-                attribute=attribute_object,
-                defaults=defaults
-            )
+        writer = ValueWriter(self.project)
+        writer.add(uri, text, external_id, option, collection_index, set_index, set_prefix)
+        writer.flush()
 
         return
 
@@ -1550,6 +1542,8 @@ def dict_to_triples(data, relations, relatants):
     
     triples = []
     ids = {} 
+
+    inversePropertyMapping = loadData('inversePropertyMapping')
     
     # Get ID Dict
     for idx, item in data.items():
@@ -1561,10 +1555,6 @@ def dict_to_triples(data, relations, relatants):
     # Go through all individuals
     for idx, item in data.items():
         
-        path = os.path.join(os.path.dirname(__file__), 'data', 'inversePropertyMapping.json')
-        with open(path, "r") as json_file:
-            inversePropertyMapping = json.load(json_file)
-
         # Get ID of Individual
         subject = ids[item['Name']]
 
@@ -1,27 +1,62 @@
-import re, os, json
-import requests
+import re
 
 from django.dispatch import receiver
 from django.db.models.signals import post_save
 
 from rdmo.projects.models import Value
-from rdmo.domain.models import Attribute
-from rdmo.options.models import Option
 
-from .citation import GetCitation
-from .mathmoddb import queryMathModDB
-from .sparql import queryPublication, queryModelHandler, wini, mini, pl_query, pl_vars, pro_query, pro_vars
+from .citation import GetCitation, citationCache, normaliseDOI
+from .mathmoddb import queryMathModDB, queryMathModDBSubgraph
+from .sparql import queryPublication, queryModelHandler, subgraph, wini, mini, pl_query, pl_vars, pro_query, pro_vars
 from .id import *
-from .config import wd, wdt, mardi_api, wikidata_api, mardi_endpoint, wikidata_endpoint, BASE_URI
+from . import client, jobs
+from .search import entitySearch
+from .results import accept, rows
+from .registry import loadData
+from .catalog import getAttribute, getOption
+from .values import ValueWriter
+from .config import wd, wdt, mardi_api, wikidata_api, mardi_endpoint, wikidata_endpoint, mathmoddb_subgraph_depth, BASE_URI
 
 from difflib import SequenceMatcher
 
+# post_save Handlers for Values, keyed by Attribute URI
+valueHandlers = {}
+
+# Handlers run as Background Jobs (slow Lookups of external Services)
+backgroundHandlers = set()
+
+def handles(uri, background=False):
+    '''Register function as post_save Handler for Values of the Attribute with uri,
+       run as Background Job if background is set'''
+    def register(handler):
+        valueHandlers[uri] = handler
+        if background:
+            backgroundHandlers.add(uri)
+        return handler
+    return register
+
 @receiver(post_save, sender=Value)
+def dispatchValue(sender, **kwargs):
+    '''Single post_save Receiver for Values, resolves the Attribute URI once
+       and calls the Handler registered for it (if any)'''
+
+    instance = kwargs.get("instance", None)
+
+    if instance is None or instance.attribute_id is None:
+        return
+
+    uri = instance.attribute.uri
+    if uri in backgroundHandlers:
+        jobs.enqueue(uri, instance)
+    elif uri in valueHandlers:
+        valueHandlers[uri](sender, **kwargs)
+
+@handles(f"{BASE_URI}domain/Published", background=True)
 def PublicationCitationRetriever(sender, **kwargs): 
 
     instance = kwargs.get("instance", None)
 
-    if instance and instance.attribute.uri == f"{BASE_URI}domain/Published":
+    if instance:
     
         # Activate (Yes)  / Deactivate (No or nothin) Publication Information Section
         if instance.option_text == 'Yes':            
@@ -37,261 +72,17 @@ def PublicationCitationRetriever(sender, **kwargs):
         
         elif re.match(r'doi:10.\d{4,9}/[-._;()/:a-z0-9A-Z]+', instance.text):
 
-            path = os.path.join(os.path.dirname(__file__), 'data', 'options.json')
-            with open(path, "r") as json_file:
-                option = json.load(json_file)
+            option = loadData('options')
             
-            # Extract DOI and Initialize different dictionaries
+            # Extract DOI
             doi = instance.text.split(':')[1]   
             
-            dict_merged = {}
-            author_dict_merged = {}
-            
-            # Define Prefix & Parameter for MaRDI KG search, Search Paper in MaRDI KG via DOI and merge results
-            mardi_prefix = f"PREFIX wdt:{wdt} PREFIX wd:{wd}"
-            mardi_query_parameter = [P16, doi.upper(), P8, P22, P4, P12, P10, P7, P9, P11, P13, P14, P15, P2, P23]
-            mardi_dicts = kg_req(mardi_endpoint, mardi_prefix + queryPublication['All'].format(*mardi_query_parameter))
-            
-            # Combine dictionaries from MaRDI Query
-            for mardi_dict in mardi_dicts:
-                for key in mardi_dict.keys():
-                    if key == 'authorInfo':
-                        if mardi_dict.get(key, {}).get('value'):
-                            authorQid, authorLabel, authorDescription, authorOrcid, authorWikidataQid, authorZBmathID = mardi_dict[key]['value'].split(' <|> ')
-                            if authorQid not in dict_merged.get('mardi_authorQid', []):
-                                dict_merged.setdefault('mardi_authorQid', []).append(authorQid)
-                                dict_merged.setdefault('mardi_authorLabel', []).append(authorLabel)
-                                dict_merged.setdefault('mardi_authorDescription', []).append(authorDescription)
-                                dict_merged.setdefault('mardi_authorOrcid', []).append(authorOrcid)
-                                dict_merged.setdefault('mardi_authorWikidataQid', []).append(authorWikidataQid)
-                                dict_merged.setdefault('mardi_authorZBmathID', []).append(authorZBmathID)
-                    elif key == 'otherAuthor':
-                        if mardi_dict.get(key, {}).get('value'):
-                            if mardi_dict[key]['value'] not in dict_merged.get('mardi_'+key, []):
-                                dict_merged.setdefault('mardi_'+key, []).append(mardi_dict[key]['value'])
-                    elif key == 'publicationLabel':
-                        dict_merged['publication'] = mardi_dict.get(key, {}).get('value')
-                        dict_merged['mardi_'+key] = mardi_dict.get(key, {}).get('value')
-                    else:
-                        dict_merged['mardi_'+key] = mardi_dict.get(key, {}).get('value')
-            
-            if not dict_merged:
-            
-                # If results not found for Paper in MaRDI KG via DOI, define Parameters for Wikidata search, search paper via DOI and merge results
-                wikidata_parameter = ['356', doi.upper(), '50', '496', '31', '1433', '407', '1476', '2093', '577', '478', '433', '304', '', '1556']
-                wikidata_dicts = kg_req(wikidata_endpoint, queryPublication['All'].format(*wikidata_parameter))
-            
-                # Combine dictionaries from Wikidata Query
-                for wikidata_dict in wikidata_dicts:
-                    for key in wikidata_dict.keys():
-                        if key == 'authorInfo':
-                            if wikidata_dict.get(key, {}).get('value'):
-                                authorQid, authorLabel, authorDescription, authorOrcid, authorWikidataQid, authorZBmathID = wikidata_dict[key]['value'].split(' <|> ')
-                                if authorQid not in dict_merged.get('wikidata_authorQid', []):
-                                    dict_merged.setdefault('wikidata_authorQid', []).append(authorQid)
-                                    dict_merged.setdefault('wikidata_authorLabel', []).append(authorLabel)
-                                    dict_merged.setdefault('wikidata_authorDescription', []).append(authorDescription)
-                                    dict_merged.setdefault('wikidata_authorOrcid', []).append(authorOrcid)
-                                    dict_merged.setdefault('wikidata_authorWikidataQid', []).append(authorWikidataQid)
-                                    dict_merged.setdefault('wikidata_authorZBmathID', []).append(authorZBmathID)
-                        elif key == 'otherAuthor':
-                            if wikidata_dict.get(key, {}).get('value'):
-                                if wikidata_dict[key]['value'] not in dict_merged.get('wikidata_'+key, []):
-                                    dict_merged.setdefault('wikidata_'+key, []).append(wikidata_dict[key]['value'])
-                        elif key == 'publicationLabel':
-                            dict_merged['publication'] = wikidata_dict.get(key, {}).get('value')
-                            dict_merged['wikidata_'+key] = wikidata_dict.get(key, {}).get('value')
-                        else:
-                            dict_merged['wikidata_'+key] = wikidata_dict.get(key, {}).get('value')
-                 
+            # Get Publication Information from Citation Cache, else gather and cache it (if Publication found)
+            paper_information = citationCache.get(normaliseDOI(doi))
+            if paper_information is None:
+                dict_merged, paper_information = PublicationInformation(doi)
                 if dict_merged:
-            
-                    # If results found for Paper in Wikidata use Wikidata QID to search MaRDI KG again
-                    mardi_parameter = [P2, dict_merged.get('wikidata_publicationQid', '')]
-                    mardi_dict = kg_req(mardi_endpoint, mardi_prefix+queryPublication['WikiCheck'].format(*mardi_parameter))
-            
-                    if mardi_dict:
-                        # If results found for Paper in MaRDI KG via Wikidata QID update results 
-                        dict_merged['mardi_publicationQid'] = mardi_dict[0].get('publicationQid', {}).get('value')
-                        dict_merged['mardi_publicationLabel'] = mardi_dict[0].get('publicationLabel', {}).get('value')
-                        dict_merged['mardi_publicationDescription1'] = mardi_dict[0].get('publicationDescription1', []).get('value')
-                else: 
-            
-                    # If no results found in MaRDI KG or Wikidata use DOI to get complete citation
-                    orcid_authors, zbmath_authors, other_authors, citation_dictionary = GetCitation(doi)
-            
-                    if citation_dictionary:
-            
-                        # If citation found, extract ORCID and zbMath IDs
-                        orcid_ids = [orcid_author[1] for orcid_author in orcid_authors]
-                        zbmath_ids = [zbmath_author[1] for zbmath_author in zbmath_authors]
-            
-                        # Search Authors related to publication 
-                        author_dict_merged = Author_Search(orcid_ids, zbmath_ids, orcid_authors, zbmath_authors)
-            
-                        # Define search objects, journal, for Wikidata API and MaRDI requests and store results 
-                        search_objects_wikidata = [[citation_dictionary.get('journal', '')]]
-                        make_api_requests(wikidata_api, search_objects_wikidata, dict_merged, 'cit_wikidata')
-                        search_objects_mardi = [[citation_dictionary.get('journal', ''), dict_merged.get('cit_wikidata_journalLabel', '')]]
-                        make_api_requests(mardi_api, search_objects_mardi, dict_merged, 'cit_mardi')
-            
-                        # Store Entrytype Data
-                        entry_type_data = {'article': {'wikidata_qid': 'Q13442814', 
-                                                       'mardi_qid': Q1, 
-                                                       'label': 'scholarly article', 
-                                                       'description': 'article in an academic publication, usually peer reviewed'},
-                                           
-                                           'publication': {'wikidata_qid': 'Q732577', 
-                                                           'mardi_qid': Q10, 
-                                                           'label': 'publication', 
-                                                           'description': 'content made available to the general public'}}
-            
-                        # Update dictionary with citation information
-                        dict_merged.update({
-                            'cit_wikidata_entrytypeQid': entry_type_data[citation_dictionary['ENTRYTYPE']]['wikidata_qid'],
-                            'cit_wikidata_entrytypeLabel': entry_type_data[citation_dictionary['ENTRYTYPE']]['label'],
-                            'cit_wikidata_entrytypeDescription1': entry_type_data[citation_dictionary['ENTRYTYPE']]['description'],
-                            'cit_mardi_entrytypeQid': entry_type_data[citation_dictionary['ENTRYTYPE']]['mardi_qid'],
-                            'cit_mardi_entrytypeLabel': entry_type_data[citation_dictionary['ENTRYTYPE']]['label'],
-                            'cit_mardi_entrytypeDescription1': entry_type_data[citation_dictionary['ENTRYTYPE']]['description'],
-                            'cit_wikidata_languageQid': citation_dictionary.get('language',['','',''])[0], 
-                            'cit_wikidata_languageLabel': citation_dictionary.get('language',['','',''])[1],
-                            'cit_wikidata_languageDescription1': citation_dictionary.get('language',['','',''])[2],
-                            'publication': citation_dictionary.get('title',''),
-                            'volume': citation_dictionary.get('volume',''),
-                            'issue': citation_dictionary.get('number',''),
-                            'page': citation_dictionary.get('pages',''),
-                            'publicationDate': citation_dictionary.get('pub_date',''),
-                            'otherAuthor': other_authors,
-                            'journal': citation_dictionary.get('journal',''),
-                            'entrytypeQid': citation_dictionary.get('ENTRYTYPE','')})
-            
-            # Gather Data for fill out and storage for later export
-            paper_information = {}
-            
-            # Store publication, entrytype, language and journal information
-            citation_properties = [['publicationQid', 'publicationLabel', 'publicationDescription1'],
-                                   ['entrytypeQid', 'entrytypeLabel', 'entrytypeDescription1'],
-                                   ['languageQid', 'languageLabel', 'languageDescription1'],
-                                   ['journalQid', 'journalLabel', 'journalDescription1']]
-            
-            for citation_property in citation_properties:
-                prefix = 'mardi_' if dict_merged.get('mardi_' + citation_property[0]) else \
-                         'wikidata_' if dict_merged.get('wikidata_' + citation_property[0]) else \
-                         'cit_mardi_' if dict_merged.get('cit_mardi_' + citation_property[0]) else \
-                         'cit_wikidata_'
-                if dict_merged.get(prefix + citation_property[0]):
-                    qid = prefix[:-1].removeprefix('cit_') + ':' + dict_merged[prefix + citation_property[0]]
-                    if citation_property[0] == 'publicationQid':
-                        paper_information[citation_property[0]] = [qid]
-                    else:
-                        paper_information[citation_property[0]] = [dict_merged[prefix + citation_property[1]]]
-                    paper_information[citation_property[0] + '_back'] = [qid + ' <|> ' + dict_merged[prefix + citation_property[1]] + ' <|> ' + dict_merged[prefix + citation_property[2]]]
-                else:
-                    default_value = 'no information available'
-                    if dict_merged.get(citation_property[0][:-3]):
-                        if citation_property[0].startswith('publication'):
-                            paper_information[citation_property[0]] = [default_value]
-                            paper_information[citation_property[0] + '_back'] = ['no id <|> ' + dict_merged[citation_property[0][:-3]] + ' <|> ' + citation_property[0][:-3]]
-                        else:
-                            paper_information[citation_property[0]] = [dict_merged[citation_property[0][:-3]]]
-                            paper_information[citation_property[0] + '_back'] = ['no id <|> ' + dict_merged[citation_property[0][:-3]] + ' <|> ' + citation_property[0][:-3]]
-                    else:
-                        paper_information[citation_property[0]] = [default_value]
-                        paper_information[citation_property[0] + '_back'] = ['NONE']        
-            
-            # Store Author Information
-            paper_information['author_label'] = []
-            paper_information['author_label_back'] = []
-            
-            if 'mardi_authorQid' in dict_merged or 'mardi_otherAuthor' in dict_merged:
-            
-                # Store MaRDI Author QID /Label
-                try:
-                    for qid, label in zip(dict_merged['mardi_authorQid'], dict_merged['mardi_authorLabel']):
-                    
-                        if qid:
-                            paper_information['author_label'].append(label+' (mardi:'+qid+')')
-                        else:
-                            paper_information['author_label'].append(label)
-                    
-                        paper_information['author_label_back'].append(['mardi:'+qid])
-                except KeyError:
-                    pass
-                if dict_merged.get('mardi_otherAuthor', ''): 
-                    paper_information['author_label'].extend(dict_merged['mardi_otherAuthor'])
-            
-            elif 'wikidata_authorQid' in dict_merged or 'wikidata_otherAuthor' in dict_merged:
-            
-                # Store Wikidata Author QID / Label
-                try:
-                    for qid, label in zip(dict_merged['wikidata_authorQid'], dict_merged['wikidata_authorLabel']):
-                        
-                        if qid:
-                            paper_information['author_label'].append(label+' (wikidata:'+qid+')')
-                        else:
-                            paper_information['author_label'].append(label)
-
-                        paper_information['author_label_back'].append(['wikidata:'+qid])
-                except KeyError:
-                    pass
-                if dict_merged.get('wikidata_otherAuthor', ''):
-                    paper_information['author_label'].extend(dict_merged['wikidata_otherAuthor'])
-            
-            elif author_dict_merged:
-            
-                # Store Publication Authors from Citation via ORCID and zbMath
-                for author in author_dict_merged.keys():
-                    if author_dict_merged[author]['mardiQID']:
-                        paper_information['author_label'].append(author_dict_merged[author]['mardiLabel'] + ' (mardi:' + author_dict_merged[author]['mardiQID'] + ')')
-                        paper_information['author_label_back'].append('mardi:' + author_dict_merged[author]['mardiQID'])
-                    elif author_dict_merged[author]['wikiQID']:
-                        paper_information['author_label'].append(author_dict_merged[author]['wikiLabel'] + ' (wikidata:' + author_dict_merged[author]['wikiQID'] + ')')
-                        paper_information['author_label_back'].append('wikidata:' + author_dict_merged[author]['wikiQID'] +
-                                                                          ' <|> ' + author_dict_merged[author]['wikiLabel'] +
-                                                                          ' <|> ' + author_dict_merged[author]['wikiDescription'])
-                    elif author_dict_merged[author]['orcid']:
-                        if author_dict_merged[author]['zbmath']:
-                            paper_information['author_label'].append(author+' (orcid:'+author_dict_merged[author]['orcid']+', zbmath:'+author_dict_merged[author]['zbmath']+')')
-                            paper_information['author_label_back'].append('orcid:'+author_dict_merged[author]['orcid']+'; zbmath:'+author_dict_merged[author]['zbmath']+' <|> '+author+' <|> researcher (ORCID '+author_dict_merged[author]['orcid']+')')
-                        else:
-                            paper_information['author_label'].append(author+' (orcid:'+author_dict_merged[author]['orcid']+')')
-                            paper_information['author_label_back'].append('orcid:'+author_dict_merged[author]['orcid']+' <|> '+author+' <|> researcher (ORCID '+author_dict_merged[author]['orcid']+')')
-                    elif author_dict_merged[author]['zbmath']:
-                        paper_information['author_label'].append(author+' (zbmath:'+author_dict_merged[author]['zbmath']+')')
-                        paper_information['author_label_back'].append('zbmath:'+author_dict_merged[author]['zbmath']+' <|> '+author+' <|> researcher (zbMath '+author_dict_merged[author]['zbmath']+')')
-                
-                if dict_merged.get('otherAuthor', ''):
-                    paper_information['author_label'].extend(dict_merged['otherAuthor'])
-            
-            else:
-            
-                if dict_merged.get('otherAuthor', ''):
-                    paper_information['author_label'].extend(dict_merged['otherAuthor'])
-                    paper_information['author_label_back'].append('')
-                else:
-                    paper_information['author_label'].append('no information available')
-                    paper_information['author_label_back'].append('')
-            
-            # Store publication volume, issue, page and publication date
-            citation_properties = ['volume', 'issue', 'page', 'publicationDate', 'publication']
-            for citation_property in citation_properties:
-                if dict_merged.get('mardi_'+citation_property):
-                    # Store MaRDI Property
-                    paper_information[citation_property] = [dict_merged['mardi_'+citation_property]]
-                    paper_information[citation_property+'_back'] = [dict_merged['mardi_'+citation_property]]
-                elif dict_merged.get('wikidata_'+citation_property):
-                    # Store Wikidata Property
-                    paper_information[citation_property] = [dict_merged['wikidata_'+citation_property]]
-                    paper_information[citation_property+'_back'] = [dict_merged['wikidata_'+citation_property]]
-                elif dict_merged.get(citation_property):
-                    # Store Citation Property
-                    paper_information[citation_property] = [dict_merged[citation_property]]
-                    paper_information[citation_property+'_back'] = [dict_merged[citation_property]]
-                else:
-                    # No Publication Volume available
-                    paper_information[citation_property] = ['no information available']
-                    paper_information[citation_property+'_back'] = ['NONE']
+                    citationCache.set(normaliseDOI(doi), paper_information)
             
             # Append paper information to question ids 
             paper_infos = [paper_information['publicationQid'], paper_information['publicationQid_back'],
@@ -316,36 +107,289 @@ def PublicationCitationRetriever(sender, **kwargs):
                            f'{BASE_URI}domain/PublicationPage', f'{BASE_URI}domain/PublicationPage_hidden',
                            f'{BASE_URI}domain/PublicationDate', f'{BASE_URI}domain/PublicationDate_hidden']
             
+            writer = ValueWriter(instance.project)
             for paper_info, object_uri in zip(paper_infos, object_uris):
                 if object_uri == f'{BASE_URI}domain/PublicationLanguage':
                     for idx,val in enumerate(paper_info):
                         if option.get(val) is not None:
-                            valueEditor(instance, object_uri, None, None, Option.objects.get(uri=option.get(val)))
+                            writer.add(object_uri, None, None, option.get(val))
                 else:
                     for idx,val in enumerate(paper_info):
-                        valueEditor(instance, object_uri, val, None, None, idx)
+                        writer.add(object_uri, val, None, None, idx)
+            writer.flush()
 
             return
 
-@receiver(post_save, sender=Value)
+def PublicationInformation(doi):
+    '''Function gathers Information on the Publication with doi from MaRDI KG, Wikidata or its Citation,
+       returns merged Results and Information to fill out the Publication Section.'''
+
+    dict_merged = {}
+    author_dict_merged = {}
+    
+    # Define Prefix & Parameter for MaRDI KG search, Search Paper in MaRDI KG via DOI and merge results
+    mardi_prefix = f"PREFIX wdt:{wdt} PREFIX wd:{wd}"
+    mardi_query_parameter = [P16, doi.upper(), P8, P22, P4, P12, P10, P7, P9, P11, P13, P14, P15, P2, P23]
+    mardi_dicts = kg_req(mardi_endpoint, mardi_prefix + queryPublication['All'].format(*mardi_query_parameter))
+    
+    # Combine dictionaries from MaRDI Query
+    for mardi_dict in mardi_dicts:
+        for key in mardi_dict.keys():
+            if key == 'authorInfo':
+                if mardi_dict.get(key, {}).get('value'):
+                    authorQid, authorLabel, authorDescription, authorOrcid, authorWikidataQid, authorZBmathID = mardi_dict[key]['value'].split(' <|> ')
+                    if authorQid not in dict_merged.get('mardi_authorQid', []):
+                        dict_merged.setdefault('mardi_authorQid', []).append(authorQid)
+                        dict_merged.setdefault('mardi_authorLabel', []).append(authorLabel)
+                        dict_merged.setdefault('mardi_authorDescription', []).append(authorDescription)
+                        dict_merged.setdefault('mardi_authorOrcid', []).append(authorOrcid)
+                        dict_merged.setdefault('mardi_authorWikidataQid', []).append(authorWikidataQid)
+                        dict_merged.setdefault('mardi_authorZBmathID', []).append(authorZBmathID)
+            elif key == 'otherAuthor':
+                if mardi_dict.get(key, {}).get('value'):
+                    if mardi_dict[key]['value'] not in dict_merged.get('mardi_'+key, []):
+                        dict_merged.setdefault('mardi_'+key, []).append(mardi_dict[key]['value'])
+            elif key == 'publicationLabel':
+                dict_merged['publication'] = mardi_dict.get(key, {}).get('value')
+                dict_merged['mardi_'+key] = mardi_dict.get(key, {}).get('value')
+            else:
+                dict_merged['mardi_'+key] = mardi_dict.get(key, {}).get('value')
+    
+    if not dict_merged:
+    
+        # If results not found for Paper in MaRDI KG via DOI, define Parameters for Wikidata search, search paper via DOI and merge results
+        wikidata_parameter = ['356', doi.upper(), '50', '496', '31', '1433', '407', '1476', '2093', '577', '478', '433', '304', '', '1556']
+        wikidata_dicts = kg_req(wikidata_endpoint, queryPublication['All'].format(*wikidata_parameter))
+    
+        # Combine dictionaries from Wikidata Query
+        for wikidata_dict in wikidata_dicts:
+            for key in wikidata_dict.keys():
+                if key == 'authorInfo':
+                    if wikidata_dict.get(key, {}).get('value'):
+                        authorQid, authorLabel, authorDescription, authorOrcid, authorWikidataQid, authorZBmathID = wikidata_dict[key]['value'].split(' <|> ')
+                        if authorQid not in dict_merged.get('wikidata_authorQid', []):
+                            dict_merged.setdefault('wikidata_authorQid', []).append(authorQid)
+                            dict_merged.setdefault('wikidata_authorLabel', []).append(authorLabel)
+                            dict_merged.setdefault('wikidata_authorDescription', []).append(authorDescription)
+                            dict_merged.setdefault('wikidata_authorOrcid', []).append(authorOrcid)
+                            dict_merged.setdefault('wikidata_authorWikidataQid', []).append(authorWikidataQid)
+                            dict_merged.setdefault('wikidata_authorZBmathID', []).append(authorZBmathID)
+                elif key == 'otherAuthor':
+                    if wikidata_dict.get(key, {}).get('value'):
+                        if wikidata_dict[key]['value'] not in dict_merged.get('wikidata_'+key, []):
+                            dict_merged.setdefault('wikidata_'+key, []).append(wikidata_dict[key]['value'])
+                elif key == 'publicationLabel':
+                    dict_merged['publication'] = wikidata_dict.get(key, {}).get('value')
+                    dict_merged['wikidata_'+key] = wikidata_dict.get(key, {}).get('value')
+                else:
+                    dict_merged['wikidata_'+key] = wikidata_dict.get(key, {}).get('value')
+         
+        if dict_merged:
+    
+            # If results found for Paper in Wikidata use Wikidata QID to search MaRDI KG again
+            mardi_parameter = [P2, dict_merged.get('wikidata_publicationQid', '')]
+            mardi_dict = kg_req(mardi_endpoint, mardi_prefix+queryPublication['WikiCheck'].format(*mardi_parameter))
+    
+            if mardi_dict:
+                # If results found for Paper in MaRDI KG via Wikidata QID update results 
+                dict_merged['mardi_publicationQid'] = mardi_dict[0].get('publicationQid', {}).get('value')
+                dict_merged['mardi_publicationLabel'] = mardi_dict[0].get('publicationLabel', {}).get('value')
+                dict_merged['mardi_publicationDescription1'] = mardi_dict[0].get('publicationDescription1', []).get('value')
+        else: 
+    
+            # If no results found in MaRDI KG or Wikidata use DOI to get complete citation
+            orcid_authors, zbmath_authors, other_authors, citation_dictionary = GetCitation(doi)
+    
+            if citation_dictionary:
+    
+                # If citation found, extract ORCID and zbMath IDs
+                orcid_ids = [orcid_author[1] for orcid_author in orcid_authors]
+                zbmath_ids = [zbmath_author[1] for zbmath_author in zbmath_authors]
+    
+                # Search Authors related to publication 
+                author_dict_merged = Author_Search(orcid_ids, zbmath_ids, orcid_authors, zbmath_authors)
+    
+                # Define search objects, journal, for Wikidata API and MaRDI requests and store results 
+                search_objects_wikidata = [[citation_dictionary.get('journal', '')]]
+                make_api_requests(wikidata_api, search_objects_wikidata, dict_merged, 'cit_wikidata')
+                search_objects_mardi = [[citation_dictionary.get('journal', ''), dict_merged.get('cit_wikidata_journalLabel', '')]]
+                make_api_requests(mardi_api, search_objects_mardi, dict_merged, 'cit_mardi')
+    
+                # Store Entrytype Data
+                entry_type_data = {'article': {'wikidata_qid': 'Q13442814', 
+                                               'mardi_qid': Q1, 
+                                               'label': 'scholarly article', 
+                                               'description': 'article in an academic publication, usually peer reviewed'},
+                                   
+                                   'publication': {'wikidata_qid': 'Q732577', 
+                                                   'mardi_qid': Q10, 
+                                                   'label': 'publication', 
+                                                   'description': 'content made available to the general public'}}
+    
+                # Update dictionary with citation information
+                dict_merged.update({
+                    'cit_wikidata_entrytypeQid': entry_type_data[citation_dictionary['ENTRYTYPE']]['wikidata_qid'],
+                    'cit_wikidata_entrytypeLabel': entry_type_data[citation_dictionary['ENTRYTYPE']]['label'],
+                    'cit_wikidata_entrytypeDescription1': entry_type_data[citation_dictionary['ENTRYTYPE']]['description'],
+                    'cit_mardi_entrytypeQid': entry_type_data[citation_dictionary['ENTRYTYPE']]['mardi_qid'],
+                    'cit_mardi_entrytypeLabel': entry_type_data[citation_dictionary['ENTRYTYPE']]['label'],
+                    'cit_mardi_entrytypeDescription1': entry_type_data[citation_dictionary['ENTRYTYPE']]['description'],
+                    'cit_wikidata_languageQid': citation_dictionary.get('language',['','',''])[0], 
+                    'cit_wikidata_languageLabel': citation_dictionary.get('language',['','',''])[1],
+                    'cit_wikidata_languageDescription1': citation_dictionary.get('language',['','',''])[2],
+                    'publication': citation_dictionary.get('title',''),
+                    'volume': citation_dictionary.get('volume',''),
+                    'issue': citation_dictionary.get('number',''),
+                    'page': citation_dictionary.get('pages',''),
+                    'publicationDate': citation_dictionary.get('pub_date',''),
+                    'otherAuthor': other_authors,
+                    'journal': citation_dictionary.get('journal',''),
+                    'entrytypeQid': citation_dictionary.get('ENTRYTYPE','')})
+    
+    # Gather Data for fill out and storage for later export
+    paper_information = {}
+    
+    # Store publication, entrytype, language and journal information
+    citation_properties = [['publicationQid', 'publicationLabel', 'publicationDescription1'],
+                           ['entrytypeQid', 'entrytypeLabel', 'entrytypeDescription1'],
+                           ['languageQid', 'languageLabel', 'languageDescription1'],
+                           ['journalQid', 'journalLabel', 'journalDescription1']]
+    
+    for citation_property in citation_properties:
+        prefix = 'mardi_' if dict_merged.get('mardi_' + citation_property[0]) else \
+                 'wikidata_' if dict_merged.get('wikidata_' + citation_property[0]) else \
+                 'cit_mardi_' if dict_merged.get('cit_mardi_' + citation_property[0]) else \
+                 'cit_wikidata_'
+        if dict_merged.get(prefix + citation_property[0]):
+            qid = prefix[:-1].removeprefix('cit_') + ':' + dict_merged[prefix + citation_property[0]]
+            if citation_property[0] == 'publicationQid':
+                paper_information[citation_property[0]] = [qid]
+            else:
+                paper_information[citation_property[0]] = [dict_merged[prefix + citation_property[1]]]
+            paper_information[citation_property[0] + '_back'] = [qid + ' <|> ' + dict_merged[prefix + citation_property[1]] + ' <|> ' + dict_merged[prefix + citation_property[2]]]
+        else:
+            default_value = 'no information available'
+            if dict_merged.get(citation_property[0][:-3]):
+                if citation_property[0].startswith('publication'):
+                    paper_information[citation_property[0]] = [default_value]
+                    paper_information[citation_property[0] + '_back'] = ['no id <|> ' + dict_merged[citation_property[0][:-3]] + ' <|> ' + citation_property[0][:-3]]
+                else:
+                    paper_information[citation_property[0]] = [dict_merged[citation_property[0][:-3]]]
+                    paper_information[citation_property[0] + '_back'] = ['no id <|> ' + dict_merged[citation_property[0][:-3]] + ' <|> ' + citation_property[0][:-3]]
+            else:
+                paper_information[citation_property[0]] = [default_value]
+                paper_information[citation_property[0] + '_back'] = ['NONE']        
+    
+    # Store Author Information
+    paper_information['author_label'] = []
+    paper_information['author_label_back'] = []
+    
+    if 'mardi_authorQid' in dict_merged or 'mardi_otherAuthor' in dict_merged:
+    
+        # Store MaRDI Author QID /Label
+        try:
+            for qid, label in zip(dict_merged['mardi_authorQid'], dict_merged['mardi_authorLabel']):
+            
+                if qid:
+                    paper_information['author_label'].append(label+' (mardi:'+qid+')')
+                else:
+                    paper_information['author_label'].append(label)
+            
+                paper_information['author_label_back'].append(['mardi:'+qid])
+        except KeyError:
+            pass
+        if dict_merged.get('mardi_otherAuthor', ''): 
+            paper_information['author_label'].extend(dict_merged['mardi_otherAuthor'])
+    
+    elif 'wikidata_authorQid' in dict_merged or 'wikidata_otherAuthor' in dict_merged:
+    
+        # Store Wikidata Author QID / Label
+        try:
+            for qid, label in zip(dict_merged['wikidata_authorQid'], dict_merged['wikidata_authorLabel']):
+                
+                if qid:
+                    paper_information['author_label'].append(label+' (wikidata:'+qid+')')
+                else:
+                    paper_information['author_label'].append(label)
+
+                paper_information['author_label_back'].append(['wikidata:'+qid])
+        except KeyError:
+            pass
+        if dict_merged.get('wikidata_otherAuthor', ''):
+            paper_information['author_label'].extend(dict_merged['wikidata_otherAuthor'])
+    
+    elif author_dict_merged:
+    
+        # Store Publication Authors from Citation via ORCID and zbMath
+        for author in author_dict_merged.keys():
+            if author_dict_merged[author]['mardiQID']:
+                paper_information['author_label'].append(author_dict_merged[author]['mardiLabel'] + ' (mardi:' + author_dict_merged[author]['mardiQID'] + ')')
+                paper_information['author_label_back'].append('mardi:' + author_dict_merged[author]['mardiQID'])
+            elif author_dict_merged[author]['wikiQID']:
+                paper_information['author_label'].append(author_dict_merged[author]['wikiLabel'] + ' (wikidata:' + author_dict_merged[author]['wikiQID'] + ')')
+                paper_information['author_label_back'].append('wikidata:' + author_dict_merged[author]['wikiQID'] +
+                                                                  ' <|> ' + author_dict_merged[author]['wikiLabel'] +
+                                                                  ' <|> ' + author_dict_merged[author]['wikiDescription'])
+            elif author_dict_merged[author]['orcid']:
+                if author_dict_merged[author]['zbmath']:
+                    paper_information['author_label'].append(author+' (orcid:'+author_dict_merged[author]['orcid']+', zbmath:'+author_dict_merged[author]['zbmath']+')')
+                    paper_information['author_label_back'].append('orcid:'+author_dict_merged[author]['orcid']+'; zbmath:'+author_dict_merged[author]['zbmath']+' <|> '+author+' <|> researcher (ORCID '+author_dict_merged[author]['orcid']+')')
+                else:
+                    paper_information['author_label'].append(author+' (orcid:'+author_dict_merged[author]['orcid']+')')
+                    paper_information['author_label_back'].append('orcid:'+author_dict_merged[author]['orcid']+' <|> '+author+' <|> researcher (ORCID '+author_dict_merged[author]['orcid']+')')
+            elif author_dict_merged[author]['zbmath']:
+                paper_information['author_label'].append(author+' (zbmath:'+author_dict_merged[author]['zbmath']+')')
+                paper_information['author_label_back'].append('zbmath:'+author_dict_merged[author]['zbmath']+' <|> '+author+' <|> researcher (zbMath '+author_dict_merged[author]['zbmath']+')')
+        
+        if dict_merged.get('otherAuthor', ''):
+            paper_information['author_label'].extend(dict_merged['otherAuthor'])
+    
+    else:
+    
+        if dict_merged.get('otherAuthor', ''):
+            paper_information['author_label'].extend(dict_merged['otherAuthor'])
+            paper_information['author_label_back'].append('')
+        else:
+            paper_information['author_label'].append('no information available')
+            paper_information['author_label_back'].append('')
+    
+    # Store publication volume, issue, page and publication date
+    citation_properties = ['volume', 'issue', 'page', 'publicationDate', 'publication']
+    for citation_property in citation_properties:
+        if dict_merged.get('mardi_'+citation_property):
+            # Store MaRDI Property
+            paper_information[citation_property] = [dict_merged['mardi_'+citation_property]]
+            paper_information[citation_property+'_back'] = [dict_merged['mardi_'+citation_property]]
+        elif dict_merged.get('wikidata_'+citation_property):
+            # Store Wikidata Property
+            paper_information[citation_property] = [dict_merged['wikidata_'+citation_property]]
+            paper_information[citation_property+'_back'] = [dict_merged['wikidata_'+citation_property]]
+        elif dict_merged.get(citation_property):
+            # Store Citation Property
+            paper_information[citation_property] = [dict_merged[citation_property]]
+            paper_information[citation_property+'_back'] = [dict_merged[citation_property]]
+        else:
+            # No Publication Volume available
+            paper_information[citation_property] = ['no information available']
+            paper_information[citation_property+'_back'] = ['NONE']
+
+    return dict_merged, paper_information
+
+@handles(f'{BASE_URI}domain/DocumentationType')
 def WorkflowOrModel(sender, **kwargs):
 
     instance = kwargs.get("instance", None)
 
-    if instance and instance.attribute.uri == f'{BASE_URI}domain/DocumentationType':
+    if instance:
     
-        path = os.path.join(os.path.dirname(__file__), 'data', 'modus.json')
-        with open(path, "r") as json_file:
-            OperationModus = json.load(json_file)
+        OperationModus = loadData('modus')
 
-        path = os.path.join(os.path.dirname(__file__), 'data', 'options.json')
-        with open(path, "r") as json_file:
-            option = json.load(json_file)
+        option = loadData('options')
 
-        if instance.option == Option.objects.get(uri=option['Workflow']):
+        if instance.option == getOption(option['Workflow']):
             # Activate Questions for Workflow Documentation
             val = [0,0,0,0,0]
-        elif instance.option == Option.objects.get(uri=option['Model']):
+        elif instance.option == getOption(option['Model']):
             # Activate Questions for Model Documentation
             val = [1,0,0,0,1]
         else:
@@ -357,22 +401,18 @@ def WorkflowOrModel(sender, **kwargs):
                 valueEditor(instance,uri,val[idx])
     return
 
-@receiver(post_save, sender=Value)
+@handles(f'{BASE_URI}domain/OperationType')
 def SearchOrDocument(sender, **kwargs):
     
     instance = kwargs.get("instance", None)
     
-    if instance and instance.attribute.uri == f'{BASE_URI}domain/OperationType':
+    if instance:
         
-        path = os.path.join(os.path.dirname(__file__), 'data', 'modus.json')
-        with open(path, "r") as json_file:
-            OperationModus = json.load(json_file)
+        OperationModus = loadData('modus')
 
-        path = os.path.join(os.path.dirname(__file__), 'data', 'options.json')
-        with open(path, "r") as json_file:
-            option = json.load(json_file)
+        option = loadData('options')
 
-        if instance.option == Option.objects.get(uri=option['Search']):
+        if instance.option == getOption(option['Search']):
             # Activate Questions for Search
             val = [1,0,1,0]
         else:
@@ -384,25 +424,21 @@ def SearchOrDocument(sender, **kwargs):
                 valueEditor(instance,uri,val[idx])
     return
 
-@receiver(post_save, sender=Value)
+@handles(f'{BASE_URI}domain/WorkflowType')
 def ComputationalOrExperimental(sender, **kwargs):
 
     instance = kwargs.get("instance", None)
     
-    if instance and instance.attribute.uri == f'{BASE_URI}domain/WorkflowType':
+    if instance:
 
-        path = os.path.join(os.path.dirname(__file__), 'data', 'modus.json')
-        with open(path, "r") as json_file:
-            OperationModus = json.load(json_file)
+        OperationModus = loadData('modus')
 
-        path = os.path.join(os.path.dirname(__file__), 'data', 'options.json')
-        with open(path, "r") as json_file:
-            option = json.load(json_file)
+        option = loadData('options')
 
-        if instance.option == Option.objects.get(uri=option['Analysis']):
+        if instance.option == getOption(option['Analysis']):
             # Activate Questions for Experimental Workflow
             val = [1,0,1]
-        elif instance.option == Option.objects.get(uri=option['Computation']):
+        elif instance.option == getOption(option['Computation']):
             # Activate Questions for Computational Workflow
             val = [1,1,0]
         else:
@@ -414,24 +450,130 @@ def ComputationalOrExperimental(sender, **kwargs):
                 valueEditor(instance,uri,val[idx])
     return
 
-@receiver(post_save, sender=Value)
+# Relations walked in the Model Subgraph, keyed as in the queryModelHandler Results
+modelGraphRelations = {'ta': 'appliedByTask', 'gbmm': 'generalizedByModel', 'gmm': 'generalizesModel',
+                       'abmm': 'approximatedByModel', 'amm': 'approximatesModel', 'dbmm': 'discretizedByModel',
+                       'dmm': 'discretizesModel', 'lbmm': 'linearizedByModel', 'lmm': 'linearizesModel',
+                       'cimm': 'containedInModel', 'cmm': 'containsModel', 'smm': 'similarToModel'}
+
+formulationGraphRelations = {'fmf': 'containsFormulation', 'amf': 'containsAssumption', 'bcmf': 'containsBoundaryCondition',
+                             'ccmf': 'containsConstraintCondition', 'cpcmf': 'containsCouplingCondition',
+                             'icmf': 'containsInitialCondition', 'fcmf': 'containsFinalCondition'}
+
+formulationGraphRelations1 = {'F': 'containsFormulation', 'FD': 'containedAsFormulationIn', 'A': 'containsAssumption',
+                              'AD': 'containedAsAssumptionIn', 'BC': 'containsBoundaryCondition', 'BCD': 'containedAsBoundaryConditionIn',
+                              'CC': 'containsConstraintCondition', 'CCD': 'containedAsConstraintConditionIn',
+                              'CPC': 'containsCouplingCondition', 'CPCD': 'containedAsCouplingConditionIn',
+                              'IC': 'containsInitialCondition', 'ICD': 'containedAsInitialConditionIn',
+                              'FC': 'containsFinalCondition', 'FCD': 'containedAsFinalConditionIn'}
+
+formulationGraphRelations2 = {'FGBF': 'generalizedByFormulation', 'FGF': 'generalizesFormulation', 'FABF': 'approximatedByFormulation',
+                              'FAF': 'approximatesFormulation', 'FDBF': 'discretizedByFormulation', 'FDF': 'discretizesFormulation',
+                              'FLBF': 'linearizedByFormulation', 'FLF': 'linearizesFormulation', 'FNBF': 'nondimensionalizedByFormulation',
+                              'FNF': 'nondimensionalizesFormulation', 'FSF': 'similarToFormulation'}
+
+taskGraphRelations = {'TGBT': 'generalizedByTask', 'TGT': 'generalizesTask', 'TABT': 'approximatedByTask', 'TAT': 'approximatesTask',
+                      'TDBT': 'discretizedByTask', 'TDT': 'discretizesTask', 'TICT': 'containedInTask', 'TCT': 'containsTask',
+                      'TLBT': 'linearizedByTask', 'TLT': 'linearizesTask', 'TST': 'similarToTask'}
+
+publicationGraphRelations = {'1': 'documentedIn', '2': 'inventedIn', '3': 'studiedIn', '4': 'surveyedIn', '5': 'usedIn'}
+
+publicationGraphClasses = ['ResearchField', 'ResearchProblem', 'MathematicalModel', 'MathematicalFormulation', 'Quantity', 'QuantityKind', 'ComputationalTask']
+
+def bindings(**values):
+    '''SPARQL Result Row of values'''
+    return {key: {'value': value} for key, value in values.items()}
+
+def concatenated(graph, subject, relations, classes=None):
+    '''SPARQL Result Row of Entities related to subject, concatenated per Relation as by GROUP_CONCAT'''
+    row = {}
+    for key, prop in relations.items():
+        pairs = graph.related(subject, prop, classes)
+        if pairs:
+            row.update(bindings(**{key: ' <|> '.join(Id for Id, _ in pairs), f'{key}L': ' <|> '.join(Label for _, Label in pairs)}))
+    return row
+
+def modelGraphResults(graph, IdMM):
+    '''Results of queryModelHandler['All'] from Model Subgraph, one Row per Statement instead of their Cartesian Product'''
+    mmLabel = graph.label(IdMM)
+    if mmLabel is None:
+        return []
+    results = [bindings(mm=IdMM, mml=mmLabel)]
+    for key, prop in modelGraphRelations.items():
+        results.extend(bindings(**{key: Id, f'{key}l': Label}) for Id, Label in graph.related(IdMM, prop))
+    for key, prop in formulationGraphRelations.items():
+        for mfId, mfLabel in graph.related(IdMM, prop):
+            results.append(bindings(**{key: mfId, f'{key}l': mfLabel}))
+            for qId, qLabel in graph.related(mfId, 'containsQuantity', ['Quantity', 'QuantityKind']):
+                for qClass in graph.types(qId):
+                    if qClass.split('#')[-1] in ['Quantity', 'QuantityKind']:
+                        results.append(bindings(**{f'{key}q': qId, f'{key}ql': qLabel, f'{key}qc': qClass}))
+    for rpId, rpLabel in graph.related(IdMM, 'models'):
+        results.append(bindings(rp=rpId, rpl=rpLabel))
+        results.extend(bindings(rf=rfId, rfl=rfLabel) for rfId, rfLabel in graph.related(rpId, 'containedInField'))
+    return results
+
+def formulationGraphResults(graph, IdsMF):
+    '''Results of queryModelHandler['MFRelations'] from Model Subgraph'''
+    results = []
+    for Id in IdsMF:
+        row = bindings(mf=Id)
+        row.update(concatenated(graph, Id, formulationGraphRelations1, ['MathematicalFormulation']))
+        row.update(concatenated(graph, Id, formulationGraphRelations2))
+        results.append(row)
+    return results
+
+def taskGraphResults(graph, IdsT):
+    '''Results of queryModelHandler['TRelation'] from Model Subgraph'''
+    results = []
+    for Id in IdsT:
+        row = bindings(t=Id)
+        row.update(concatenated(graph, Id, taskGraphRelations))
+        results.append(row)
+    return results
+
+def publicationGraphResults(graph, Ids):
+    '''Results of queryModelHandler['PRelation'] from Model Subgraph'''
+    results = []
+    for Id in dict.fromkeys(Ids):
+        label = graph.label(Id)
+        if label is None:
+            continue
+        for Class in graph.types(Id):
+            if Class.split('#')[-1] in publicationGraphClasses:
+                row = bindings(item=Id, label=label, **{'class': Class})
+                for no, prop in publicationGraphRelations.items():
+                    pairs = graph.related(Id, prop)
+                    row.update(bindings(**{f'PU{no}': ' <|> '.join(puId for puId, _ in pairs), f'LABEL{no}': ' <|> '.join(puLabel for _, puLabel in pairs)}))
+                results.append(row)
+    return results
+
+@handles(f'{BASE_URI}domain/MainMathematicalModelMathModDBID', background=True)
 def ModelHandler(sender, **kwargs):
     
     instance = kwargs.get("instance", None)
     
-    if instance and instance.attribute.uri == f'{BASE_URI}domain/MainMathematicalModelMathModDBID':
+    if instance:
 
         if instance.external_id and instance.external_id != 'not in MathModDB':        
             IdMM, _ = instance.external_id.split(' <|> ')
         else:
             return
 
-        path = os.path.join(os.path.dirname(__file__), 'data', 'mathmoddb.json')
-        with open(path, "r") as json_file:
-            mathmoddb = json.load(json_file)
+        mathmoddb = loadData('mathmoddb')
+
+        # Collect Values and write them at once
+        writer = ValueWriter(instance.project)
 
         # Get Model, Research Field, Research Problem, Quantity, Mathematical Formulation and Task Information        
-        results = queryMathModDB(queryModelHandler['All'].format(f":{IdMM.split('#')[1]}"))
+        graph = None
+        if mathmoddb_subgraph_depth:
+            # Fetch Neighbourhood of the Model at once and walk it locally (Queries below if MathModDB does not provide it)
+            graph = queryMathModDBSubgraph(subgraph(f":{IdMM.split('#')[1]}", mathmoddb_subgraph_depth))
+        if graph is not None:
+            results = modelGraphResults(graph, IdMM)
+        else:
+            results = queryMathModDB(queryModelHandler['All'].format(f":{IdMM.split('#')[1]}"))
         
         if results:
 
@@ -445,9 +587,9 @@ def ModelHandler(sender, **kwargs):
                     if rfId not in rfIds:
                         rfIds.append(rfId) 
                         # Set up Research Field Page 
-                        valueEditor(instance, f'{BASE_URI}domain/ResearchField', idx, None, None, None, idx)
+                        writer.add(f'{BASE_URI}domain/ResearchField', idx, None, None, None, idx)
                         # Add Research Field Values
-                        valueEditor(instance, f'{BASE_URI}domain/ResearchFieldMathModDBID', f"{rfLabel}", f"{rfId} <|> {rfLabel}", None, None, idx)
+                        writer.add(f'{BASE_URI}domain/ResearchFieldMathModDBID', f"{rfLabel}", f"{rfId} <|> {rfLabel}", None, None, idx)
                         idx = idx + 1
             
             # Add Research Problem Information to Questionnaire
@@ -462,9 +604,9 @@ def ModelHandler(sender, **kwargs):
                         rpIds.append(rpId)
                         rpLabels.append(rpLabel)
                         # Setup Research Problem Page
-                        valueEditor(instance, f'{BASE_URI}domain/ResearchProblem', idx, None, None, None, idx)
+                        writer.add(f'{BASE_URI}domain/ResearchProblem', idx, None, None, None, idx)
                         # Add Research Problem Values
-                        valueEditor(instance, f'{BASE_URI}domain/ResearchProblemMathModDBID', f"{rpLabel}", f"{rpId} <|> {rpLabel}", None, None, idx)
+                        writer.add(f'{BASE_URI}domain/ResearchProblemMathModDBID', f"{rpLabel}", f"{rpId} <|> {rpLabel}", None, None, idx)
                         idx = idx +1
 
             # Add Quantity Information to Questionnaire
@@ -485,9 +627,9 @@ def ModelHandler(sender, **kwargs):
             
             for idx, (qId, qLabel, qClass) in enumerate(zip(qIds,qLabels,qClasss)):
                     # Set up Qauntity / Quantity Kind Page
-                    valueEditor(instance, f'{BASE_URI}domain/QuantityOrQuantityKind', idx, None, None, None, idx)
+                    writer.add(f'{BASE_URI}domain/QuantityOrQuantityKind', idx, None, None, None, idx)
                     # Add Quantity / Quantity Kind Values
-                    valueEditor(instance, f'{BASE_URI}domain/QuantityOrQuantityKindMathModDBID', 
+                    writer.add(f'{BASE_URI}domain/QuantityOrQuantityKindMathModDBID', 
                                 f"{qLabel} (Quantity)" if qClass.split('#')[1] == 'Quantity' else f"{qLabel} (Quantity Kind)", 
                                 f"{qId} <|> {qLabel} <|> {qClass.split('#')[1]}", None, None, idx)
 
@@ -506,33 +648,39 @@ def ModelHandler(sender, **kwargs):
             IdsT = ModelProperty['taIds']
             Ids = [IdMM] + rfIds + rpIds + qIds + IdsMF + IdsT
 
-            # Further Queries of Knowledge Graph to get further Formualtion, Task and Publication Information
-            search_string2 = ''
-            search_string3 = ''
-            search_string4 = ''
+            if graph is not None:
+                # Further Formulation, Task and Publication Information is already contained in the Subgraph
+                results2 = formulationGraphResults(graph, IdsMF)
+                results3 = taskGraphResults(graph, IdsT)
+                results4 = publicationGraphResults(graph, Ids)
+            else:
+                # Further Queries of Knowledge Graph to get further Formualtion, Task and Publication Information
+                search_string2 = ''
+                search_string3 = ''
+                search_string4 = ''
 
-            for Id in IdsMF:
-                search_string2 = search_string2 + f" :{Id.split('#')[1]}"
+                for Id in IdsMF:
+                    search_string2 = search_string2 + f" :{Id.split('#')[1]}"
 
-            for Id in IdsT:
-                search_string3 = search_string3 + f" :{Id.split('#')[1]}"
-            
-            for Id in Ids:
-                search_string4 = search_string4 + f" :{Id.split('#')[1]}"
+                for Id in IdsT:
+                    search_string3 = search_string3 + f" :{Id.split('#')[1]}"
+                
+                for Id in Ids:
+                    search_string4 = search_string4 + f" :{Id.split('#')[1]}"
 
-            results2 = queryMathModDB(queryModelHandler['MFRelations'].format(search_string2))
-            results3 = queryMathModDB(queryModelHandler['TRelation'].format(search_string3))
-            results4 = queryMathModDB(queryModelHandler['PRelation'].format(search_string4))
+                results2 = queryMathModDB(queryModelHandler['MFRelations'].format(search_string2))
+                results3 = queryMathModDB(queryModelHandler['TRelation'].format(search_string3))
+                results4 = queryMathModDB(queryModelHandler['PRelation'].format(search_string4))
 
 
             for idx, (mmId, mmLabel) in enumerate(zip(ModelProperty['mmIds'],ModelProperty['mmLabels'])):
                 # Set up Mathematical Model Page
-                valueEditor(instance, f'{BASE_URI}domain/MathematicalModel', idx, None, None, None, idx)
+                writer.add(f'{BASE_URI}domain/MathematicalModel', idx, None, None, None, idx)
                 # Add Mathematical Model ID and Label
-                valueEditor(instance, f'{BASE_URI}domain/MathematicalModelMathModDBID', f"{mmLabel}", f"{mmId} <|> {mmLabel}", None, None, idx)
+                writer.add(f'{BASE_URI}domain/MathematicalModelMathModDBID', f"{mmLabel}", f"{mmId} <|> {mmLabel}", None, None, idx)
                 # Add Research Problem related to Mathematical Model
                 for idx2, (rpId, rpLabel) in enumerate(zip(rpIds,rpLabels)):
-                    valueEditor(instance, f'{BASE_URI}domain/ResearchProblemRelatedToMathematicalModel', f"{rpLabel}", f"{rpId} <|> {rpLabel}", None, idx2, idx)
+                    writer.add(f'{BASE_URI}domain/ResearchProblemRelatedToMathematicalModel', f"{rpLabel}", f"{rpId} <|> {rpLabel}", None, idx2, idx)
                 
                 # Add Model Relations
 
@@ -606,8 +754,8 @@ def ModelHandler(sender, **kwargs):
                     for Id, Label in zip(ModelProperty[f'{prefix}Ids'],ModelProperty[f'{prefix}Labels']):
                         if Id and Label:
                             # Add Property and Model
-                            valueEditor(instance, f'{BASE_URI}domain/MathematicalModelToMathematicalModelRelation', None, None, Option.objects.get(uri=mathmoddb[modelRelations2[prefix]]), None, idx2, idx)
-                            valueEditor(instance, f'{BASE_URI}domain/MathematicalModelRelatedToMathematicalModel', f"{Label}", f"{Id} <|> {Label}", None, None, idx2, idx)
+                            writer.add(f'{BASE_URI}domain/MathematicalModelToMathematicalModelRelation', None, None, mathmoddb[modelRelations2[prefix]], None, idx2, idx)
+                            writer.add(f'{BASE_URI}domain/MathematicalModelRelatedToMathematicalModel', f"{Label}", f"{Id} <|> {Label}", None, None, idx2, idx)
                             # Increase index
                             idx2 = idx2 + 1
                 
@@ -616,12 +764,12 @@ def ModelHandler(sender, **kwargs):
                     for Id, Label in zip(ModelProperty[f'{type}Ids'],ModelProperty[f'{type}Labels']):
                         if Id and Label:
                             # Set up Page for Mathematical Formulation
-                            valueEditor(instance, f'{BASE_URI}domain/MathematicalFormulation', idx2, None, None, None, idx2)
+                            writer.add(f'{BASE_URI}domain/MathematicalFormulation', idx2, None, None, None, idx2)
                             # Add Id / Label of Mathematical Formualtion
-                            valueEditor(instance, f'{BASE_URI}domain/MathematicalFormulationMathModDBID', f"{Label}", f"{Id} <|> {Label}", None, None, idx2)
+                            writer.add(f'{BASE_URI}domain/MathematicalFormulationMathModDBID', f"{Label}", f"{Id} <|> {Label}", None, None, idx2)
                             # Add Contained As Formulation In Property and Model
-                            valueEditor(instance, f'{BASE_URI}domain/MathematicalFormulationToMathematicalModelRelation', None, None, Option.objects.get(uri=mathmoddb[modelRelations1[type]]), None, idx, idx2)
-                            valueEditor(instance, f'{BASE_URI}domain/MathematicalModelRelatedToMathematicalFormulation', f"{mmLabel}", f"{mmId} <|> {mmLabel}", None, None, idx, idx2)
+                            writer.add(f'{BASE_URI}domain/MathematicalFormulationToMathematicalModelRelation', None, None, mathmoddb[modelRelations1[type]], None, idx, idx2)
+                            writer.add(f'{BASE_URI}domain/MathematicalModelRelatedToMathematicalFormulation', f"{mmLabel}", f"{mmId} <|> {mmLabel}", None, None, idx, idx2)
                             idx3 = 0
                             idx4 = 0
                             for res2 in results2:
@@ -632,8 +780,8 @@ def ModelHandler(sender, **kwargs):
                                             lbs = res2[f'{prefix}L']['value'].split(' <|> ')
                                             for it,lb in zip(its,lbs):
                                                 # Add Contains Formulation Property and Formulation
-                                                valueEditor(instance, f'{BASE_URI}domain/MathematicalFormulationToMathematicalFormulationRelation1', None, None, Option.objects.get(uri=mathmoddb[formulationRelations1[prefix]]), None, idx3, idx2)
-                                                valueEditor(instance, f'{BASE_URI}domain/MathematicalFormulationRelatedToMathematicalFormulation1', f"{lb}", f"{it} <|> {lb}", None, None, idx3, idx2)
+                                                writer.add(f'{BASE_URI}domain/MathematicalFormulationToMathematicalFormulationRelation1', None, None, mathmoddb[formulationRelations1[prefix]], None, idx3, idx2)
+                                                writer.add(f'{BASE_URI}domain/MathematicalFormulationRelatedToMathematicalFormulation1', f"{lb}", f"{it} <|> {lb}", None, None, idx3, idx2)
                                                 # Increase Index
                                                 idx3 = idx3 + 1
                                     for prefix in formulationRelations2.keys(): 
@@ -642,8 +790,8 @@ def ModelHandler(sender, **kwargs):
                                             lbs = res2[f'{prefix}L']['value'].split(' <|> ')
                                             for it,lb in zip(its,lbs):
                                                 # Add Generalized By Property and Formulation
-                                                valueEditor(instance, f'{BASE_URI}domain/MathematicalFormulationToMathematicalFormulationRelation2', None, None, Option.objects.get(uri=mathmoddb[formulationRelations2[prefix]]), None, idx4, idx2)
-                                                valueEditor(instance, f'{BASE_URI}domain/MathematicalFormulationRelatedToMathematicalFormulation2', f"{lb}", f"{it} <|> {lb}", None, None, idx4, idx2)
+                                                writer.add(f'{BASE_URI}domain/MathematicalFormulationToMathematicalFormulationRelation2', None, None, mathmoddb[formulationRelations2[prefix]], None, idx4, idx2)
+                                                writer.add(f'{BASE_URI}domain/MathematicalFormulationRelatedToMathematicalFormulation2', f"{lb}", f"{it} <|> {lb}", None, None, idx4, idx2)
                                                 # Increase Index
                                                 idx4 = idx4 + 1
                             idx2 = idx2 + 1
@@ -652,11 +800,11 @@ def ModelHandler(sender, **kwargs):
                 for taId, taLabel in zip(ModelProperty['taIds'], ModelProperty['taLabels']):
                     if taId and taLabel:
                         # Set up Page for Task
-                        valueEditor(instance, f'{BASE_URI}domain/Task', idx2, None, None, None, idx2)
+                        writer.add(f'{BASE_URI}domain/Task', idx2, None, None, None, idx2)
                         # Add Task ID / Label
-                        valueEditor(instance, f'{BASE_URI}domain/TaskMathModDBID', f"{taLabel}", f"{taId} <|> {taLabel}", None, None, idx2)
+                        writer.add(f'{BASE_URI}domain/TaskMathModDBID', f"{taLabel}", f"{taId} <|> {taLabel}", None, None, idx2)
                         # Add Model applied by Task
-                        valueEditor(instance, f'{BASE_URI}domain/MathematicalModelRelatedToTask', f"{mmLabel}", f"{mmId} <|> {mmLabel}", None, None, idx2)
+                        writer.add(f'{BASE_URI}domain/MathematicalModelRelatedToTask', f"{mmLabel}", f"{mmId} <|> {mmLabel}", None, None, idx2)
                         idx3 = 0
                         for res3 in results3:
                             if taId == res3.get('t',{}).get('value'):
@@ -666,8 +814,8 @@ def ModelHandler(sender, **kwargs):
                                         lbs = res3[f'{prefix}L']['value'].split(' <|> ')
                                         for it,lb in zip(its,lbs):
                                             # Add Generalized By Property and Task
-                                            valueEditor(instance, f'{BASE_URI}domain/TaskToTaskRelation', None, None, Option.objects.get(uri=mathmoddb[taskRelations[prefix]]), None, idx3, idx2)
-                                            valueEditor(instance, f'{BASE_URI}domain/TaskRelatedToTask', f"{lb}", f"{it} <|> {lb}", None, None, idx3, idx2)
+                                            writer.add(f'{BASE_URI}domain/TaskToTaskRelation', None, None, mathmoddb[taskRelations[prefix]], None, idx3, idx2)
+                                            writer.add(f'{BASE_URI}domain/TaskRelatedToTask', f"{lb}", f"{it} <|> {lb}", None, None, idx3, idx2)
                                             # Increase Index
                                             idx3 = idx3 + 1
                         idx2 = idx2 + 1
@@ -684,9 +832,9 @@ def ModelHandler(sender, **kwargs):
             for idx, (puId, puLabel) in enumerate(zip(puIds,puLabels)):
                 idx2 = 0
                 # Set up Publication Page 
-                valueEditor(instance, f'{BASE_URI}domain/Publication', idx, None, None, None, idx)
+                writer.add(f'{BASE_URI}domain/Publication', idx, None, None, None, idx)
                 # Add Id / Label of Publication
-                valueEditor(instance, f'{BASE_URI}domain/PublicationMathModDBID', f"{puLabel}", f"{puId} <|> {puLabel}", None, None, idx)
+                writer.add(f'{BASE_URI}domain/PublicationMathModDBID', f"{puLabel}", f"{puId} <|> {puLabel}", None, None, idx)
                 # Get Class abbreviation
                 for res4 in results4:
                     Class = res4.get('class',{}).get('value','').split('#')[-1]
@@ -708,17 +856,19 @@ def ModelHandler(sender, **kwargs):
                     for no in publicationRelations.keys():
                         if puId in res4.get(f'PU{no}',{}).get('value',''):                        
                             # Add Documents Property and Entitiy
-                            valueEditor(instance, f'{BASE_URI}domain/PublicationToModelEntityRelation', None, None, Option.objects.get(uri=mathmoddb[publicationRelations[no]]), None, idx2, idx)
-                            valueEditor(instance, f'{BASE_URI}domain/ModelEntityRelatedToPublication', f"{res4['label']['value']} ({Class})", f"{res4['item']['value']} <|> {res4['label']['value']} <|> {Class} <|> {Abbr}", None, None, idx2, idx)
+                            writer.add(f'{BASE_URI}domain/PublicationToModelEntityRelation', None, None, mathmoddb[publicationRelations[no]], None, idx2, idx)
+                            writer.add(f'{BASE_URI}domain/ModelEntityRelatedToPublication', f"{res4['label']['value']} ({Class})", f"{res4['item']['value']} <|> {res4['label']['value']} <|> {Class} <|> {Abbr}", None, None, idx2, idx)
                             # Increase Index
                             idx2 = idx2 + 1    
 
+            writer.flush()
+
     return
 
-@receiver(post_save, sender=Value)
+@handles(f'{BASE_URI}domain/SoftwareQID', background=True)
 def programmingLanguages(sender, **kwargs):
     instance = kwargs.get("instance", None)
-    if instance and instance.attribute.uri == f'{BASE_URI}domain/SoftwareQID':
+    if instance:
        
         software_id = instance.external_id.split(' <|> ')[0]
         
@@ -727,7 +877,7 @@ def programmingLanguages(sender, **kwargs):
             res = kg_req(wikidata_endpoint,wini.format(pl_vars,pl_query.format(software_id.split(':')[-1],'P277'),'100'))
             for idx, r in enumerate(res):
                 if r.get('qid',{}).get('value'): 
-                    attribute_object = Attribute.objects.get(uri=f'{BASE_URI}domain/SoftwareProgrammingLanguages')
+                    attribute_object = getAttribute(f'{BASE_URI}domain/SoftwareProgrammingLanguages')
                     obj, created = Value.objects.update_or_create(
                     project=instance.project,
                     attribute=attribute_object,
@@ -746,7 +896,7 @@ def programmingLanguages(sender, **kwargs):
             res = kg_req(mardi_endpoint,mini.format(pl_vars,pl_query.format(software_id.split(':')[-1],P19),'100')) 
             for idx, r in enumerate(res):
                 if r.get('qid',{}).get('value'):
-                    attribute_object = Attribute.objects.get(uri=f'{BASE_URI}domain/SoftwareProgrammingLanguages')
+                    attribute_object = getAttribute(f'{BASE_URI}domain/SoftwareProgrammingLanguages')
                     obj, created = Value.objects.update_or_create(
                     project=instance.project,
                     attribute=attribute_object,
@@ -762,15 +912,15 @@ def programmingLanguages(sender, **kwargs):
 
     return
 
-@receiver(post_save, sender=Value)
+@handles(f'{BASE_URI}domain/HardwareProcessor', background=True)
 def processor(sender, **kwargs):
     instance = kwargs.get("instance", None)
-    if instance and instance.attribute.uri == f'{BASE_URI}domain/HardwareProcessor':
+    if instance:
         try:
             url, label, quote = instance.external_id.split(' <|> ')
             
             # Get "real" URL
-            r = requests.get(url)
+            r = client.get(url)
             tmp = r.text.replace('<link rel="canonical" href="', 'r@ndom}-=||').split('r@ndom}-=||')[-1]
             idx = tmp.find('"/>')
             
@@ -786,7 +936,7 @@ def processor(sender, **kwargs):
             else:
                 info = real_link + ' <|> ' + label + ' <|> ' + quote
             
-            attribute_object = Attribute.objects.get(uri=f'{BASE_URI}domain/HardwareProcessor')
+            attribute_object = getAttribute(f'{BASE_URI}domain/HardwareProcessor')
             obj, created = Value.objects.update_or_create(
                 project=instance.project,
                 attribute=attribute_object,
@@ -800,16 +950,14 @@ def processor(sender, **kwargs):
         except:
             pass
 
-@receiver(post_save, sender=Value)
+@handles(f'{BASE_URI}domain/ResearchFieldRelatedToResearchProblem')
 def RP2RF(sender, **kwargs):
     instance = kwargs.get("instance", None)
-    if instance and instance.attribute.uri == f'{BASE_URI}domain/ResearchFieldRelatedToResearchProblem':
+    if instance:
 
-        path = os.path.join(os.path.dirname(__file__), 'data', 'mathmoddb.json')
-        with open(path, "r") as json_file:
-            mathmoddb = json.load(json_file)
+        mathmoddb = loadData('mathmoddb')
 
-        attribute_object = Attribute.objects.get(uri=f'{BASE_URI}domain/ResearchProblemToResearchFieldRelation')
+        attribute_object = getAttribute(f'{BASE_URI}domain/ResearchProblemToResearchFieldRelation')
         obj, created = Value.objects.update_or_create(
             project=instance.project,
             attribute=attribute_object,
@@ -822,16 +970,14 @@ def RP2RF(sender, **kwargs):
                 }
         )
 
-@receiver(post_save, sender=Value)
+@handles(f'{BASE_URI}domain/ResearchProblemRelatedToMathematicalModel')
 def RP2MM(sender, **kwargs):
     instance = kwargs.get("instance", None)
-    if instance and instance.attribute.uri == f'{BASE_URI}domain/ResearchProblemRelatedToMathematicalModel':
+    if instance:
 
-        path = os.path.join(os.path.dirname(__file__), 'data', 'mathmoddb.json')
-        with open(path, "r") as json_file:
-            mathmoddb = json.load(json_file)
+        mathmoddb = loadData('mathmoddb')
 
-        attribute_object = Attribute.objects.get(uri=f'{BASE_URI}domain/MathematicalModelToResearchProblemRelation')
+        attribute_object = getAttribute(f'{BASE_URI}domain/MathematicalModelToResearchProblemRelation')
         obj, created = Value.objects.update_or_create(
             project=instance.project,
             attribute=attribute_object,
@@ -844,16 +990,14 @@ def RP2MM(sender, **kwargs):
                 }
         )
 
-@receiver(post_save, sender=Value)
+@handles(f'{BASE_URI}domain/MathematicalModelRelatedToTask')
 def T2MM(sender, **kwargs):
     instance = kwargs.get("instance", None)
-    if instance and instance.attribute.uri == f'{BASE_URI}domain/MathematicalModelRelatedToTask':
+    if instance:
 
-        path = os.path.join(os.path.dirname(__file__), 'data', 'mathmoddb.json')
-        with open(path, "r") as json_file:
-            mathmoddb = json.load(json_file)
+        mathmoddb = loadData('mathmoddb')
 
-        attribute_object = Attribute.objects.get(uri=f'{BASE_URI}domain/TaskToMathematicalModelRelation')
+        attribute_object = getAttribute(f'{BASE_URI}domain/TaskToMathematicalModelRelation')
         obj, created = Value.objects.update_or_create(
             project=instance.project,
             attribute=attribute_object,
@@ -867,11 +1011,15 @@ def T2MM(sender, **kwargs):
         )
 
 def kg_req(sparql_endpoint, query):
-    '''Function performing SPARQL query at specific endpoint'''
-    req = requests.get(sparql_endpoint,
-                       params = {'format': 'json', 'query': query},
-                       headers = {'User-Agent': 'MaRDMO_0.1 (https://zib.de; reidelbach@zib.de)'}
-                       ).json()["results"]["bindings"]
+    '''Function performing SPARQL query at specific endpoint (without Retries, Answers are processed interactively)'''
+    response = client.get(sparql_endpoint,
+                          params = {'query': query},
+                          headers = {'User-Agent': 'MaRDMO_0.1 (https://zib.de; reidelbach@zib.de)', 'Accept': accept()},
+                          stream = True,
+                          retries = 0
+                          )
+    with response:
+        req = list(rows(response))
     return req
     
 def Author_Search(orcid_ids, zbmath_ids, orcid_authors, zbmath_authors):
@@ -981,8 +1129,7 @@ def make_api_requests(api, search_objects, dict_merged, prefix):
     for index, search_object in enumerate(search_objects):
         for item in search_object:
             try:
-                req.update({index: requests.get(api + '?action=wbsearchentities&format=json&language=en&type=item&limit=10&search={0}'.format(item), 
-                                                headers={'User-Agent': 'MaRDMO_0.1 (https://zib.de; reidelbach@zib.de)'}).json()['search'][0]})
+                req.update({index: entitySearch.search(api, item)[0]})
             except (KeyError, IndexError):
                 pass
     
@@ -999,60 +1146,9 @@ def make_api_requests(api, search_objects, dict_merged, prefix):
 
 def valueEditor(instance, uri, text=None, external_id=None, option=None, collection_index=None, set_index=None, set_prefix=None):
     
-    attribute_object = Attribute.objects.get(uri=uri)
-
-    # Prepare the defaults dictionary
-    defaults = {
-        'project': instance.project,
-        'attribute': attribute_object,
-    }
-
-    if text is not None:
-        defaults['text'] = text
-
-    if external_id is not None:
-        defaults['external_id'] = external_id
-
-    if option is not None:
-        defaults['option'] = Option.objects.get(uri=option)
-
-    # Handle collection_index if provided
-    if collection_index is not None and set_index is not None and set_prefix is None:
-        obj, created = Value.objects.update_or_create(
-            project=instance.project,
-            attribute=attribute_object,
-            collection_index=collection_index,
-            set_index=set_index,
-            defaults=defaults
-        )
-    elif collection_index is not None and set_index is None and set_prefix is None:
-        obj, created = Value.objects.update_or_create(
-            project=instance.project,
-            attribute=attribute_object,
-            collection_index=collection_index,
-            defaults=defaults
-        )
-    elif set_index is not None and collection_index is None and set_prefix is None:
-        obj, created = Value.objects.update_or_create(
-            project=instance.project,
-            attribute=attribute_object,
-            set_index=set_index,
-            defaults=defaults
-        )
-    elif set_index is not None and collection_index is None and set_prefix is not None:
-        obj, created = Value.objects.update_or_create(
-            project=instance.project,
-            attribute=attribute_object,
-            set_prefix=set_prefix,
-            set_index=set_index,
-            defaults=defaults
-        )
-    else:
-        obj, created = Value.objects.update_or_create(
-            project=instance.project,
-            attribute=attribute_object,
-            defaults=defaults
-        )
+    writer = ValueWriter(instance.project)
+    writer.add(uri, text, external_id, option, collection_index, set_index, set_prefix)
+    writer.flush()
 
     return
     
@@ -0,0 +1,164 @@
+import hashlib
+import os
+import json
+import pickle
+import tempfile
+import threading
+
+from array import array
+
+class SearchIndex:
+    '''In-memory Substring Search Index over Labels.
+
+       Labels are stored pre-lowered together with trigram posting lists, so a
+       search only verifies the candidates sharing all trigrams of the search
+       term instead of scanning every label. Results are returned sorted by label.'''
+
+    n = 3
+
+    def __init__(self, entries=None):
+        self._payloads = {}
+        self._lower = {}
+        self._grams = {}
+        self._order = []
+        self._rank = {}
+        self._lock = threading.RLock()
+        if entries:
+            self.update(entries)
+
+    def __len__(self):
+        return len(self._payloads)
+
+    def update(self, entries):
+        '''Synchronise Index with entries (dict label -> payload), only changed Labels are (re)indexed'''
+        with self._lock:
+            removed = [label for label in self._payloads if label not in entries]
+            added = [label for label in entries if label not in self._payloads]
+            for label in removed:
+                for gram in self.grams(self._lower[label]):
+                    postings = self._grams.get(gram)
+                    if postings:
+                        postings.discard(label)
+                        if not postings:
+                            del self._grams[gram]
+                del self._payloads[label]
+                del self._lower[label]
+            for label in added:
+                lower = label.lower()
+                self._lower[label] = lower
+                for gram in self.grams(lower):
+                    self._grams.setdefault(gram, set()).add(label)
+            # Payloads may change without a change of the Label
+            self._payloads.update(entries)
+            if removed or added:
+                self._order = sorted(self._payloads)
+                self._rank = {label: rank for rank, label in enumerate(self._order)}
+
+    def search(self, term, limit=None):
+        '''Get sorted (label, payload) pairs of all Labels containing term (case-insensitive)'''
+        term = term.lower()
+        with self._lock:
+            if len(term) < self.n:
+                # Too short for trigrams, scan pre-lowered Labels in sorted order
+                labels = [label for label in self._order if term in self._lower[label]]
+            else:
+                postings = sorted((self._grams.get(gram, ()) for gram in self.grams(term)), key=len)
+                if not postings[0]:
+                    return []
+                candidates = set(postings[0]).intersection(*postings[1:])
+                labels = sorted((label for label in candidates if term in self._lower[label]), key=self._rank.__getitem__)
+            if limit is not None:
+                labels = labels[:limit]
+            return [(label, self._payloads[label]) for label in labels]
+
+    @classmethod
+    def grams(cls, text):
+        return {text[i:i+cls.n] for i in range(len(text) - cls.n + 1)}
+
+class MSCIndex:
+    '''Compact Search Index over the Mathematics Subject Classification (MSC2020).
+
+       Labels are pre-lowered and indexed by trigram posting lists of entry
+       positions, a search matches them like the previous linear Scan (term
+       contained in the label, case-insensitive, in file order). The Index can
+       be stored as binary sidecar file next to the MSC data, together with the
+       Hash of the data it was built from.'''
+
+    n = 3
+
+    def __init__(self, labels, codes, texts, grams, digest=None):
+        self.labels = labels
+        self.codes = codes
+        self.texts = texts
+        self.grams = grams
+        self.digest = digest
+
+    @classmethod
+    def build(cls, msc, digest=None):
+        '''Build Index from MSC data (dict label -> {'id': code, 'quote': quote})'''
+        labels = list(msc)
+        codes = [msc[label]['id'] for label in labels]
+        texts = [label.lower() for label in labels]
+        postings = {}
+        for position, text in enumerate(texts):
+            for gram in {text[i:i+cls.n] for i in range(len(text) - cls.n + 1)}:
+                postings.setdefault(gram, array('I')).append(position)
+        grams = {gram: positions.tobytes() for gram, positions in postings.items()}
+        return cls(labels, codes, texts, grams, digest)
+
+    @classmethod
+    def load(cls, path, source=None):
+        '''Load Index from sidecar file, (re)build it from source (MSC JSON file) if the
+           sidecar is missing, unreadable or was built from other data'''
+        if source is None:
+            with open(path, 'rb') as index_file:
+                return cls(*pickle.load(index_file))
+        with open(source, 'rb') as json_file:
+            data = json_file.read()
+        digest = hashlib.sha256(data).hexdigest()
+        try:
+            with open(path, 'rb') as index_file:
+                stored = pickle.load(index_file)
+            if isinstance(stored, dict) and stored.get('digest') == digest:
+                return cls(**stored)
+        except (OSError, pickle.UnpicklingError, EOFError, TypeError, ValueError):
+            pass
+        index = cls.build(json.loads(data), digest)
+        try:
+            index.save(path)
+        except OSError:
+            # Read-only Installation, the Index is built again by the next Process
+            pass
+        return index
+
+    def save(self, path):
+        '''Store Index as binary sidecar file (replaced atomically)'''
+        handle, temporary = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), prefix='.msc-', suffix='.tmp')
+        try:
+            with os.fdopen(handle, 'wb') as index_file:
+                pickle.dump({'labels': self.labels, 'codes': self.codes, 'texts': self.texts, 'grams': self.grams, 'digest': self.digest}, index_file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary, path)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+
+    def search(self, term, limit=20):
+        '''Get (label, code) pairs of the first limit MSC entries whose label contains term (case-insensitive)'''
+        term = term.lower()
+        if len(term) < self.n:
+            candidates = range(len(self.texts))
+        else:
+            postings = []
+            for gram in {term[i:i+self.n] for i in range(len(term) - self.n + 1)}:
+                if gram not in self.grams:
+                    return []
+                postings.append(self.grams[gram])
+            # Verify Candidates of the shortest Posting List, Positions are in file order
+            candidates = array('I', min(postings, key=len))
+        results = []
+        for position in candidates:
+            if term in self.texts[position]:
+                results.append((self.labels[position], self.codes[position]))
+                if len(results) == limit:
+                    break
+        return results
@@ -0,0 +1,216 @@
+import atexit
+import logging
+import threading
+import time
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.db import connections, transaction
+from django.db.models import Count
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from .config import job_backend, job_workers, job_poll_interval, job_timeout, job_retention
+
+# Failed Jobs listed in the Status of a Project
+STATUS_ERRORS = 10
+
+logger = logging.getLogger(__name__)
+
+def run(uri, value_id):
+    '''Run Handler registered for uri on Value value_id, skipped if the Value was deleted meanwhile'''
+    from rdmo.projects.models import Value
+    from .handlers import valueHandlers
+    value = Value.objects.select_related('attribute', 'project').filter(pk=value_id).first()
+    if value is not None:
+        valueHandlers[uri](Value, instance=value)
+
+class SyncQueue:
+    '''Runs Jobs right away in the saving Request'''
+
+    def enqueue(self, uri, value):
+        run(uri, value.pk)
+
+    def status(self, project_id):
+        return {'queued': 0, 'running': 0, 'failed': 0, 'errors': []}
+
+class ThreadQueue:
+    '''Runs Jobs on job_workers Threads of the Web Process, after the saving Transaction is committed.
+
+       A Value already queued for a Handler is not queued again. The Status is
+       only known to this Process, use DatabaseQueue for several Web Workers.
+       Failures are kept for job_retention seconds.'''
+
+    def __init__(self, workers=job_workers):
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='MaRDMO-jobs')
+        self._lock = threading.Lock()
+        self._queued = set()
+        self._status = {}
+        self._failures = {}
+        atexit.register(self.executor.shutdown, wait=False, cancel_futures=True)
+
+    def enqueue(self, uri, value):
+        transaction.on_commit(lambda: self._submit((uri, value.pk), value.project_id))
+
+    def status(self, project_id):
+        with self._lock:
+            self._prune()
+            status = dict(self._status.get(project_id, {'queued': 0, 'running': 0}))
+            failures = list(self._failures.get(project_id, []))
+        status['failed'] = len(failures)
+        status['errors'] = [{'uri': uri, 'value': value_id, 'error': error, 'time': failed.isoformat()}
+                            for failed, uri, value_id, error in reversed(failures[-STATUS_ERRORS:])]
+        return status
+
+    def _submit(self, key, project_id):
+        with self._lock:
+            if key in self._queued:
+                return
+            self._queued.add(key)
+            self._count(project_id, 'queued', 1)
+        self.executor.submit(self._run, key, project_id)
+
+    def _run(self, key, project_id):
+        with self._lock:
+            # Saves from now on need another Run
+            self._queued.discard(key)
+            self._count(project_id, 'queued', -1)
+            self._count(project_id, 'running', 1)
+        try:
+            run(*key)
+        except Exception as error:
+            logger.exception('Job %s on Value %s failed', *key)
+            with self._lock:
+                self._failures.setdefault(project_id, deque(maxlen=100)).append((timezone.now(), *key, repr(error)))
+        else:
+            with self._lock:
+                # Earlier Failures on the Value are resolved
+                if project_id in self._failures:
+                    self._failures[project_id] = deque((failure for failure in self._failures[project_id] if failure[1:3] != key), maxlen=100)
+        finally:
+            # Connections are per Thread, do not keep them open in idle Workers
+            connections.close_all()
+            with self._lock:
+                self._count(project_id, 'running', -1)
+
+    def _count(self, project_id, status, delta):
+        counts = self._status.setdefault(project_id, {'queued': 0, 'running': 0})
+        counts[status] += delta
+        if not any(counts.values()):
+            del self._status[project_id]
+
+    def _prune(self):
+        expired = timezone.now() - timedelta(seconds=job_retention)
+        for project_id in list(self._failures):
+            failures = self._failures[project_id]
+            while failures and failures[0][0] < expired:
+                failures.popleft()
+            if not failures:
+                del self._failures[project_id]
+
+class DatabaseQueue:
+    '''Stores Jobs in the Database, run by any Number of `manage.py run_jobs` Workers.
+
+       Jobs are stored within the saving Transaction, so they are only visible to
+       Workers once it is committed. Finished Jobs are deleted, failed Jobs are
+       kept with their Error. Jobs running for more than job_timeout seconds
+       are queued again, their Worker is assumed to have died. Failed Jobs are
+       deleted after job_retention seconds.'''
+
+    def status(self, project_id):
+        from .models import Job
+        jobs = Job.objects.filter(project_id=project_id)
+        counts = dict(jobs.values_list('status').annotate(Count('id')).order_by())
+        status = {state: counts.get(state, 0) for state in [Job.QUEUED, Job.RUNNING, Job.FAILED]}
+        status['errors'] = [{'uri': job.uri, 'value': job.value_id, 'error': job.error, 'time': job.updated.isoformat()}
+                            for job in jobs.filter(status=Job.FAILED).order_by('-updated')[:STATUS_ERRORS]]
+        return status
+
+    def enqueue(self, uri, value):
+        from .models import Job
+        Job.objects.get_or_create(uri=uri, value_id=value.pk, status=Job.QUEUED, defaults={'project_id': value.project_id})
+
+    def claim(self):
+        '''Get next queued Job and mark it as running, None if there is none'''
+        from .models import Job
+        with transaction.atomic():
+            job = Job.objects.select_for_update(skip_locked=True).filter(status=Job.QUEUED).first()
+            if job is not None:
+                job.status = Job.RUNNING
+                job.save(update_fields=['status', 'updated'])
+        return job
+
+    def reclaim(self):
+        '''Queue Jobs again that are running for more than job_timeout seconds, get their Number'''
+        from .models import Job
+        reclaimed = 0
+        with transaction.atomic():
+            stale = Job.objects.select_for_update(skip_locked=True).filter(status=Job.RUNNING, updated__lt=timezone.now() - timedelta(seconds=job_timeout))
+            for job in stale:
+                logger.warning('Job %s on Value %s did not finish within %s seconds, queued again', job.uri, job.value_id, job_timeout)
+                if Job.objects.filter(uri=job.uri, value_id=job.value_id, status=Job.QUEUED).exists():
+                    # Value was saved again meanwhile, one Run is enough
+                    job.delete()
+                else:
+                    job.status = Job.QUEUED
+                    job.save(update_fields=['status', 'updated'])
+                reclaimed += 1
+        return reclaimed
+
+    def prune(self):
+        '''Delete Jobs failed more than job_retention seconds ago, get their Number'''
+        from .models import Job
+        deleted, _ = Job.objects.filter(status=Job.FAILED, updated__lt=timezone.now() - timedelta(seconds=job_retention)).delete()
+        return deleted
+
+    def work(self, once=False):
+        '''Run queued Jobs, wait job_poll_interval seconds whenever the Queue is empty (return if once)'''
+        from .models import Job
+        pruned = 0
+        while True:
+            job = self.claim()
+            if job is None and self.reclaim():
+                continue
+            if job is None:
+                if time.monotonic() - pruned > min(job_retention, 3600):
+                    self.prune()
+                    pruned = time.monotonic()
+                if once:
+                    return
+                time.sleep(job_poll_interval)
+                continue
+            try:
+                run(job.uri, job.value_id)
+            except Exception as error:
+                logger.exception('Job %s on Value %s failed', job.uri, job.value_id)
+                job.status = Job.FAILED
+                job.error = repr(error)
+                job.save(update_fields=['status', 'error', 'updated'])
+            else:
+                # Earlier Failures on the Value are resolved
+                Job.objects.filter(uri=job.uri, value_id=job.value_id, status=Job.FAILED).delete()
+                job.delete()
+
+backends = {'sync': SyncQueue, 'thread': ThreadQueue, 'database': DatabaseQueue}
+
+_queue = None
+_queueLock = threading.Lock()
+
+def queue():
+    '''Get Queue of the configured job_backend (sync, thread, database or dotted Path of a Queue Class)'''
+    global _queue
+    if _queue is None:
+        with _queueLock:
+            if _queue is None:
+                _queue = backends[job_backend]() if job_backend in backends else import_string(job_backend)()
+    return _queue
+
+def enqueue(uri, value):
+    '''Queue Run of the Handler registered for uri on value'''
+    queue().enqueue(uri, value)
+
+def status(project_id):
+    '''Get Number of queued, running and failed Jobs of a Project and the latest Errors'''
+    return queue().status(project_id)
@@ -0,0 +1,21 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from ...citation import citationCache, normaliseDOI
+
+class Command(BaseCommand):
+    help = 'Drop cached Publication Information, so that it is gathered again the next time the DOI is entered.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('dois', nargs='*', help='DOIs to refresh')
+        parser.add_argument('--all', action='store_true', help='refresh all cached DOIs')
+
+    def handle(self, *args, **options):
+        if options['all']:
+            citationCache.invalidate()
+            self.stdout.write('Dropped all cached publications.')
+            return
+        if not options['dois']:
+            raise CommandError('Pass DOIs to refresh or --all.')
+        for doi in options['dois']:
+            citationCache.invalidate(normaliseDOI(doi))
+            self.stdout.write(f'Dropped cached publication {normaliseDOI(doi)}.')
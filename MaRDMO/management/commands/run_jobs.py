@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from ...jobs import DatabaseQueue, queue
+
+class Command(BaseCommand):
+    help = 'Run queued MaRDMO Jobs (job_backend = "database").'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help='return once the queue is empty')
+
+    def handle(self, *args, **options):
+        if not isinstance(queue(), DatabaseQueue):
+            raise CommandError('Jobs are only run by workers with job_backend = "database".')
+        queue().work(once=options['once'])
@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from ...config import mathmoddb_mirror
+from ...mirror import mathmoddbMirror
+
+class Command(BaseCommand):
+    help = 'Dump MathModDB into the local mirror (mathmoddb_mirror), run it periodically to keep the mirror fresh.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--delta', action='store_true', help='merge only entities added by MaRDMO since the last sync')
+
+    def handle(self, *args, **options):
+        if not mathmoddb_mirror:
+            raise CommandError('Set mathmoddb_mirror to the file of the local mirror.')
+        if mathmoddbMirror is None:
+            raise CommandError('The local mirror needs rdflib, install MaRDMO[mirror].')
+        if options['delta']:
+            if not mathmoddbMirror.available():
+                raise CommandError('Sync the local mirror in full first.')
+            triples = mathmoddbMirror.update()
+            self.stdout.write(f'Merged {triples} triples into {mathmoddb_mirror}.')
+            return
+        triples = mathmoddbMirror.sync()
+        self.stdout.write(f'Synced {triples} triples to {mathmoddb_mirror}.')
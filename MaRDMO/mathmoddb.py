@@ -1,21 +1,38 @@
 import re
+
+import asyncio
+import threading
+import time
+
 import requests
-import os, json
 
-from .sparql import queryModelDocumentation
-from .config import mardi_api, mathmoddb_endpoint
+from collections import namedtuple, OrderedDict
+
+from .index import SearchIndex
+from . import aclient, client
+from .mirror import mathmoddbMirror
+from .search import entitySearch
+from .registry import loadData
+from .results import accept, rows
+from .sparql import queryModelDocumentation, queryProvider, listingClasses, listingDelta, listingMark, listing_search, items_query, items_row, sparql_literal
+from .config import mardi_api, mardi_endpoint, sparql_batch_size, mathmoddb_endpoint, mathmoddb_cache_ttl, mathmoddb_cache_full, mathmoddb_cache_window, mathmoddb_cache_stale, mathmoddb_cache_size, mathmoddb_search_limit, mathmoddb_mirror_reads, mathmoddb_mirror_budget, http_connect_timeout
+
+# Search Indexes of MathModDB Class Listings (keyed by queryProvider key)
+listingIndexes = {}
+listingIndexesLock = threading.Lock()
+
+# Namespaces of MathModDB Subgraphs
+MATHMODDB = 'https://mardi4nfdi.de/mathmoddb#'
+RDF = 'http://www.w3.org/1999/02/22-rdf-syntax-ns#'
+RDFS = 'http://www.w3.org/2000/01/rdf-schema#'
 
 def ModelRetriever(answers,mathmoddb):
     '''Function queries MathModDB to gather further Model Information
        and connects them with Information provided by the User'''
      
-    path = os.path.join(os.path.dirname(__file__), 'data', 'options.json')
-    with open(path, "r") as json_file:
-        option = json.load(json_file)
+    option = loadData('options')
     
-    path = os.path.join(os.path.dirname(__file__), 'data', 'inversePropertyMapping.json')
-    with open(path, "r") as json_file:
-        inversePropertyMapping = json.load(json_file)
+    inversePropertyMapping = loadData('inversePropertyMapping')
     
     # Kinds of Objects, Relations and Properties
     formulationKinds = ['Formulation', 'Assumption', 'BoundaryCondition', 'ConstraintCondition', 'CouplingCondition', 'InitialCondition', 'FinalCondition']
@@ -29,277 +46,262 @@ def ModelRetriever(answers,mathmoddb):
     for key in answers['Task']:
         answers['Task'][key].update({'Include':False})
 
-    # Get additional Model Information from  MathModDB
-    
-    qClass = 'MathematicalModel'
-    
-    search_string = searchGenerator(answers,[qClass])
-    results = queryMathModDB(queryModelDocumentation[qClass].format(search_string))
-    
-    # Get MathModDB ID of all selected Mathematical Models
-    mathmodidToKey = {answers[qClass][key].get('MathModID'): key for key in answers[qClass]}
-
-    for result in results:
-        # Get MathModDB ID of queried Mathematical Model
-        mathmod_id = result.get(qClass, {}).get('value')
-        # Queried Mathematical Model in Selection?
-        if mathmod_id in mathmodidToKey:
-            key = mathmodidToKey[mathmod_id]
-            # Evaluate Comment of Mathematical Model
-            assignValue(qClass, ['quote'], 'Description',result ,key, answers)
-            # Evaluate Data Properties of Mathematical Model
-            assignProperties(answers[qClass][key], result, mathmoddb, dataProperties)
-            # Evaluate Research Problem(s) of Mathematical Model
-            assignSimpleEntityRelation(qClass, 'models', ['MM2RP','RPRelatant','models'], result, key, answers, mathmoddb) 
-            # Evaluate Task(s) applying Mathematical Model
-            assignComplexEntityRelations(qClass, 'Task', 'AppliedByTask', ['AppliesModel'], result, key, answers)
-            # Evaluate Mathematical Model(s) containend in Mathematical Model
-            assignSimpleEntityRelation(qClass, 'containsModel', ['IntraClassRelation','IntraClassElement','containsModel'], result, key, answers, mathmoddb)
-            # Evaluate different kinds of Mathematical Formulations of Mathematical Model
-            for kind in formulationKinds:
-                assignComplexEntityRelations(qClass, 'MathematicalFormulation', f'contains{kind}', ['MF2MM','MMRelatant'], result, key, answers, mathmoddb, inversePropertyMapping)
-    
-    # Get additional Task Information from MathModDB
-    
-    qClass = 'Task'
-    
-    search_string = searchGenerator(answers,[qClass])
-    results = queryMathModDB(queryModelDocumentation[qClass].format(search_string))
-    
-    # Get MathModDB ID of all selected Tasks
-    mathmodidToKey = {answers[qClass][key].get('MathModID'): key for key in answers[qClass]}
-
-    for result in results:
-        # Get MathModDB ID of queried Task
-        mathmod_id = result.get(qClass, {}).get('value')
-        # Queried Task in Selection?
-        if mathmod_id in mathmodidToKey:    
-            key = mathmodidToKey[mathmod_id]
-            # Evaluate Comment of Task
-            assignValue(qClass, ['quote'], 'Description',result ,key, answers)
-            # Evaluate Data Properties of Task
-            assignProperties(answers[qClass][key], result, mathmoddb, dataProperties)
-            # Evaluate Subclass of Task
-            assignValue(qClass, ['subclass'], 'TaskClass',result ,key, answers, mathmoddb)
-            # Evaluate related Mathematical Models
-            assignSimpleEntityRelation(qClass, 'appliesModel', ['T2MM','MMRelatant','appliesModel'], result, key, answers, mathmoddb)
-            # Evaluate Tasks containend in Task
-            assignSimpleEntityRelation(qClass, 'containsTask', ['IntraClassRelation','IntraClassElement','containsTask'], result, key, answers, mathmoddb)
-            # Evaluate Task containing Task
-            assignSimpleEntityRelation(qClass, 'containedInTask', ['IntraClassRelation','IntraClassElement','containedInTask'], result, key, answers, mathmoddb)
-            # Evaluate different kinds of Mathematical Formulations of Task
-            for kind in formulationKinds:
-                assignComplexEntityRelations(qClass, 'MathematicalFormulation', f'contains{kind}', ['MF2T','TRelatant'], result, key, answers, mathmoddb, inversePropertyMapping)
-            # Evaluate different kinds of Quantities of Task
-            for kind in quantityKinds:
-                assignSimpleEntityRelation(qClass, f'contains{kind}', ['T2Q','QRelatant',f'contains{kind}'], result, key, answers, mathmoddb)
-
-    # Add Mathematical Formulations from Task to Formulation List
-    name_to_key = {v['Name']: k for k, v in answers['MathematicalFormulation'].items()}
-    # Iterate through Tasks
-    for idx, key in enumerate(answers['Task']):
-        task = answers['Task'][key]
-        # Process each relation
-        for key2, relation in task.get('T2MF', {}).items():
-            Id, label = task['MFRelatant'][key2].split(' <|> ')[:2]
-            # Check if the label already exists in Mathematical Formulation
-            if label in name_to_key:
-                k = name_to_key[label]
-                math_form = answers['MathematicalFormulation'][k]
-                relation4 = math_form.setdefault('MF2T', {})
-                other4 = math_form.setdefault('TRelatant', {})
-                relation4[f'TF{key}{idx}'] = inversePropertyMapping[relation]
-                other4[f'TF{key}{idx}'] = f"{task.get('MathModID', idx)} <|> {task['Name']}"
+    # Evaluations of MathModDB Query Results per Stage (see stages below)
+
+    def evaluateModels(results):
+        '''Evaluate Mathematical Models'''
+        qClass = 'MathematicalModel'
+        # Get MathModDB ID of all selected Mathematical Models
+        mathmodidToKey = {answers[qClass][key].get('MathModID'): key for key in answers[qClass]}
+
+        for result in results:
+            # Get MathModDB ID of queried Mathematical Model
+            mathmod_id = result.get(qClass, {}).get('value')
+            # Queried Mathematical Model in Selection?
+            if mathmod_id in mathmodidToKey:
+                key = mathmodidToKey[mathmod_id]
+                # Evaluate Comment of Mathematical Model
+                assignValue(qClass, ['quote'], 'Description',result ,key, answers)
+                # Evaluate Data Properties of Mathematical Model
+                assignProperties(answers[qClass][key], result, mathmoddb, dataProperties)
+                # Evaluate Research Problem(s) of Mathematical Model
+                assignSimpleEntityRelation(qClass, 'models', ['MM2RP','RPRelatant','models'], result, key, answers, mathmoddb) 
+                # Evaluate Task(s) applying Mathematical Model
+                assignComplexEntityRelations(qClass, 'Task', 'AppliedByTask', ['AppliesModel'], result, key, answers)
+                # Evaluate Mathematical Model(s) containend in Mathematical Model
+                assignSimpleEntityRelation(qClass, 'containsModel', ['IntraClassRelation','IntraClassElement','containsModel'], result, key, answers, mathmoddb)
+                # Evaluate different kinds of Mathematical Formulations of Mathematical Model
+                for kind in formulationKinds:
+                    assignComplexEntityRelations(qClass, 'MathematicalFormulation', f'contains{kind}', ['MF2MM','MMRelatant'], result, key, answers, mathmoddb, inversePropertyMapping)
+
+    def evaluateTasks(results):
+        '''Evaluate Tasks, add their Mathematical Formulations to Formulation List'''
+        qClass = 'Task'
+        # Get MathModDB ID of all selected Tasks
+        mathmodidToKey = {answers[qClass][key].get('MathModID'): key for key in answers[qClass]}
+
+        for result in results:
+            # Get MathModDB ID of queried Task
+            mathmod_id = result.get(qClass, {}).get('value')
+            # Queried Task in Selection?
+            if mathmod_id in mathmodidToKey:    
+                key = mathmodidToKey[mathmod_id]
+                # Evaluate Comment of Task
+                assignValue(qClass, ['quote'], 'Description',result ,key, answers)
+                # Evaluate Data Properties of Task
+                assignProperties(answers[qClass][key], result, mathmoddb, dataProperties)
+                # Evaluate Subclass of Task
+                assignValue(qClass, ['subclass'], 'TaskClass',result ,key, answers, mathmoddb)
+                # Evaluate related Mathematical Models
+                assignSimpleEntityRelation(qClass, 'appliesModel', ['T2MM','MMRelatant','appliesModel'], result, key, answers, mathmoddb)
+                # Evaluate Tasks containend in Task
+                assignSimpleEntityRelation(qClass, 'containsTask', ['IntraClassRelation','IntraClassElement','containsTask'], result, key, answers, mathmoddb)
+                # Evaluate Task containing Task
+                assignSimpleEntityRelation(qClass, 'containedInTask', ['IntraClassRelation','IntraClassElement','containedInTask'], result, key, answers, mathmoddb)
+                # Evaluate different kinds of Mathematical Formulations of Task
+                for kind in formulationKinds:
+                    assignComplexEntityRelations(qClass, 'MathematicalFormulation', f'contains{kind}', ['MF2T','TRelatant'], result, key, answers, mathmoddb, inversePropertyMapping)
+                # Evaluate different kinds of Quantities of Task
+                for kind in quantityKinds:
+                    assignSimpleEntityRelation(qClass, f'contains{kind}', ['T2Q','QRelatant',f'contains{kind}'], result, key, answers, mathmoddb)
+
+        # Add Mathematical Formulations from Task to Formulation List
+        name_to_key = {v['Name']: k for k, v in answers['MathematicalFormulation'].items()}
+        # Iterate through Tasks
+        for idx, key in enumerate(answers['Task']):
+            task = answers['Task'][key]
+            # Process each relation
+            for key2, relation in task.get('T2MF', {}).items():
+                Id, label = task['MFRelatant'][key2].split(' <|> ')[:2]
+                # Check if the label already exists in Mathematical Formulation
+                if label in name_to_key:
+                    k = name_to_key[label]
+                    math_form = answers['MathematicalFormulation'][k]
+                    relation4 = math_form.setdefault('MF2T', {})
+                    other4 = math_form.setdefault('TRelatant', {})
+                    relation4[f'TF{key}{idx}'] = inversePropertyMapping[relation]
+                    other4[f'TF{key}{idx}'] = f"{task.get('MathModID', idx)} <|> {task['Name']}"
+                else:
+                    # Create a new entry for the Mathematical Formulation
+                    new_key = max(answers['MathematicalFormulation'].keys(), default=-1) + 1
+                    new_form = {
+                        'MathModID': Id,
+                        'Name': label,
+                        'MF2T': {f'TF{key}{idx}': inversePropertyMapping[relation]},
+                        'TRelatant': {f'TF{key}{idx}': f"{task.get('MathModID', idx)} <|> {task['Name']}"}
+                    }
+                    answers['MathematicalFormulation'][new_key] = new_form
+                    # Update the lookup dictionary
+                    name_to_key[label] = new_key
+
+    def evaluateFormulations(results):
+        '''Evaluate Mathematical Formulations'''
+        qClass = 'MathematicalFormulation'
+        # Get MathModID of all selected Mathematical Formulations
+        mathmodidToKey = {answers[qClass][key].get('MathModID'): key for key in answers[qClass]}
+
+        for result in results:
+            # Get MathModID of queried Mathematical Formulation
+            mathmod_id = result.get(qClass, {}).get('value')
+            # Queried Mathematical Formulation in Selection?
+            if mathmod_id in mathmodidToKey:
+                key = mathmodidToKey[mathmod_id]
+                #Evaluate Comment of Mathematical Formulation
+                assignValue(qClass, ['quote'], 'Description',result ,key, answers)
+                #Evaluate Data Properties of Mathematical Formulation
+                assignProperties(answers['MathematicalFormulation'][key], result, mathmoddb, dataProperties)   
+                #Evaluate different kinds of Mathematical Formulations of Mathematical Formulations
+                for kind in formulationKinds:
+                    assignSimpleEntityRelation(qClass, f'contains{kind}', ['MF2MF','MFRelatant',f'contains{kind}'], result, key, answers, mathmoddb)
+                #Evaluate Formula of Mathematical Formulation    
+                assignValues(qClass, 'formula', ['Formula'], result, key, answers)
+                #Evaluate Elements of Mathematical Formulation
+                assignValues(qClass, 'formula_elements', ['Element','Symbol','Quantity'], result, key, answers, splitVariableText)
+                #Evaluate Quantities of Mathematical Formulation
+                assignComplexEntityRelations(qClass, 'Quantity', 'ContainsQuantity', [], result, key, answers, mathmoddb)
+
+    def evaluateQuantityDefinitions(results):
+        '''Evaluate Mathematical Formulations defining Quantities'''
+        tClass = 'MathematicalFormulation'
+        # Get MathModID of all selected Mathematical Formulations
+        mathmodidToKey = {answers[tClass][key].get('MathModID'): key for key in answers[tClass]}
+
+        for result in results:
+            # Get MathModID of queried Mathematical Formulation
+            mathmod_id = result.get(tClass, {}).get('value')
+            # Queried Mathematical Formulation in Selection?
+            if mathmod_id in mathmodidToKey:
+                # If Mathematial Formulation selected add defined quantity statement
+                key = mathmodidToKey[mathmod_id]
+                # Evaluate defined Quantity of Mathematical Formulation
+                assignValue(tClass, ['q','qlabel'], 'DefinedQuantity',result ,key, answers)
             else:
-                # Create a new entry for the Mathematical Formulation
-                new_key = max(answers['MathematicalFormulation'].keys(), default=-1) + 1
-                new_form = {
-                    'MathModID': Id,
-                    'Name': label,
-                    'MF2T': {f'TF{key}{idx}': inversePropertyMapping[relation]},
-                    'TRelatant': {f'TF{key}{idx}': f"{task.get('MathModID', idx)} <|> {task['Name']}"}
-                }
-                answers['MathematicalFormulation'][new_key] = new_form
-                # Update the lookup dictionary
-                name_to_key[label] = new_key
-
-    # Get additional Mathematical Formulation Information from MathModDB
-
-    qClass = 'MathematicalFormulation'
-
-    search_string = searchGenerator(answers,[qClass])
-    results = queryMathModDB(queryModelDocumentation[qClass].format(search_string))
-     
-    # Get MathModID of all selected Mathematical Formulations
-    mathmodidToKey = {answers[qClass][key].get('MathModID'): key for key in answers[qClass]}
-
-    for result in results:
-        # Get MathModID of queried Mathematical Formulation
-        mathmod_id = result.get(qClass, {}).get('value')
-        # Queried Mathematical Formulation in Selection?
-        if mathmod_id in mathmodidToKey:
-            key = mathmodidToKey[mathmod_id]
-            #Evaluate Comment of Mathematical Formulation
-            assignValue(qClass, ['quote'], 'Description',result ,key, answers)
-            #Evaluate Data Properties of Mathematical Formulation
-            assignProperties(answers['MathematicalFormulation'][key], result, mathmoddb, dataProperties)   
-            #Evaluate different kinds of Mathematical Formulations of Mathematical Formulations
-            for kind in formulationKinds:
-                assignSimpleEntityRelation(qClass, f'contains{kind}', ['MF2MF','MFRelatant',f'contains{kind}'], result, key, answers, mathmoddb)
-            #Evaluate Formula of Mathematical Formulation    
-            assignValues(qClass, 'formula', ['Formula'], result, key, answers)
-            #Evaluate Elements of Mathematical Formulation
-            assignValues(qClass, 'formula_elements', ['Element','Symbol','Quantity'], result, key, answers, splitVariableText)
-            #Evaluate Quantities of Mathematical Formulation
-            assignComplexEntityRelations(qClass, 'Quantity', 'ContainsQuantity', [], result, key, answers, mathmoddb)
-                
-    # Get additional Mathematical Formulation Information from MathModDB (Quantity Defintions)
-    
-    qClass = 'Quantity'
-    tClass = 'MathematicalFormulation'
-
-    search_string = searchGenerator(answers,[qClass])
-    results = queryMathModDB(queryModelDocumentation[f'{qClass}Definition'].format(search_string))
-    
-    # Get MathModID of all selected Mathematical Formulations
-    mathmodidToKey = {answers[tClass][key].get('MathModID'): key for key in answers[tClass]}
-
-    for result in results:
-        # Get MathModID of queried Mathematical Formulation
-        mathmod_id = result.get(tClass, {}).get('value')
-        # Queried Mathematical Formulation in Selection?
-        if mathmod_id in mathmodidToKey:
-            # If Mathematial Formulation selected add defined quantity statement
-            key = mathmodidToKey[mathmod_id]
-            # Evaluate defined Quantity of Mathematical Formulation
-            assignValue(tClass, ['q','qlabel'], 'DefinedQuantity',result ,key, answers)
-        else:
-            # If Mathematical Formulation is not selected add it
-            key = max(answers[tClass].keys(), default=-1) + 1
-            #Evaluate ID, Name, Comment and defined Quantity of Mathematical Formulation
-            assignValue(tClass, [tClass], 'MathModID',result ,key, answers)
-            assignValue(tClass, ['label'], 'Name',result ,key, answers)
-            assignValue(tClass, ['quote'], 'Description',result ,key, answers)
-            assignValue(tClass, ['q','qlabel'], 'DefinedQuantity',result ,key, answers)
-            #Evaluate Properties of Mathematical Formulation
-            assignProperties(answers['MathematicalFormulation'][key], result, mathmoddb, dataProperties)
-            #Evaluate Formula of Mathematical Formulation    
-            assignValues(tClass, 'formula', ['Formula'], result, key, answers)
-            #Evaluate Elements of Mathematical Formulation
-            assignValues(tClass, 'formula_elements', ['Element','Symbol','Quantity'], result, key, answers, splitVariableText)
-            #Evaluate Quantities of Mathematical Formulation
-            assignComplexEntityRelations(tClass, 'Quantity', 'ContainsQuantity', [], result, key, answers, mathmoddb)
-
-    # Get additional Quantity Information from MathModDB
-    
-    qClass = 'Quantity'
-    
-    search_string = searchGenerator(answers,[qClass])
-    results = queryMathModDB(queryModelDocumentation[qClass].format(search_string))
-
-    # Get MathModID of all selected Quantities
-    mathmodidToKey = {answers[qClass][key].get('MathModID'): key for key in answers[qClass]}
-
-    for result in results:
-        # Get MathModID of queried Quantity
-        mathmod_id = result.get(qClass, {}).get('value')
-        # Queried Quantity in Selection?
-        if mathmod_id in mathmodidToKey:
-            key = mathmodidToKey[mathmod_id]
-            #Evaluate Comment of Quantity
-            assignValue(qClass, ['quote'], 'Description',result ,key, answers)
-            #Evaluate Data Properties of Quantities
-            assignProperties(answers['Quantity'][key], result, mathmoddb, dataProperties)
-            # Evaluate Quantity Kind (ID, Name, Description) of Quantity
-            assignValue(qClass, ['qk'], 'QKID',result ,key, answers)
-            assignValue(qClass, ['qklabel'], 'QKName',result ,key, answers)
-            assignValue(qClass, ['qkquote'], 'QKDescription',result ,key, answers)
-    
-    # Get additional Research Field Information from MathModDB
-
-    qClass = 'ResearchField'
-
-    search_string = searchGenerator(answers,[qClass])
-    results = queryMathModDB(queryModelDocumentation[qClass].format(search_string))
-    
-    # Get MathModDB ID of all selected Research Fields
-    mathmodidToKey = {answers[qClass][key].get('MathModID'): key for key in answers[qClass]}
-
-    for result in results:
-        # Get MathModDB ID of queried Research Fields
-        mathmod_id = result.get(qClass, {}).get('value')
-        # Queried Research Field in Selection?
-        if mathmod_id in mathmodidToKey:
-            key = mathmodidToKey[mathmod_id]
-            # Evaluate Comment of Research Field
-            assignValue(qClass, ['quote'], 'Description',result ,key, answers)    
-    
-    # Get additional Research Problem Information from MathModDB
-
-    qClass = 'ResearchProblem'
-
-    search_string = searchGenerator(answers,[qClass])
-    results = queryMathModDB(queryModelDocumentation[qClass].format(search_string))
-
-    # Get MathModDB ID of all selected Research Problems
-    mathmodidToKey = {answers[qClass][key].get('MathModID'): key for key in answers[qClass]}
-
-    for result in results:
-        # Get MathModDB ID of queried Research Problem
-        mathmod_id = result.get(qClass, {}).get('value')
-        # Queried Research Problem in Selection?
-        if mathmod_id in mathmodidToKey:
-            key = mathmodidToKey[mathmod_id]
-            # Evaluate Label of Research Problem
-            assignValue(qClass, ['label'], 'Name',result ,key, answers)
-            # Evaluate Comment of Research Problem
-            assignValue(qClass, ['quote'], 'Description',result ,key, answers)
-            # Evaluate related Research Fields
-            assignSimpleEntityRelation(qClass, 'containedInField', ['RP2RF','RFRelatant','containedInField'], result, key, answers, mathmoddb)
-    
-    # Get additional Intra-Class Information for Model, Task, Formulation and Quantity Relations from MathModDB
-    
-    search_string = searchGenerator(answers,['Task', 'MathematicalFormulation', 'MathematicalModel', 'Quantity', 'ResearchField', 'ResearchProblem'])
-    results = queryMathModDB(queryModelDocumentation['IntraClass'].format(search_string))
-    
-    mathmodidToKey = {}
-
-    # Get MathModID of all selected Entities
-    for className in ['ResearchField', 'ResearchProblem', 'Task', 'MathematicalFormulation', 'MathematicalModel', 'Quantity']:
-        mathmodidToKey[className] = {answers[className][key].get('MathModID'): key for key in answers[className]}
-
-    propAppendix = {'ResearchField': 'Field',
-                    'ResearchProblem': 'Problem',
-                    'Task': 'Task',
-                    'MathematicalFormulation': 'Formulation',
-                    'MathematicalModel': 'Model',
-                    'Quantity': 'Quantity'}
-
-    for result in results:
-        # Get MathModID and Class of queried Entity
-        math_mod_id, qClass = result['Item']['value'].split(' >|< ')
-        # Queried Entity in Selection?
-        if math_mod_id in mathmodidToKey[qClass]:
-            key = mathmodidToKey[qClass][math_mod_id]
-            # Evaluate Relations of Mathematical Models, Mathematical Formulations, Tasks and Quantities
-            for relation in intraClassRelations:
-                assignSimpleEntityRelation(qClass, relation, [f"{relation}{propAppendix[qClass]}"], result, key, answers, mathmoddb)
-
-    # Get additional Publication Information from MathModDB
-
-    tClass = 'PublicationModel'
-
-    search_string = searchGenerator(answers,['ResearchField','ResearchProblem','MathematicalModel','Quantity','MathematicalFormulation','Task'])
-    results = queryMathModDB(queryModelDocumentation[tClass].format(search_string))
-    
-    for result in results:
-        # Get MathModID and Class of queries entity
-        mathmodid, qClass = result['Item']['value'].split(' >|< ')
-        # Queried entity in Selection?
-        if mathmodid in mathmodidToKey[qClass]:
-            key = mathmodidToKey[qClass][mathmodid]
-            for relation in publicationRelations:
-                assignComplexEntityRelations(qClass, tClass, relation, ['P2E','EntityRelatant'], result, key, answers, mathmoddb, inversePropertyMapping)
+                # If Mathematical Formulation is not selected add it
+                key = max(answers[tClass].keys(), default=-1) + 1
+                #Evaluate ID, Name, Comment and defined Quantity of Mathematical Formulation
+                assignValue(tClass, [tClass], 'MathModID',result ,key, answers)
+                assignValue(tClass, ['label'], 'Name',result ,key, answers)
+                assignValue(tClass, ['quote'], 'Description',result ,key, answers)
+                assignValue(tClass, ['q','qlabel'], 'DefinedQuantity',result ,key, answers)
+                #Evaluate Properties of Mathematical Formulation
+                assignProperties(answers['MathematicalFormulation'][key], result, mathmoddb, dataProperties)
+                #Evaluate Formula of Mathematical Formulation    
+                assignValues(tClass, 'formula', ['Formula'], result, key, answers)
+                #Evaluate Elements of Mathematical Formulation
+                assignValues(tClass, 'formula_elements', ['Element','Symbol','Quantity'], result, key, answers, splitVariableText)
+                #Evaluate Quantities of Mathematical Formulation
+                assignComplexEntityRelations(tClass, 'Quantity', 'ContainsQuantity', [], result, key, answers, mathmoddb)
+
+    def evaluateQuantities(results):
+        '''Evaluate Quantities'''
+        qClass = 'Quantity'
+        # Get MathModID of all selected Quantities
+        mathmodidToKey = {answers[qClass][key].get('MathModID'): key for key in answers[qClass]}
+
+        for result in results:
+            # Get MathModID of queried Quantity
+            mathmod_id = result.get(qClass, {}).get('value')
+            # Queried Quantity in Selection?
+            if mathmod_id in mathmodidToKey:
+                key = mathmodidToKey[mathmod_id]
+                #Evaluate Comment of Quantity
+                assignValue(qClass, ['quote'], 'Description',result ,key, answers)
+                #Evaluate Data Properties of Quantities
+                assignProperties(answers['Quantity'][key], result, mathmoddb, dataProperties)
+                # Evaluate Quantity Kind (ID, Name, Description) of Quantity
+                assignValue(qClass, ['qk'], 'QKID',result ,key, answers)
+                assignValue(qClass, ['qklabel'], 'QKName',result ,key, answers)
+                assignValue(qClass, ['qkquote'], 'QKDescription',result ,key, answers)
+
+    def evaluateFields(results):
+        '''Evaluate Research Fields'''
+        qClass = 'ResearchField'
+        # Get MathModDB ID of all selected Research Fields
+        mathmodidToKey = {answers[qClass][key].get('MathModID'): key for key in answers[qClass]}
+
+        for result in results:
+            # Get MathModDB ID of queried Research Fields
+            mathmod_id = result.get(qClass, {}).get('value')
+            # Queried Research Field in Selection?
+            if mathmod_id in mathmodidToKey:
+                key = mathmodidToKey[mathmod_id]
+                # Evaluate Comment of Research Field
+                assignValue(qClass, ['quote'], 'Description',result ,key, answers)    
+
+    def evaluateProblems(results):
+        '''Evaluate Research Problems'''
+        qClass = 'ResearchProblem'
+        # Get MathModDB ID of all selected Research Problems
+        mathmodidToKey = {answers[qClass][key].get('MathModID'): key for key in answers[qClass]}
+
+        for result in results:
+            # Get MathModDB ID of queried Research Problem
+            mathmod_id = result.get(qClass, {}).get('value')
+            # Queried Research Problem in Selection?
+            if mathmod_id in mathmodidToKey:
+                key = mathmodidToKey[mathmod_id]
+                # Evaluate Label of Research Problem
+                assignValue(qClass, ['label'], 'Name',result ,key, answers)
+                # Evaluate Comment of Research Problem
+                assignValue(qClass, ['quote'], 'Description',result ,key, answers)
+                # Evaluate related Research Fields
+                assignSimpleEntityRelation(qClass, 'containedInField', ['RP2RF','RFRelatant','containedInField'], result, key, answers, mathmoddb)
+
+    def evaluateIntraClass(results):
+        '''Evaluate Intra-Class Relations of Models, Tasks, Formulations, Quantities, Research Fields and Problems'''
+        mathmodidToKey = {}
+
+        # Get MathModID of all selected Entities
+        for className in ['ResearchField', 'ResearchProblem', 'Task', 'MathematicalFormulation', 'MathematicalModel', 'Quantity']:
+            mathmodidToKey[className] = {answers[className][key].get('MathModID'): key for key in answers[className]}
+
+        propAppendix = {'ResearchField': 'Field',
+                        'ResearchProblem': 'Problem',
+                        'Task': 'Task',
+                        'MathematicalFormulation': 'Formulation',
+                        'MathematicalModel': 'Model',
+                        'Quantity': 'Quantity'}
+
+        for result in results:
+            # Get MathModID and Class of queried Entity
+            math_mod_id, qClass = result['Item']['value'].split(' >|< ')
+            # Queried Entity in Selection?
+            if math_mod_id in mathmodidToKey[qClass]:
+                key = mathmodidToKey[qClass][math_mod_id]
+                # Evaluate Relations of Mathematical Models, Mathematical Formulations, Tasks and Quantities
+                for relation in intraClassRelations:
+                    assignSimpleEntityRelation(qClass, relation, [f"{relation}{propAppendix[qClass]}"], result, key, answers, mathmoddb)
+
+    def evaluatePublications(results):
+        '''Evaluate Publications of Entities'''
+        tClass = 'PublicationModel'
+
+        # Get MathModID of all selected Entities
+        mathmodidToKey = {className: {answers[className][key].get('MathModID'): key for key in answers[className]}
+                          for className in ['ResearchField', 'ResearchProblem', 'Task', 'MathematicalFormulation', 'MathematicalModel', 'Quantity']}
+
+        for result in results:
+            # Get MathModID and Class of queries entity
+            mathmodid, qClass = result['Item']['value'].split(' >|< ')
+            # Queried entity in Selection?
+            if mathmodid in mathmodidToKey[qClass]:
+                key = mathmodidToKey[qClass][mathmodid]
+                for relation in publicationRelations:
+                    assignComplexEntityRelations(qClass, tClass, relation, ['P2E','EntityRelatant'], result, key, answers, mathmoddb, inversePropertyMapping)
+
+    # Query Stages in Order of Evaluation: Query Key, Classes searched for, Classes the Evaluation may add Entities to
+    stages = [QueryStage('MathematicalModel', ['MathematicalModel'], ['Task', 'MathematicalFormulation'], evaluateModels),
+              QueryStage('Task', ['Task'], ['MathematicalFormulation'], evaluateTasks),
+              QueryStage('MathematicalFormulation', ['MathematicalFormulation'], ['Quantity'], evaluateFormulations),
+              QueryStage('QuantityDefinition', ['Quantity'], ['MathematicalFormulation', 'Quantity'], evaluateQuantityDefinitions),
+              QueryStage('Quantity', ['Quantity'], [], evaluateQuantities),
+              QueryStage('ResearchField', ['ResearchField'], [], evaluateFields),
+              QueryStage('ResearchProblem', ['ResearchProblem'], [], evaluateProblems),
+              QueryStage('IntraClass', ['Task', 'MathematicalFormulation', 'MathematicalModel', 'Quantity', 'ResearchField', 'ResearchProblem'], [], evaluateIntraClass),
+              QueryStage('PublicationModel', ['ResearchField','ResearchProblem','MathematicalModel','Quantity','MathematicalFormulation','Task'], ['PublicationModel'], evaluatePublications)]
+
+    # Get additional Information from MathModDB, independent Queries at once
+    runQueryStages(stages, answers)
 
     # Research Field to Research Field Relations
     entityRelations(answers,'ResearchField','ResearchField','IntraClassRelation','IntraClassElement','RelationRF1','RF')
@@ -313,6 +315,9 @@ def ModelRetriever(answers,mathmoddb):
     # Convert Research Problems in additional Models
     entityRelations(answers,'MathematicalModel','ResearchProblem','MM2RP','RPRelatant','RelationRP1','RP')
     
+    # Look up all Mathematical Models on the MaRDI Portal at once
+    found = find_items((mm.get('Name'), mm.get('Description')) for mm in answers.get('MathematicalModel', {}).values())
+
     # Add Information to main Mathematical Model
     for key2 in answers['Models']:
         if answers['Models'][key2].get('MathModID') and answers['Models'][key2]['MathModID'] != 'not in MathModDB':
@@ -321,7 +326,7 @@ def ModelRetriever(answers,mathmoddb):
                     Name = answers['MathematicalModel'][key]['Name']
                     Description = answers['MathematicalModel'][key]['Description']
                     Properties = answers['MathematicalModel'][key]['Properties']
-                    mardiID = find_item(Name,Description)
+                    mardiID = found[(Name,Description)] if (Name,Description) in found else find_item(Name,Description)
                     if mardiID:
                         answers['Models'][key2].update({'ID':f"mardi:{mardiID}", 'Name':Name, 'Description':Description, 'Properties':Properties})
                     else:
@@ -332,7 +337,7 @@ def ModelRetriever(answers,mathmoddb):
                     Name = answers['MathematicalModel'][key]['Name']
                     Description = answers['MathematicalModel'][key]['Description']
                     Properties = answers['MathematicalModel'][key].get('Properties')
-                    mardiID = find_item(Name,Description)
+                    mardiID = found[(Name,Description)] if (Name,Description) in found else find_item(Name,Description)
                     if mardiID:
                         answers['Models'][key2].update({'ID':f"mardi:{mardiID}", 'Name':Name, 'Description':Description, 'Properties':Properties})
                     else:
@@ -438,17 +443,9 @@ def ModelRetriever(answers,mathmoddb):
 
 def find_item(label, description, api=mardi_api, language="en"):
     # Perform label-based search
-    response = requests.get(api, params={
-        'action': 'wbsearchentities',
-        'format': 'json',
-        'language': 'en',
-        'type': 'item',
-        'limit': 10,
-        'search': label
-    }, headers={'User-Agent': 'MaRDMO_0.1 (https://zib.de; reidelbach@zib.de)'})
-    data = response.json()
+    data = entitySearch.search(api, label)
     # Filter results based on description
-    matched_items = [item for item in data['search'] if item.get('description') == description]
+    matched_items = [item for item in data if item.get('description') == description]
     if matched_items:
         # Return the ID of the first matching item
         return matched_items[0]['id']
@@ -456,6 +453,36 @@ def find_item(label, description, api=mardi_api, language="en"):
         # No matching item found
         return None
 
+def find_items(pairs, endpoint=mardi_endpoint):
+    '''Look up Items by exact English Label and Description, sparql_batch_size Items per SPARQL Query.
+
+       Returns dict (label, description) -> QID. Pairs without exact Match and
+       Pairs of failed Queries are left out, so that find_item (wbsearchentities,
+       which matches Aliases and ignores Case) may be used for them.'''
+    pairs = sorted({(label, description) for label, description in pairs if label and description})
+    found = {}
+    for start in range(0, len(pairs), sparql_batch_size):
+        chunk = pairs[start:start + sparql_batch_size]
+        query = items_query.format('\n'.join(items_row.format(sparql_literal(label), sparql_literal(description)) for label, description in chunk))
+        response = client.post(endpoint,
+                               data={'query': query},
+                               headers={'Accept': accept()},
+                               idempotent=True,
+                               stream=True
+                              )
+        if response.status_code != 200:
+            response.close()
+            continue
+        qids = {}
+        for result in rows(response):
+            pair = (result['label']['value'], result['description']['value'])
+            qids.setdefault(pair, []).append(result['qid']['value'])
+        for pair in chunk:
+            if pair in qids:
+                # Several Items may share Label and Description, take the oldest one
+                found[pair] = min(qids[pair], key=lambda qid: int(qid[1:]))
+    return found
+
 def assignProperties(data, queryData, mathmoddb, properties):
     # Add Data Property Information from Query to Data
     for idx,property in enumerate(properties):
@@ -487,20 +514,392 @@ def entityRelations(data, fromIDX, toIDX, relationOld, entityOld, relationNew, e
                             data[fromIDX][key].setdefault(relationNew, {}).update({key2: [data[fromIDX][key][relationOld][key2], Id, Id]})
     return
 
-def queryMathModDB(query,endpoint=mathmoddb_endpoint):
+def mirrored(endpoint):
+    '''Get local Mirror serving Reads of endpoint, None if there is none'''
+    return mathmoddbMirror if endpoint == mathmoddb_endpoint else None
+
+def budget(mirror, retries=None):
+    '''Get Request Options for MathModDB: while the local Mirror can answer instead,
+       MathModDB gets a short Read Timeout and no Retries before falling back to it'''
+    if mirror is None or not mirror.available():
+        return {'retries': retries}
+    return {'retries': 0, 'timeout': (http_connect_timeout, mathmoddb_mirror_budget)}
+
+def queryMathModDB(query,endpoint=mathmoddb_endpoint,local=True,retries=None):
+    return list(iterMathModDB(query, endpoint, local, retries))
+
+def iterMathModDB(query,endpoint=mathmoddb_endpoint,local=True,retries=None):
+    '''Iterate Rows of SELECT query, parsed while MathModDB answers (see results.rows).
+
+       With local=False the local Mirror is left out, e.g. for Entities just written to MathModDB,
+       with retries=0 MathModDB is asked once, e.g. for interactive Searches.'''
+    mirror = mirrored(endpoint) if local else None
+    # Read from local Mirror of MathModDB
+    if mirror is not None and mathmoddb_mirror_reads == 'mirror':
+        req = mirror.select(query)
+        if req is not None:
+            yield from req
+            return
+
     # Query MathModDB
-    response = requests.post(endpoint, 
-                             data=query, 
-                             headers={"Content-Type": "application/sparql-query","Accept": "application/sparql-results+json"}
-                            )
+    try:
+        response = client.post(endpoint, 
+                               data=query, 
+                               headers={"Content-Type": "application/sparql-query","Accept": accept()},
+                               idempotent=True,
+                               stream=True,
+                               **budget(mirror, retries)
+                              )
+    except requests.RequestException:
+        if mirror is None:
+            raise
+        response = None
+    
+    if response is not None and response.status_code == 200:
+        with response:
+            yield from rows(response)
+        return
+    if response is not None:
+        response.close()
+    if mirror is not None:
+        # Serve from local Mirror while MathModDB is not available
+        yield from mirror.select(query) or []
+
+def queryMathModDBSubgraph(query,endpoint=mathmoddb_endpoint):
+    '''Get Result of CONSTRUCT query as Subgraph, None if MathModDB does not answer with RDF/JSON'''
+    mirror = mirrored(endpoint)
+    # Read from local Mirror of MathModDB
+    if mirror is not None and mathmoddb_mirror_reads == 'mirror':
+        data = mirror.construct(query)
+        if data is not None:
+            return Subgraph(data)
+
+    try:
+        response = client.post(endpoint, 
+                               data=query, 
+                               headers={"Content-Type": "application/sparql-query","Accept": "application/rdf+json"},
+                               idempotent=True,
+                               **budget(mirror)
+                              )
+    except requests.RequestException:
+        if mirror is None:
+            raise
+        response = None
+    
+    if response is not None and response.status_code == 200:
+        try:
+            return Subgraph(response.json())
+        except ValueError:
+            return None
+    elif mirror is not None:
+        # Serve from local Mirror while MathModDB is not available
+        data = mirror.construct(query)
+        if data is not None:
+            return Subgraph(data)
+
+    return None
+
+class Subgraph:
+    '''MathModDB Subgraph in RDF/JSON (Subject -> Predicate -> Objects), walked locally instead of querying it'''
+
+    def __init__(self, data):
+        if not isinstance(data, dict):
+            raise ValueError('RDF/JSON expected')
+        self.data = data
+
+    def objects(self, subject, predicate):
+        '''Get Objects of subject and predicate'''
+        return [obj['value'] for obj in self.data.get(subject, {}).get(predicate, [])]
+
+    def label(self, subject):
+        '''Get English Label of subject, None if there is none'''
+        for obj in self.data.get(subject, {}).get(RDFS + 'label', []):
+            if obj.get('lang', '').lower() == 'en':
+                return obj['value']
+        return None
+
+    def types(self, subject):
+        '''Get Classes of subject'''
+        return self.objects(subject, RDF + 'type')
+
+    def related(self, subject, prop, classes=None):
+        '''Get (ID, Label) of labelled Entities related to subject via MathModDB prop (of one of classes)'''
+        pairs = []
+        for obj in self.objects(subject, MATHMODDB + prop):
+            label = self.label(obj)
+            if label is None or (classes and not any(Class.split('#')[-1] in classes for Class in self.types(obj))):
+                continue
+            if (obj, label) not in pairs:
+                pairs.append((obj, label))
+        return pairs
+
+# Stage of Queries to MathModDB: key in queryModelDocumentation, Classes whose MathModIDs are searched for,
+# Classes to which evaluate(results) may add Entities
+QueryStage = namedtuple('QueryStage', ['key', 'classes', 'adds', 'evaluate'])
+
+def runQueryStages(stages, answers):
+    '''Run Query Stages, evaluating their Results in the given Order.
+
+       The Query of a Stage is sent once no earlier, not yet evaluated Stage may
+       add Entities to the Classes it searches for, i.e. when its search string
+       is final. All Queries ready at that Point are sent at once, so the Latency
+       is about that of the critical Path instead of the Sum of all Queries.'''
+    results = {}
+    for idx, stage in enumerate(stages):
+        if idx not in results:
+            pending = set()
+            ready = []
+            for jdx in range(idx, len(stages)):
+                if jdx not in results and not pending.intersection(stages[jdx].classes):
+                    ready.append(jdx)
+                pending.update(stages[jdx].adds)
+            queries = [queryModelDocumentation[stages[jdx].key].format(searchGenerator(answers, stages[jdx].classes)) for jdx in ready]
+            results.update(zip(ready, queryMathModDBConcurrently(*queries)))
+        stage.evaluate(results.pop(idx))
+
+async def aqueryMathModDB(query,endpoint=mathmoddb_endpoint):
+    # Queries involving the local Mirror run on Threads
+    if mirrored(endpoint) is not None:
+        return await asyncio.to_thread(queryMathModDB, query, endpoint)
+
+    # Query MathModDB asynchronously
+    response = await aclient.post(endpoint, 
+                                  data=query, 
+                                  headers={"Content-Type": "application/sparql-query","Accept": accept()},
+                                  idempotent=True
+                                 )
     
     if response.status_code == 200:
-        req = response.json().get('results',{}).get('bindings',[])
+        req = list(rows(response))
     else:
         req = []
 
     return req
 
+def queryMathModDBConcurrently(*queries):
+    '''Query MathModDB with independent queries concurrently, get their Results in order'''
+    return aclient.run(*(aqueryMathModDB(query) for query in queries))
+
+class ListingSync:
+    '''MathModDB Class Listings kept fresh by Delta Pulls.
+
+       A Listing is loaded in full once. MaRDMO numbers the Entities it adds to
+       MathModDB consecutively (mardmo<N>), so afterwards every interval seconds
+       a Pull probes the window IRIs following the highest Number seen so far
+       (high-water Mark) and merges the new Entities into all loaded Listings,
+       in the Background while the current Listings are served. Its Cost scales
+       with the Number of new Entities instead of the Size of MathModDB.
+       Entities changed, deleted or added otherwise carry no Marker, Listings
+       are therefore loaded in full again every full seconds: in the Background
+       while the current Listing is served for further stale seconds, afterwards
+       right away. A Listing is loaded by one Request at a Time, concurrent
+       Requests get its Result. At most size Listings are kept (LRU).'''
+
+    prefix = f'{MATHMODDB}mardmo'
+
+    def __init__(self, interval, full, window, stale, size):
+        self.interval = interval
+        self.full = full
+        self.window = window
+        self.stale = stale
+        self.size = size
+        self._listings = OrderedDict()
+        self._loading = set()
+        self._loadLocks = {}
+        self._mark = 0
+        self._pulled = time.monotonic()
+        self._lock = threading.Lock()
+        self._pullLock = threading.Lock()
+
+    def get(self, key):
+        '''Get Listing for queryProvider key'''
+        now = time.monotonic()
+        with self._lock:
+            listing, loaded = self._listings.get(key, (None, None))
+            if listing is not None:
+                self._listings.move_to_end(key)
+        if listing is None or now - loaded > self.full + self.stale:
+            return self.load(key)
+        if now - loaded > self.full:
+            # Serve the stale Listing while it is reloaded
+            self.prefetch(key)
+        elif now - self._pulled > self.interval and not self._pullLock.locked():
+            threading.Thread(target=self._background, daemon=True).start()
+        return listing
+
+    def load(self, key):
+        '''Load Listing for key in full, Requests waiting meanwhile get its Result'''
+        started = time.monotonic()
+        with self._lock:
+            loadLock = self._loadLocks.setdefault(key, threading.Lock())
+        with loadLock:
+            with self._lock:
+                listing, loaded = self._listings.get(key, (None, None))
+            if loaded is not None and loaded >= started:
+                # Loaded by a concurrent Request
+                return listing
+            # High-water Mark is taken before the first Listing, so no Entity added meanwhile is missed,
+            # and from the same Source (possibly the local Mirror), so Pulls catch up with MathModDB from there
+            mark = self.highest() if not self._listings else None
+            results = queryMathModDB(queryProvider[key])
+            if not results:
+                # Keep serving the previous Listing while MathModDB is not available
+                return listing or results
+            with self._lock:
+                if mark is not None:
+                    # Concurrent first Loads (e.g. a Prefetch) must not move the Mark backwards
+                    self._mark = max([self._mark, mark] + [self.number(result['answer']['value']) for result in results])
+                self._listings[key] = (results, time.monotonic())
+                self._listings.move_to_end(key)
+                while len(self._listings) > self.size:
+                    self._listings.popitem(last=False)
+            return results
+
+    def pull(self):
+        '''Merge Entities added since the high-water Mark into the loaded Listings'''
+        with self._pullLock:
+            self._pulled = time.monotonic()
+            start = self._mark
+            top = None
+            while self._listings:
+                search = ' '.join(f':mardmo{number}' for number in range(start + 1, start + self.window + 1))
+                # New Entities are not in the local Mirror before its next Sync
+                results = [result for result in queryMathModDB(listingDelta.format(search), local=False) if result.get('answer')]
+                if not results:
+                    # A Gap of window IRIs or more (e.g. of a failed Export) hides the Entities after it,
+                    # probe on up to the highest Number in MathModDB
+                    if top is None:
+                        top = self.highest(local=False)
+                    if start + self.window >= top:
+                        return
+                    start += self.window
+                    continue
+                with self._lock:
+                    for key, (listing, loaded) in list(self._listings.items()):
+                        self._listings[key] = (self.merge(key, listing, results), loaded)
+                    self._mark = max([self._mark, start] + [self.number(result['answer']['value']) for result in results])
+                    start = self._mark
+
+    def highest(self, local=True):
+        '''Get highest Number of the mardmo<N> IRIs in MathModDB (local=False skips the local Mirror)'''
+        results = queryMathModDB(listingMark, local=local)
+        mark = results[0].get('mark',{}).get('value') if results else None
+        return int(mark) if mark else 0
+
+    def cached(self, key):
+        '''Get Listing for key if it was loaded already, else None'''
+        with self._lock:
+            return self._listings.get(key, (None, None))[0]
+
+    def prefetch(self, key):
+        '''Load Listing for key in full in the Background'''
+        with self._lock:
+            if key in self._loading:
+                return
+            self._loading.add(key)
+        threading.Thread(target=self._prefetch, args=(key,), daemon=True).start()
+
+    def _prefetch(self, key):
+        try:
+            self.load(key)
+        except Exception:
+            # Next Request retries
+            pass
+        finally:
+            with self._lock:
+                self._loading.discard(key)
+
+    def invalidate(self, key=None):
+        '''Drop Listing for key or all Listings if no key is given, they are loaded in full again'''
+        with self._lock:
+            if key is None:
+                self._listings.clear()
+            else:
+                self._listings.pop(key, None)
+
+    def _background(self):
+        try:
+            self.pull()
+        except Exception:
+            # Keep serving the current Listings, next Request retries
+            self._pulled = time.monotonic()
+
+    @classmethod
+    def number(cls, Id):
+        '''Get Number N of mardmo<N> IRI, 0 for other IRIs'''
+        if Id.startswith(cls.prefix) and Id[len(cls.prefix):].isdigit():
+            return int(Id[len(cls.prefix):])
+        return 0
+
+    @staticmethod
+    def merge(key, listing, results):
+        '''Get new Listing for key with the labelled Entities of its Classes among results'''
+        added = {}
+        for result in results:
+            Class = result.get('class',{}).get('value','')
+            if Class.split('#')[-1] in listingClasses.get(key, []) and result.get('label',{}).get('value'):
+                row = {'answer': result['answer'], 'label': result['label']}
+                if key == 'QQK':
+                    row['class'] = result['class']
+                added[(row['answer']['value'], Class if key == 'QQK' else None)] = row
+        if not added:
+            return listing
+        kept = [row for row in listing if (row['answer']['value'], row.get('class',{}).get('value')) not in added]
+        return kept + list(added.values())
+
+listingSync = ListingSync(mathmoddb_cache_ttl, mathmoddb_cache_full, mathmoddb_cache_window, mathmoddb_cache_stale, mathmoddb_cache_size)
+
+def queryMathModDBListing(key):
+    '''Get (cached) MathModDB Class Listing for queryProvider key'''
+    return listingSync.get(key)
+
+def searchMathModDBListing(key, search):
+    '''Search (cached) MathModDB Class Listing for queryProvider key,
+       returns (label, id) pairs of matching Entities sorted by label.
+
+       While the Listing is not cached yet, the Search is sent to MathModDB
+       (at most mathmoddb_search_limit Matches) and the Listing is loaded in
+       the Background for the next Searches.'''
+    if listingSync.cached(key) is None and key in listingClasses:
+        listingSync.prefetch(key)
+        results = (result for result in iterMathModDB(listing_search(key, search, mathmoddb_search_limit), retries=0) if result.get('answer'))
+        return sorted(listingEntries(results).items())
+    results = queryMathModDBListing(key)
+    with listingIndexesLock:
+        index, source = listingIndexes.get(key, (None, None))
+        if index is None:
+            index = SearchIndex()
+        if source is not results:
+            # Listing (re)loaded, update Index incrementally
+            index.update(listingEntries(results))
+            listingIndexes[key] = (index, results)
+    return index.search(search)
+
+def listingEntries(results):
+    '''Map MathModDB Class Listing to label -> id, Quantities and Quantity Kinds are labelled by Class'''
+    entries = {}
+    for result in results:
+        if result.get('class',{}).get('value'):
+            if result['class']['value'].split('#')[1] == 'Quantity':
+                entries[f"{result['label']['value']} (Quantity)"] = f"{result['answer']['value']} <|> {result['label']['value']} <|> Quantity"
+            elif result['class']['value'].split('#')[1] == 'QuantityKind':
+                entries[f"{result['label']['value']} (Quantity Kind)"] = f"{result['answer']['value']} <|> {result['label']['value']} <|> QuantityKind"
+        else:
+            entries[result['label']['value']] = result['answer']['value']
+    return entries
+
+def invalidateMathModDBListings(key=None):
+    '''Drop cached MathModDB Class Listings, they are loaded in full again'''
+    listingSync.invalidate(key)
+
+def refreshMathModDBListings():
+    '''Merge Entities added to MathModDB into the cached Class Listings, e.g. after writing to MathModDB'''
+    try:
+        listingSync.pull()
+    except requests.RequestException:
+        # Load Listings in full next time instead
+        listingSync.invalidate()
+
 def searchGenerator(data, class_list):
     """
     Generates a search string for SPARQL queries.
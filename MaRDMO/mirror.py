@@ -0,0 +1,179 @@
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+
+from . import client
+from .config import mathmoddb_endpoint, mathmoddb_mirror, mathmoddb_mirror_timeout, mathmoddb_mirror_interval, http_connect_timeout
+
+try:
+    import rdflib
+except ImportError:
+    # Without rdflib all Reads go to MathModDB
+    rdflib = None
+
+logger = logging.getLogger(__name__)
+
+dump_query = 'CONSTRUCT { ?s ?p ?o } WHERE { ?s ?p ?o }'
+
+# Statements on MathModDB Entities added by MaRDMO (mardmo<N>) above a Number
+delta_query = '''PREFIX xsd: <http://www.w3.org/2001/XMLSchema#>
+
+                 CONSTRUCT {{ ?s ?p ?o }}
+                 WHERE {{
+                         {{ ?s ?p ?o.
+                            FILTER (STRSTARTS(STR(?s), "{0}"))
+                            FILTER (xsd:integer(SUBSTR(STR(?s), {1})) > {2}) }}
+                         UNION
+                         {{ ?s ?p ?o.
+                            FILTER (isIRI(?o) && STRSTARTS(STR(?o), "{0}"))
+                            FILTER (xsd:integer(SUBSTR(STR(?o), {1})) > {2}) }}
+                       }}'''
+
+prefix = 'https://mardi4nfdi.de/mathmoddb#mardmo'
+number = re.compile(re.escape(prefix) + r'(\d+)$')
+
+class Mirror:
+    '''Local read Replica of MathModDB: an N-Triples File, queried via an rdflib Graph.
+
+       The File is written by `manage.py sync_mathmoddb` and replaced atomically,
+       every Process reloads it once it changed. Between Syncs, every interval
+       seconds the Statements on Entities MaRDMO added to MathModDB since (above
+       the highest mardmo<N> in the File) are appended to the File and merged
+       into the Graph, in the Background while the Graph is served.'''
+
+    def __init__(self, path, interval=None):
+        self.path = path
+        self.interval = interval
+        self._graph = None
+        self._mtime = None
+        self._mark = 0
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self._updateLock = threading.Lock()
+
+    def available(self):
+        '''Check if the File was synced already'''
+        return os.path.exists(self.path)
+
+    def graph(self):
+        '''Get Graph of the current File, None if it was not synced yet'''
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+        except OSError:
+            return None
+        if mtime != self._mtime:
+            with self._lock:
+                if mtime != self._mtime:
+                    graph = rdflib.Graph()
+                    graph.parse(self.path, format='nt')
+                    self._graph, self._mtime, self._mark = graph, mtime, highest(graph)
+        if self.interval and time.monotonic() - self._updated > self.interval and not self._updateLock.locked():
+            threading.Thread(target=self._background, daemon=True).start()
+        return self._graph
+
+    def select(self, query):
+        '''Get Bindings of SELECT query as returned by MathModDB, None if not synced yet'''
+        graph = self.graph()
+        if graph is None:
+            return None
+        return json.loads(graph.query(query).serialize(format='json')).get('results',{}).get('bindings',[])
+
+    def construct(self, query):
+        '''Get Result of CONSTRUCT query as RDF/JSON, None if not synced yet'''
+        graph = self.graph()
+        if graph is None:
+            return None
+        data = {}
+        for s, p, o in graph.query(query).graph:
+            if isinstance(o, rdflib.URIRef):
+                obj = {'type': 'uri', 'value': str(o)}
+            elif isinstance(o, rdflib.BNode):
+                obj = {'type': 'bnode', 'value': o.n3()}
+            else:
+                obj = {'type': 'literal', 'value': str(o)}
+                if o.language:
+                    obj['lang'] = o.language
+                elif o.datatype:
+                    obj['datatype'] = str(o.datatype)
+            data.setdefault(s.n3() if isinstance(s, rdflib.BNode) else str(s), {}).setdefault(str(p), []).append(obj)
+        return data
+
+    def update(self, endpoint=mathmoddb_endpoint):
+        '''Merge Statements on Entities added since the File was written into it, get Number of new Triples'''
+        with self._updateLock:
+            self._updated = time.monotonic()
+            graph = self.graph()
+            if graph is None:
+                # Nothing to merge into before the first Sync
+                return 0
+            mark = self._mark
+            response = client.post(endpoint,
+                                   data=delta_query.format(prefix, len(prefix) + 1, mark),
+                                   headers={"Content-Type": "application/sparql-query","Accept": "application/n-triples"},
+                                   idempotent=True,
+                                   timeout=(http_connect_timeout, mathmoddb_mirror_timeout))
+            response.raise_for_status()
+            delta = rdflib.Graph()
+            delta.parse(data=response.content, format='nt')
+            new = delta - graph
+            if not len(new):
+                return 0
+            # Served Graphs are not changed while they are queried, the merged one replaces it
+            merged = rdflib.Graph()
+            merged += graph
+            merged += new
+            with self._lock:
+                # Appended in one Write, the File stays valid N-Triples for Processes reloading it meanwhile
+                with open(self.path, 'ab') as dump:
+                    dump.write(new.serialize(format='nt', encoding='utf-8'))
+                if self._graph is graph:
+                    self._graph, self._mark = merged, max(mark, highest(new))
+                    self._mtime = os.stat(self.path).st_mtime_ns
+        logger.info('Merged %d triples of %s into %s', len(new), endpoint, self.path)
+        return len(new)
+
+    def _background(self):
+        try:
+            self.update()
+        except Exception as error:
+            # Next Interval retries
+            logger.warning('Updating %s failed: %r', self.path, error)
+
+    def sync(self, endpoint=mathmoddb_endpoint):
+        '''Dump MathModDB into the File, get Number of Triples'''
+        response = client.post(endpoint,
+                               data=dump_query,
+                               headers={"Content-Type": "application/sparql-query","Accept": "application/n-triples"},
+                               idempotent=True,
+                               stream=True,
+                               timeout=(http_connect_timeout, mathmoddb_mirror_timeout))
+        response.raise_for_status()
+        directory = os.path.dirname(os.path.abspath(self.path))
+        handle, temporary = tempfile.mkstemp(dir=directory, prefix='.mathmoddb-', suffix='.nt')
+        try:
+            with os.fdopen(handle, 'wb') as dump:
+                for chunk in response.iter_content(chunk_size=1 << 16):
+                    dump.write(chunk)
+            # Check the Dump before it replaces the served one
+            graph = rdflib.Graph()
+            graph.parse(temporary, format='nt')
+            os.replace(temporary, self.path)
+        except BaseException:
+            os.unlink(temporary)
+            raise
+        logger.info('Synced %d triples of %s to %s', len(graph), endpoint, self.path)
+        return len(graph)
+
+def highest(graph):
+    '''Get highest Number of the mardmo<N> IRIs in graph'''
+    numbers = [int(match.group(1)) for term in graph.all_nodes() if isinstance(term, rdflib.URIRef) for match in [number.match(term)] if match]
+    return max(numbers, default=0)
+
+mathmoddbMirror = Mirror(mathmoddb_mirror, mathmoddb_mirror_interval) if mathmoddb_mirror and rdflib is not None else None
+
+if mathmoddb_mirror and rdflib is None:
+    logger.warning('mathmoddb_mirror is set, but rdflib is not installed, reading from MathModDB')
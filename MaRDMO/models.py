@@ -0,0 +1,20 @@
+from django.db import models
+
+class Job(models.Model):
+    '''Queued Run of the Handler of an Attribute on a Value (see jobs.DatabaseQueue)'''
+
+    QUEUED = 'queued'
+    RUNNING = 'running'
+    FAILED = 'failed'
+    STATUS_CHOICES = [(QUEUED, 'queued'), (RUNNING, 'running'), (FAILED, 'failed')]
+
+    uri = models.CharField(max_length=640)
+    value_id = models.IntegerField()
+    project_id = models.IntegerField(db_index=True)
+    status = models.CharField(max_length=8, choices=STATUS_CHOICES, default=QUEUED, db_index=True)
+    error = models.TextField(blank=True)
+    created = models.DateTimeField(auto_now_add=True)
+    updated = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ('id',)
@@ -0,0 +1,52 @@
+import atexit
+import logging
+import time
+
+from concurrent.futures import ThreadPoolExecutor, TimeoutError, wait
+
+from .config import search_workers, search_timeout, export_workers
+
+logger = logging.getLogger(__name__)
+
+# Bounded Executor shared by all Requests of the Process
+executor = ThreadPoolExecutor(max_workers=search_workers, thread_name_prefix='MaRDMO')
+
+# Bounded Executor for Lookups of Exports, which may take long and must not hold up the shared one
+exportExecutor = ThreadPoolExecutor(max_workers=export_workers, thread_name_prefix='MaRDMO-export')
+
+@atexit.register
+def shutdown():
+    executor.shutdown(wait=False, cancel_futures=True)
+    exportExecutor.shutdown(wait=False, cancel_futures=True)
+
+def gather(calls, timeout=search_timeout, default=None, pool=None):
+    '''Run calls concurrently on pool (default: shared executor) and get their Results in order.
+
+       Calls not finished within timeout seconds or failing give default, so
+       that a slow or broken Service does not hold back the Results of others.'''
+    futures = [(pool or executor).submit(call) for call in calls]
+    done, _ = wait(futures, timeout=timeout)
+    results = []
+    for future in futures:
+        if future not in done:
+            # Abandon Call, a running Request finishes in the background
+            future.cancel()
+            logger.warning('Call exceeded time budget of %s s', timeout)
+            results.append(default)
+        elif future.exception() is not None:
+            logger.warning('Call failed: %s', future.exception())
+            results.append(default)
+        else:
+            results.append(future.result())
+    return results
+
+def result(future, deadline, default=None):
+    '''Get Result of future submitted to executor, default if not finished by deadline (time.monotonic) or failing'''
+    try:
+        return future.result(timeout=max(0, deadline - time.monotonic()))
+    except TimeoutError:
+        future.cancel()
+        logger.warning('Call exceeded deadline')
+    except Exception as error:
+        logger.warning('Call failed: %s', error)
+    return default
@@ -1,16 +1,19 @@
-import requests
 import os
-import json
 
 from rdmo.options.providers import Provider
 from rdmo.domain.models import Attribute
-from rdmo.options.models import Option
 
-from multiprocessing.pool import ThreadPool
+from functools import lru_cache
 
 from .config import wikidata_api, mardi_api, BASE_URI
-from .sparql import queryProvider
-from .mathmoddb import queryMathModDB
+from .index import MSCIndex
+from .pool import gather
+from .search import SearchCoalescer, entitySearch
+from .mathmoddb import searchMathModDBListing
+from . import client
+from .registry import loadData, data_path
+from .catalog import getAttribute, getOption
+from .values import projectValues, groupValues
 
 class MaRDIAndWikidataSearch(Provider):
     
@@ -21,9 +24,8 @@ class MaRDIAndWikidataSearch(Provider):
         if not search or len(search) < 3:
             return []
         
-        # Use a ThreadPool to make concurrent API requests
-        pool = ThreadPool(processes=2)
-        wikidata_results, mardi_results = pool.map(lambda api_url: query_api(api_url, search), [wikidata_api, mardi_api])
+        # Query APIs concurrently, Results missing the time budget are left out
+        wikidata_results, mardi_results = gather([lambda: wikidataSearch.search(search, searchUser(user)), lambda: mardiSearch.search(search, searchUser(user))], default=[])
 
         # Process Results to fit RDMO Provider Output Requirements
         options = [
@@ -54,16 +56,14 @@ class AvailableSoftware(Provider):
 
         options = []
 
-        values1 = get_attribute_values(project, get_attribute(self.SUBJECT_ATTRIBUTES[0]))
-        values2 = get_attribute_values(project, get_attribute(self.SUBJECT_ATTRIBUTES[1]))
+        values1, values2 = projectValues(project, self.SUBJECT_ATTRIBUTES)
 
         for v1, v2 in zip(values1, values2):
             if v1.text or v2.text:
                 options.append({'id': 'no ID <|> ' + v1.text + ' <|> ' + v2.text, 'text': v1.text + ' (' + v2.text + ')'})
 
-        # Use a ThreadPool to make concurrent API requests
-        pool = ThreadPool(processes=2)
-        wikidata_results, mardi_results = pool.map(lambda api_url: query_api(api_url, search), [wikidata_api, mardi_api])
+        # Query APIs concurrently, Results missing the time budget are left out
+        wikidata_results, mardi_results = gather([lambda: wikidataSearch.search(search, searchUser(user)), lambda: mardiSearch.search(search, searchUser(user))], default=[])
 
         # Process Results to fit RDMO Provider Output Requirements
         options += [
@@ -87,7 +87,7 @@ class MaRDISearch(Provider):
         if not search or len(search) < 3:
             return []
 
-        mardi_results = query_api(mardi_api, search)
+        mardi_results = mardiSearch.search(search, searchUser(user))
 
         options = [
             process_result(result, 'mardi') for result in mardi_results[:20]
@@ -97,11 +97,6 @@ class MaRDISearch(Provider):
 
 class MSCProvider(Provider):
 
-    path = os.path.join(os.path.dirname(__file__), 'data', 'msc2020.json')
-
-    with open(path, "r") as json_file:
-        msc = json.load(json_file)
-
     search = True
 
     def get_options(self, project, search, user=None, site=None):
@@ -109,11 +104,9 @@ class MSCProvider(Provider):
         if not search or len(search) < 3:
             return []
 
-        options = []
+        options = [{'id': f"{code} - {label}", 'text': f"{label} ({code})"} for label, code in mscIndex().search(search, 20)]
 
-        options = [{'id': self.msc[key]['id'] + ' - ' + key , 'text': f"{key} ({self.msc[key]['id']})"} for key in self.msc if search.lower() in key.lower()]
-
-        return options[:20]
+        return options
 
 class ProcessorProvider(Provider):
 
@@ -125,15 +118,9 @@ class ProcessorProvider(Provider):
         if not search or len(search) < 3:
             return []
         
-        response = requests.get(self.api_url, params={
-            'action': 'opensearch',
-            'search': search
-            }, headers={'User-Agent': 'MaRDMO_0.1 (https://zib.de; reidelbach@zib.de)'}).json()
+        response = processorSearch.search(search, searchUser(user))
         
-        if response[1]:
-            options = [{'id': wikichipId + ' <|> ' + wikichipLabel + ' <|> processor', 'text': wikichipLabel} for wikichipId, wikichipLabel in zip(response[-1],response[1])]
-        else:
-            options = []
+        options = [{'id': wikichipId + ' <|> ' + wikichipLabel + ' <|> processor', 'text': wikichipLabel} for wikichipLabel, wikichipId in response]
     
         return options[:20]
 
@@ -277,7 +264,7 @@ class ResearchField(Provider):
 
     def get_options(self, project, search=None, user=None, site=None):
 
-        options = MathModDBProvider(search,queryProvider['RF'])
+        options = MathModDBProvider(search,'RF')
         
         return options
     
@@ -290,19 +277,12 @@ class RelatedResearchField(Provider):
         if not search:
             return []
 
-        # Fetch research fields from the MathModDB knowledge graph
-        results = queryMathModDB(queryProvider['RF'])
-
-        # Extract options from the knowledge graph
         dic = {}
-        options = []
-        
-        for result in results:
-            dic.update({result['label']['value']:{'id':result['answer']['value']}})
 
         # Fetch user-defined research fields from the project
-        values1 = project.values.filter(snapshot=None, attribute=Attribute.objects.get(uri=f'{BASE_URI}domain/ResearchFieldQID'))
-        values2 = project.values.filter(snapshot=None, attribute=Attribute.objects.get(uri=f'{BASE_URI}domain/ResearchFieldName'))
+        values1, values2 = projectValues(project, [
+            f'{BASE_URI}domain/ResearchFieldQID',
+            f'{BASE_URI}domain/ResearchFieldName'])
 
         for value1 in values1: 
             if value1.text:
@@ -313,9 +293,7 @@ class RelatedResearchField(Provider):
             if value2.text:
                 dic.update({value2.text: {'id': idx}})
 
-        options.extend([{'id': f"{dic[key]['id']} <|> {key}", 'text': key } for key in dic if search.lower() in key.lower()])
-
-        options = sorted(options, key=lambda option: option['text'])
+        options = MathModDBRelatedProvider(search, 'RF', dic)
          
         return options
     
@@ -325,7 +303,7 @@ class ResearchProblem(Provider):
 
     def get_options(self, project, search=None, user=None, site=None):
 
-        options = MathModDBProvider(search,queryProvider['RP'])
+        options = MathModDBProvider(search,'RP')
 
         return options
     
@@ -335,7 +313,7 @@ class MathematicalModel(Provider):
 
     def get_options(self, project, search=None, user=None, site=None):
 
-        options = MathModDBProvider(search,queryProvider['MM'])
+        options = MathModDBProvider(search,'MM')
         
         return options
 
@@ -345,7 +323,7 @@ class Publication(Provider):
 
     def get_options(self, project, search=None, user=None, site=None):
 
-        options = MathModDBProvider(search,queryProvider['P'])
+        options = MathModDBProvider(search,'P')
         
         return options
 
@@ -358,19 +336,12 @@ class RelatedResearchProblem(Provider):
         if not search:
             return []
 
-        # Fetch research problems from the MathModDB knowledge graph
-        results = queryMathModDB(queryProvider['RP'])
-        
-        # Extract options from the knowledge graph
         dic = {}
-        options = []
-        
-        for result in results:
-            dic.update({result['label']['value']:{'id':result['answer']['value']}})
 
         # Fetch user-defined research fields from the project
-        values1 = project.values.filter(snapshot=None, attribute=Attribute.objects.get(uri=f'{BASE_URI}domain/ResearchProblemQID'))
-        values2 = project.values.filter(snapshot=None, attribute=Attribute.objects.get(uri=f'{BASE_URI}domain/ResearchProblemName'))
+        values1, values2 = projectValues(project, [
+            f'{BASE_URI}domain/ResearchProblemQID',
+            f'{BASE_URI}domain/ResearchProblemName'])
 
         for value1 in values1: 
             if value1.text:
@@ -381,9 +352,7 @@ class RelatedResearchProblem(Provider):
             if value2.text:
                 dic.update({value2.text: {'id': idx}})
 
-        options.extend([{'id': f"{dic[key]['id']} <|> {key}", 'text': key } for key in dic if search.lower() in key.lower()])
-
-        options = sorted(options, key=lambda option: option['text'])
+        options = MathModDBRelatedProvider(search, 'RP', dic)
 
         return options
 
@@ -391,9 +360,10 @@ class ResearchFieldWithUserAddition(Provider):
 
         def get_options(self, project, search=None, user=None, site=None):
 
-            values1 = project.values.filter(snapshot=None, attribute=Attribute.objects.get(uri=f'{BASE_URI}domain/ResearchFieldQID'))
-            values2 = project.values.filter(snapshot=None, attribute=Attribute.objects.get(uri=f'{BASE_URI}domain/ResearchFieldName'))
-            values3 = project.values.filter(snapshot=None, attribute=Attribute.objects.get(uri=f'{BASE_URI}domain/ResearchFieldMathModDBID'))
+            values1, values2, values3 = projectValues(project, [
+                f'{BASE_URI}domain/ResearchFieldQID',
+                f'{BASE_URI}domain/ResearchFieldName',
+                f'{BASE_URI}domain/ResearchFieldMathModDBID'])
 
             options = []
 
@@ -421,19 +391,12 @@ class RelatedMathematicalModel(Provider):
         if not search:
             return []
         
-        # Fetch mathematical models from the MathModDB knowledge graph
-        results = queryMathModDB(queryProvider['MM'])
-        
-        # Extract options from the knowledge graph
         dic = {}
-        options = []
-        
-        for result in results:
-            dic.update({result['label']['value']:{'id':result['answer']['value']}})
 
         # Fetch user-defined research fields from the project
-        values1 = project.values.filter(snapshot=None, attribute=Attribute.objects.get(uri=f'{BASE_URI}domain/MathematicalModelQID'))
-        values2 = project.values.filter(snapshot=None, attribute=Attribute.objects.get(uri=f'{BASE_URI}domain/MathematicalModelName'))
+        values1, values2 = projectValues(project, [
+            f'{BASE_URI}domain/MathematicalModelQID',
+            f'{BASE_URI}domain/MathematicalModelName'])
 
         for value1 in values1: 
             if value1.text:
@@ -444,9 +407,7 @@ class RelatedMathematicalModel(Provider):
             if value2.text:
                 dic.update({value2.text: {'id': idx}})
 
-        options.extend([{'id': f"{dic[key]['id']} <|> {key}", 'text': key } for key in dic if search.lower() in key.lower()])
-
-        options = sorted(options, key=lambda option: option['text'])
+        options = MathModDBRelatedProvider(search, 'MM', dic)
         
         return options
 
@@ -456,9 +417,10 @@ class MathematicalModelWithUserAddition(Provider):
 
         options = []
         
-        values1 = project.values.filter(snapshot=None, attribute=Attribute.objects.get(uri=f'{BASE_URI}domain/MathematicalModelMathModDBID'))
-        values2 = project.values.filter(snapshot=None, attribute=Attribute.objects.get(uri=f'{BASE_URI}domain/MathematicalModelQID'))
-        values3 = project.values.filter(snapshot=None, attribute=Attribute.objects.get(uri=f'{BASE_URI}domain/MathematicalModelName'))
+        values1, values2, values3 = projectValues(project, [
+            f'{BASE_URI}domain/MathematicalModelMathModDBID',
+            f'{BASE_URI}domain/MathematicalModelQID',
+            f'{BASE_URI}domain/MathematicalModelName'])
 
         for idx, value1 in enumerate(values1):
             if value1.text and value1.text != 'not in MathModDB':
@@ -480,7 +442,7 @@ class QuantityOrQuantityKind(Provider):
 
     def get_options(self, project, search, user=None, site=None):
 
-        options = MathModDBProvider(search,queryProvider['QQK'])
+        options = MathModDBProvider(search,'QQK')
 
         return options
 
@@ -488,43 +450,36 @@ class RelatedQuantity(Provider):
 
     search = True
 
-    path = os.path.join(os.path.dirname(__file__), 'data', 'mathmoddb.json')
-
-    with open(path, "r") as json_file:
-        mathmoddb = json.load(json_file)
-
     def get_options(self, project, search=None, user=None, site=None):
 
+        mathmoddb = loadData('mathmoddb')
+
         if not search:
             return []
 
-        # Fetch quantities from th MathModDB knowledge graph
-        results = queryMathModDB(queryProvider['Q'])
-        
-        # Extract options from the knowledge graph
         dic = {}
-        options = []
-        
-        for result in results:
-            dic.update({result['label']['value']:{'id':result['answer']['value']}})
 
-        values1 = project.values.filter(snapshot=None, attribute=Attribute.objects.get(uri=f'{BASE_URI}domain/IsQuantityOrQuantityKind'))
-        values2 = project.values.filter(snapshot=None, attribute=Attribute.objects.get(uri=f'{BASE_URI}domain/QuantityOrQuantityKindQID'))
-        values3 = project.values.filter(snapshot=None, attribute=Attribute.objects.get(uri=f'{BASE_URI}domain/QuantityOrQuantityKindName'))
+        values1, values2, values3 = projectValues(project, [
+            f'{BASE_URI}domain/IsQuantityOrQuantityKind',
+            f'{BASE_URI}domain/QuantityOrQuantityKindQID',
+            f'{BASE_URI}domain/QuantityOrQuantityKindName'])
+
+        # Join Values by Set Index
+        option = getOption(mathmoddb['QuantityClass'])
+        values2 = groupValues(values2, 'set_index')
+        values3 = groupValues(values3, 'set_index')
 
         for value1 in values1:
-            if value1.option == Option.objects.get(uri=self.mathmoddb['QuantityClass']):
-                for value2 in values2: 
-                    if value2.text and value1.set_index == value2.set_index:
+            if value1.option_id == option.id:
+                for _, value2 in values2.get(value1.set_index, []): 
+                    if value2.text:
                         Id, name, quote = value2.external_id.split(' <|> ')
                         dic.update({name: {'id': Id}})
-                for idx, value3 in enumerate(values3): 
-                    if value3.text and value1.set_index == value3.set_index:
+                for idx, value3 in values3.get(value1.set_index, []): 
+                    if value3.text:
                         dic.update({value3.text: {'id': idx}})
 
-        options.extend([{'id': f"{dic[key]['id']} <|> {key}", 'text': key } for key in dic if search.lower() in key.lower()])
-
-        options = sorted(options, key=lambda option: option['text'])
+        options = MathModDBRelatedProvider(search, 'Q', dic)
         
         return options
 
@@ -532,43 +487,36 @@ class RelatedQuantityKind(Provider):
 
     search =True
 
-    path = os.path.join(os.path.dirname(__file__), 'data', 'mathmoddb.json')
-
-    with open(path, "r") as json_file:
-        mathmoddb = json.load(json_file)
-
     def get_options(self, project, search=None, user=None, site=None):
 
+        mathmoddb = loadData('mathmoddb')
+
         if not search:
             return []
 
-        # Fetch quantities from th MathModDB knowledge graph
-        results = queryMathModDB(queryProvider['QK'])
-
-        # Extract options from the knowledge graph
         dic = {}
-        options = []
-        
-        for result in results:
-            dic.update({result['label']['value']:{'id':result['answer']['value']}})
 
-        values1 = project.values.filter(snapshot=None, attribute=Attribute.objects.get(uri=f'{BASE_URI}domain/IsQuantityOrQuantityKind'))
-        values2 = project.values.filter(snapshot=None, attribute=Attribute.objects.get(uri=f'{BASE_URI}domain/QuantityOrQuantityKindQID'))
-        values3 = project.values.filter(snapshot=None, attribute=Attribute.objects.get(uri=f'{BASE_URI}domain/QuantityOrQuantityKindName'))
+        values1, values2, values3 = projectValues(project, [
+            f'{BASE_URI}domain/IsQuantityOrQuantityKind',
+            f'{BASE_URI}domain/QuantityOrQuantityKindQID',
+            f'{BASE_URI}domain/QuantityOrQuantityKindName'])
+
+        # Join Values by Set Index
+        option = getOption(mathmoddb['QuantityKindClass'])
+        values2 = groupValues(values2, 'set_index')
+        values3 = groupValues(values3, 'set_index')
 
         for value1 in values1:
-            if value1.option == Option.objects.get(uri=self.mathmoddb['QuantityKindClass']):
-                for value2 in values2: 
-                    if value2.text and value1.set_index == value2.set_index:
+            if value1.option_id == option.id:
+                for _, value2 in values2.get(value1.set_index, []): 
+                    if value2.text:
                         Id, name, quote = value2.external_id.split(' <|> ')
                         dic.update({name: {'id': Id}})
-                for idx, value3 in enumerate(values3): 
-                    if value3.text and value1.set_index == value3.set_index:
+                for idx, value3 in values3.get(value1.set_index, []): 
+                    if value3.text:
                         dic.update({value3.text: {'id': idx}})
 
-        options.extend([{'id': f"{dic[key]['id']} <|> {key}", 'text': key } for key in dic if search.lower() in key.lower()])
-
-        options = sorted(options, key=lambda option: option['text'])
+        options = MathModDBRelatedProvider(search, 'QK', dic)
         
         return options
 
@@ -578,7 +526,7 @@ class MathematicalFormulation(Provider):
 
     def get_options(self, project, search=None, user=None, site=None):
 
-        options = MathModDBProvider(search,queryProvider['MF'])
+        options = MathModDBProvider(search,'MF')
         
         return options
 
@@ -591,19 +539,12 @@ class MathematicalFormulationWithUserAddition(Provider):
         if not search:
             return []
 
-        # Fetch mathematical models from the MathModDB knowledge graph
-        results = queryMathModDB(queryProvider['MF'])
-        
-        # Extract options from the knowledge graph
         dic = {}
-        options = []
-        
-        for result in results:
-            dic.update({result['label']['value']:{'id':result['answer']['value']}})
 
         # Fetch user-defined mathematical formulations from the project
-        values1 = project.values.filter(snapshot=None, attribute=Attribute.objects.get(uri=f'{BASE_URI}domain/MathematicalFormulationQID'))
-        values2 = project.values.filter(snapshot=None, attribute=Attribute.objects.get(uri=f'{BASE_URI}domain/MathematicalFormulationName'))
+        values1, values2 = projectValues(project, [
+            f'{BASE_URI}domain/MathematicalFormulationQID',
+            f'{BASE_URI}domain/MathematicalFormulationName'])
 
         for value1 in values1: 
             if value1.text:
@@ -614,25 +555,21 @@ class MathematicalFormulationWithUserAddition(Provider):
             if value2.text:
                 dic.update({value2.text: {'id': idx}})
 
-        options.extend([{'id': f"{dic[key]['id']} <|> {key}", 'text': key } for key in dic if search.lower() in key.lower()])
-
-        options = sorted(options, key=lambda option: option['text'])
+        options = MathModDBRelatedProvider(search, 'MF', dic)
 
         return options
 
 class QuantityOrQuantityKindWithUserAddition(Provider):
 
-    path = os.path.join(os.path.dirname(__file__), 'data', 'mathmoddb.json')
-
-    with open(path, "r") as json_file:
-        mathmoddb = json.load(json_file)
-
     def get_options(self, project, search=None, user=None, site=None):
 
-        values1 = project.values.filter(snapshot=None, attribute=Attribute.objects.get(uri=f'{BASE_URI}domain/QuantityOrQuantityKindMathModDBID'))
-        values2 = project.values.filter(snapshot=None, attribute=Attribute.objects.get(uri=f'{BASE_URI}domain/QuantityOrQuantityKindQID'))
-        values3 = project.values.filter(snapshot=None, attribute=Attribute.objects.get(uri=f'{BASE_URI}domain/QuantityOrQuantityKindName'))
-        values4 = project.values.filter(snapshot=None, attribute=Attribute.objects.get(uri=f'{BASE_URI}domain/IsQuantityOrQuantityKind'))
+        mathmoddb = loadData('mathmoddb')
+
+        values1, values2, values3, values4 = projectValues(project, [
+            f'{BASE_URI}domain/QuantityOrQuantityKindMathModDBID',
+            f'{BASE_URI}domain/QuantityOrQuantityKindQID',
+            f'{BASE_URI}domain/QuantityOrQuantityKindName',
+            f'{BASE_URI}domain/IsQuantityOrQuantityKind'])
 
         options = []
 
@@ -640,22 +577,28 @@ class QuantityOrQuantityKindWithUserAddition(Provider):
             if value1.text and value1.text != 'not in MathModDB':
                 options.extend([{'id': value1.external_id, 'text': value1.text}])
 
+        # Join Values by Set Prefix
+        quantity = getOption(mathmoddb['QuantityClass'])
+        quantityKind = getOption(mathmoddb['QuantityKindClass'])
+        values2 = groupValues(values2, 'set_prefix')
+        values3 = groupValues(values3, 'set_prefix')
+
         for idx, value4 in enumerate(values4):
-            if value4.option == Option.objects.get(uri=self.mathmoddb['QuantityClass']):
-                for idx, value2 in enumerate(values2):
-                    if value2.text and value4.set_prefix == value2.set_prefix:
+            if value4.option_id == quantity.id:
+                for idx, value2 in values2.get(value4.set_prefix, []):
+                    if value2.text:
                         Id,label,quote = value2.external_id.split(' <|> ')
                         options.extend([{'id': f"{Id} <|> {label} <|> Quantity", 'text': f"{label} (Quantity)"}])
-                for idx, value3 in enumerate(values3):
-                    if value3.text and value4.set_prefix == value3.set_prefix:
+                for idx, value3 in values3.get(value4.set_prefix, []):
+                    if value3.text:
                         options.extend([{'id': f"{idx} <|> {value3.text} <|> Quantity", 'text': f"{value3.text} (Quantity)"}])
-            elif value4.option == Option.objects.get(uri=self.mathmoddb['QuantityKindClass']):
-                for idx, value2 in enumerate(values2):
-                    if value2.text and value4.set_prefix == value2.set_prefix:
+            elif value4.option_id == quantityKind.id:
+                for idx, value2 in values2.get(value4.set_prefix, []):
+                    if value2.text:
                         Id,label,quote = value2.external_id.split(' <|> ')
                         options.extend([{'id': f"{Id} <|> {label} <|> QuantityKind", 'text': f"{label} (Quantity Kind)"}])
-                for idx, value3 in enumerate(values3):
-                    if value3.text and value4.set_prefix == value3.set_prefix:
+                for idx, value3 in values3.get(value4.set_prefix, []):
+                    if value3.text:
                         options.extend([{'id': f"{idx} <|> {value3.text} <|> QuantityKind", 'text': f"{value3.text} (Quantity Kind)"}])
 
         # Sort user options by text
@@ -669,9 +612,10 @@ class WorkflowTask(Provider):
 
         options = []
 
-        values1 = project.values.filter(snapshot=None, attribute=Attribute.objects.get(uri=f'{BASE_URI}domain/TaskMathModDBID'))
-        values2 = project.values.filter(snapshot=None, attribute=Attribute.objects.get(uri=f'{BASE_URI}domain/TaskQID'))
-        values3 = project.values.filter(snapshot=None, attribute=Attribute.objects.get(uri=f'{BASE_URI}domain/TaskName'))
+        values1, values2, values3 = projectValues(project, [
+            f'{BASE_URI}domain/TaskMathModDBID',
+            f'{BASE_URI}domain/TaskQID',
+            f'{BASE_URI}domain/TaskName'])
 
         for value1 in values1:
             if value1.text and value1.text != 'not in MathModDB':
@@ -694,7 +638,7 @@ class Task(Provider):
 
     def get_options(self, project, search=None, user=None, site=None):
 
-        options = MathModDBProvider(search,queryProvider['T'])
+        options = MathModDBProvider(search,'T')
         
         return options
 
@@ -707,19 +651,12 @@ class RelatedTask(Provider):
         if not search:
             return []
         
-        # Fetch mathematical models from the MathModDB knowledge graph
-        results = queryMathModDB(queryProvider['T'])
-        
-        # Extract options from the knowledge graph
         dic = {}
-        options = []
-        
-        for result in results:
-            dic.update({result['label']['value']:{'id':result['answer']['value']}})
 
         # Fetch user-defined research fields from the project
-        values1 = project.values.filter(snapshot=None, attribute=Attribute.objects.get(uri=f'{BASE_URI}domain/TaskQID'))
-        values2 = project.values.filter(snapshot=None, attribute=Attribute.objects.get(uri=f'{BASE_URI}domain/TaskName'))
+        values1, values2 = projectValues(project, [
+            f'{BASE_URI}domain/TaskQID',
+            f'{BASE_URI}domain/TaskName'])
 
         for value1 in values1: 
             if value1.text:
@@ -730,41 +667,38 @@ class RelatedTask(Provider):
             if value2.text:
                 dic.update({value2.text: {'id': idx}})
 
-        options.extend([{'id': f"{dic[key]['id']} <|> {key}", 'text': key } for key in dic if search.lower() in key.lower()])
-
-        options = sorted(options, key=lambda option: option['text'])
+        options = MathModDBRelatedProvider(search, 'T', dic)
 
         return options
 
 class AllEntities(Provider):
 
-    path = os.path.join(os.path.dirname(__file__), 'data', 'mathmoddb.json')
+    def get_options(self, project, search=None, user=None, site=None):
 
-    with open(path, "r") as json_file:
-        mathmoddb = json.load(json_file)
+        mathmoddb = loadData('mathmoddb')
 
-    def get_options(self, project, search=None, user=None, site=None):
         options =[]
 
-        values1 = project.values.filter(snapshot=None, attribute=Attribute.objects.get(uri=f'{BASE_URI}domain/ResearchFieldMathModDBID'))
-        values2 = project.values.filter(snapshot=None, attribute=Attribute.objects.get(uri=f'{BASE_URI}domain/ResearchFieldQID'))
-        values3 = project.values.filter(snapshot=None, attribute=Attribute.objects.get(uri=f'{BASE_URI}domain/ResearchFieldName'))
-        values4 = project.values.filter(snapshot=None, attribute=Attribute.objects.get(uri=f'{BASE_URI}domain/ResearchProblemMathModDBID'))
-        values5 = project.values.filter(snapshot=None, attribute=Attribute.objects.get(uri=f'{BASE_URI}domain/ResearchProblemQID'))
-        values6 = project.values.filter(snapshot=None, attribute=Attribute.objects.get(uri=f'{BASE_URI}domain/ResearchProblemName'))
-        values9 = project.values.filter(snapshot=None, attribute=Attribute.objects.get(uri=f'{BASE_URI}domain/MathematicalModelMathModDBID'))
-        values10 = project.values.filter(snapshot=None, attribute=Attribute.objects.get(uri=f'{BASE_URI}domain/MathematicalModelQID'))
-        values11 = project.values.filter(snapshot=None, attribute=Attribute.objects.get(uri=f'{BASE_URI}domain/MathematicalModelName'))
-        values12 = project.values.filter(snapshot=None, attribute=Attribute.objects.get(uri=f'{BASE_URI}domain/QuantityOrQuantityKindMathModDBID'))
-        values13 = project.values.filter(snapshot=None, attribute=Attribute.objects.get(uri=f'{BASE_URI}domain/QuantityOrQuantityKindQID'))
-        values14 = project.values.filter(snapshot=None, attribute=Attribute.objects.get(uri=f'{BASE_URI}domain/QuantityOrQuantityKindName'))
-        values15 = project.values.filter(snapshot=None, attribute=Attribute.objects.get(uri=f'{BASE_URI}domain/MathematicalFormulationMathModDBID'))
-        values16 = project.values.filter(snapshot=None, attribute=Attribute.objects.get(uri=f'{BASE_URI}domain/MathematicalFormulationQID'))
-        values17 = project.values.filter(snapshot=None, attribute=Attribute.objects.get(uri=f'{BASE_URI}domain/MathematicalFormulationName'))
-        values18 = project.values.filter(snapshot=None, attribute=Attribute.objects.get(uri=f'{BASE_URI}domain/TaskMathModDBID'))
-        values19 = project.values.filter(snapshot=None, attribute=Attribute.objects.get(uri=f'{BASE_URI}domain/TaskQID'))
-        values20 = project.values.filter(snapshot=None, attribute=Attribute.objects.get(uri=f'{BASE_URI}domain/TaskName'))
-        values21 = project.values.filter(snapshot=None, attribute=Attribute.objects.get(uri=f'{BASE_URI}domain/IsQuantityOrQuantityKind'))
+        values1, values2, values3, values4, values5, values6, values9, values10, values11, values12, values13, values14, values15, values16, values17, values18, values19, values20, values21 = projectValues(project, [
+            f'{BASE_URI}domain/ResearchFieldMathModDBID',
+            f'{BASE_URI}domain/ResearchFieldQID',
+            f'{BASE_URI}domain/ResearchFieldName',
+            f'{BASE_URI}domain/ResearchProblemMathModDBID',
+            f'{BASE_URI}domain/ResearchProblemQID',
+            f'{BASE_URI}domain/ResearchProblemName',
+            f'{BASE_URI}domain/MathematicalModelMathModDBID',
+            f'{BASE_URI}domain/MathematicalModelQID',
+            f'{BASE_URI}domain/MathematicalModelName',
+            f'{BASE_URI}domain/QuantityOrQuantityKindMathModDBID',
+            f'{BASE_URI}domain/QuantityOrQuantityKindQID',
+            f'{BASE_URI}domain/QuantityOrQuantityKindName',
+            f'{BASE_URI}domain/MathematicalFormulationMathModDBID',
+            f'{BASE_URI}domain/MathematicalFormulationQID',
+            f'{BASE_URI}domain/MathematicalFormulationName',
+            f'{BASE_URI}domain/TaskMathModDBID',
+            f'{BASE_URI}domain/TaskQID',
+            f'{BASE_URI}domain/TaskName',
+            f'{BASE_URI}domain/IsQuantityOrQuantityKind'])
 
         for idx, value1 in enumerate(values1):
             if value1.text and value1.text != 'not in MathModDB':
@@ -800,22 +734,27 @@ class AllEntities(Provider):
                     options.append({'id':f"{Id} <|> {label} <|> Quantity <|> QQK",'text':f"{label} (Quantity)"})
                 elif qqk == 'QuantityKind':
                     options.append({'id':f"{Id} <|> {label} <|> QuantityKind <|> QQK",'text':f"{label} (Quantity Kind)"})    
+        # Join Quantity Values by Set Prefix
+        quantity = getOption(mathmoddb['QuantityClass'])
+        quantityKind = getOption(mathmoddb['QuantityKindClass'])
+        values13 = groupValues(values13, 'set_prefix')
+        values14 = groupValues(values14, 'set_prefix')
         for idx, value21 in enumerate(values21):
-            if value21.option == Option.objects.get(uri=self.mathmoddb['QuantityClass']):
-                for idx, value13 in enumerate(values13):
-                    if value13.text and value21.set_prefix == value13.set_prefix:
+            if value21.option_id == quantity.id:
+                for idx, value13 in values13.get(value21.set_prefix, []):
+                    if value13.text:
                         Id,label,quote = value13.external_id.split(' <|> ')
                         options.append({'id': f"{' <|> '.join(value13.external_id.split(' <|>')[:2])} <|> Quantity <|> QQK",'text': f"{label} (Quantity)"})
-                for idx, value14 in enumerate(values14):
-                    if value14.text and value21.set_prefix == value14.set_prefix:
+                for idx, value14 in values14.get(value21.set_prefix, []):
+                    if value14.text:
                         options.append({'id': f"QQK{str(idx+1)} <|> {value14.text} <|> Quantity <|> QQK",'text': f"{value14.text} (Quantity)"})
-            elif value21.option == Option.objects.get(uri=self.mathmoddb['QuantityKindClass']):
-                for idx, value13 in enumerate(values13):
-                    if value13.text and value21.set_prefix == value13.set_prefix:
+            elif value21.option_id == quantityKind.id:
+                for idx, value13 in values13.get(value21.set_prefix, []):
+                    if value13.text:
                         Id,label,quote = value13.external_id.split(' <|> ')
                         options.append({'id': f"{' <|> '.join(value13.external_id.split(' <|>')[:2])} <|> QuantityKind <|> QQK",'text': f"{label} (Quantity Kind)"})
-                for idx, value14 in enumerate(values14):
-                    if value14.text and value21.set_prefix == value14.set_prefix:
+                for idx, value14 in values14.get(value21.set_prefix, []):
+                    if value14.text:
                         options.append({'id': f"QQK{str(idx+1)} <|> {value14.text} <|> QuantityKind <|> QQK",'text': f"{value14.text} (Quantity Kind)"})
         for idx, value15 in enumerate(values15):
             if value15.text and value15.text != 'not in MathModDB':
@@ -841,15 +780,29 @@ class AllEntities(Provider):
 
 def query_api(api_url, search_term):
     '''Function to query an API and return the JSON response.'''
-    response = requests.get(api_url, params={
-        'action': 'wbsearchentities',
-        'format': 'json',
-        'language': 'en',
-        'type': 'item',
-        'limit': 10,
+    return entitySearch.search(api_url, search_term, retries=0)
+
+def wikichip_search(search_term):
+    '''Function to query WikiChip opensearch and return (label, url) pairs.'''
+    response = client.get(ProcessorProvider.api_url, params={
+        'action': 'opensearch',
         'search': search_term
-    }, headers={'User-Agent': 'MaRDMO_0.1 (https://zib.de; reidelbach@zib.de)'})
-    return response.json().get('search', [])
+        }, headers={'User-Agent': 'MaRDMO_0.1 (https://zib.de; reidelbach@zib.de)'}, retries=0).json()
+    return list(zip(response[1], response[-1]))
+
+def match_entity(result, search_term):
+    '''Function to check if a wbsearchentities result matches a (longer) search term.'''
+    texts = [result.get('match', {}).get('text', ''), result.get('label', '')] + result.get('aliases', [])
+    return any(search_term in text.lower() for text in texts)
+
+def searchUser(user):
+    '''Key of the user, whose newer searches supersede older ones.'''
+    return getattr(user, 'pk', None)
+
+# Coalesced Autocomplete Searches (wbsearchentities returns up to 10, opensearch up to 10 results)
+mardiSearch = SearchCoalescer(lambda search: query_api(mardi_api, search), 10, match_entity)
+wikidataSearch = SearchCoalescer(lambda search: query_api(wikidata_api, search), 10, match_entity)
+processorSearch = SearchCoalescer(wikichip_search, 10, lambda result, search: search in result[0].lower())
 
 def process_result(result, location):
     '''Function to process the result and return a dictionary with id, text, and description.'''
@@ -862,12 +815,20 @@ def process_result(result, location):
          'text': f"{result['display']['label']['value']} ({description})"
     }
 
+@lru_cache(maxsize=None)
+def mscIndex():
+    """
+    Load MSC2020 search index once per process (from sidecar file if available).
+    """
+    path = data_path('msc2020')
+    return MSCIndex.load(os.path.splitext(path)[0] + '.idx', path)
+
 def get_attribute(uri):
     """
     Retrieve attribute object based on URI.
     """
     try:
-        return Attribute.objects.get(uri=uri)
+        return getAttribute(uri)
     except Attribute.DoesNotExist:
         return None
 
@@ -894,33 +855,35 @@ def add_options(options, values, start_index, process_text_fn=None):
             options.append({'id': f'Environment{index}', 'text': text})
     return options
 
-def MathModDBProvider(search,query):
+def MathModDBProvider(search,key):
     """
     Dynamic query of MathModDB, results as options for Provider.
     """
     if not search:
         return []
 
-    # Fetch results from the MathModDB knowledge graph
-    results = queryMathModDB(query)
-    
-    dic = {}
-    options = []
+    # Search (cached) results from the MathModDB knowledge graph, sorted by label
+    results = searchMathModDBListing(key, search)
     
-    # Store results in dict
-    for result in results:
-        if result.get('class',{}).get('value'):
-            if result['class']['value'].split('#')[1] == 'Quantity':
-                dic.update({f"{result['label']['value']} (Quantity)":{'id':f"{result['answer']['value']} <|> {result['label']['value']} <|> Quantity"}})
-            elif result['class']['value'].split('#')[1] == 'QuantityKind':
-                dic.update({f"{result['label']['value']} (Quantity Kind)":{'id':f"{result['answer']['value']} <|> {result['label']['value']} <|> QuantityKind"}})
-        else:
-            dic.update({result['label']['value']:{'id':result['answer']['value']}})
-
-    # Filter results by user-defined search
-    options.extend([{'id': f"{dic[key]['id']} <|> {key}" if len(dic[key]['id'].split(' <|> ')) == 1 else dic[key]['id'], 'text': key } for key in dic if search.lower() in key.lower()])
+    options = [{'id': f"{Id} <|> {label}" if len(Id.split(' <|> ')) == 1 else Id, 'text': label} for label, Id in results]
 
     # Add 'not in MathModDB' option
-    options = [{'id': 'not in MathModDB', 'text': 'not in MathModDB'}] + sorted(options, key=lambda option: option['text'])
+    options = [{'id': 'not in MathModDB', 'text': 'not in MathModDB'}] + options
 
     return options
+
+def MathModDBRelatedProvider(search, key, dic):
+    """
+    Dynamic query of MathModDB merged with user-defined entities, results as options for Provider.
+    """
+    # Search (cached) results from the MathModDB knowledge graph, sorted by label
+    results = {label: {'id': Id} for label, Id in searchMathModDBListing(key, search)}
+
+    # Filter user-defined entities by search, these overwrite results with identical label
+    user = {label: dic[label] for label in dic if search.lower() in label.lower()}
+    results.update(user)
+
+    # Results are only unsorted if user-defined entities were added
+    labels = sorted(results) if user else results
+
+    return [{'id': f"{results[label]['id']} <|> {label}", 'text': label} for label in labels]
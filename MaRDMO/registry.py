@@ -0,0 +1,28 @@
+import os
+import json
+
+from functools import lru_cache
+from types import MappingProxyType
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), 'data')
+
+def data_path(name):
+    '''Get Path of packaged Data File name (without extension)'''
+    return os.path.join(DATA_DIR, f'{name}.json')
+
+@lru_cache(maxsize=None)
+def loadData(name):
+    '''Load packaged JSON Data File once per Process.
+
+       The parsed Data is shared by all Callers and therefore returned frozen,
+       dicts become read-only Mappings and lists become tuples.'''
+    with open(data_path(name), 'r') as json_file:
+        return freeze(json.load(json_file))
+
+def freeze(obj):
+    '''Recursively convert parsed JSON into read-only Structures'''
+    if isinstance(obj, dict):
+        return MappingProxyType({key: freeze(value) for key, value in obj.items()})
+    if isinstance(obj, list):
+        return tuple(freeze(value) for value in obj)
+    return obj
@@ -0,0 +1,146 @@
+import csv
+import re
+
+from .config import sparql_results_format
+
+# Media Types of SPARQL SELECT Results
+RESULT_TYPES = {'json': 'application/sparql-results+json',
+                'tsv': 'text/tab-separated-values',
+                'csv': 'text/csv'}
+
+CHUNK_SIZE = 1 << 16
+
+# Escapes in TSV Literals (Turtle String Escapes)
+ESCAPE = re.compile(r'\\(u[0-9A-Fa-f]{4}|U[0-9A-Fa-f]{8}|.)')
+ESCAPES = {'t': '\t', 'n': '\n', 'r': '\r', 'b': '\b', 'f': '\f'}
+
+class Row(tuple):
+    '''Result Row as Tuple of Values (None if unbound) in Order of the Variables.
+
+       Serves the Bindings Interface of sparql-results+json as well, i.e.
+       row['var']['value'] and row.get('var',{}).get('value'), so Consumers
+       work on both. Row Classes of a Result are made by rowType.'''
+
+    __slots__ = ()
+    variables = ()
+    index = {}
+
+    def value(self, var, default=None):
+        '''Get Value of var, default if unbound'''
+        idx = self.index.get(var)
+        value = tuple.__getitem__(self, idx) if idx is not None else None
+        return default if value is None else value
+
+    def get(self, var, default=None):
+        value = self.value(var)
+        return default if value is None else {'value': value}
+
+    def keys(self):
+        return [var for var, value in zip(self.variables, self) if value is not None]
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            value = self.value(key)
+            if value is None:
+                raise KeyError(key)
+            return {'value': value}
+        return tuple.__getitem__(self, key)
+
+    def __contains__(self, var):
+        return self.value(var) is not None
+
+    def __repr__(self):
+        return f"Row({', '.join(f'{var}={value!r}' for var, value in zip(self.variables, self) if value is not None)})"
+
+def rowType(variables):
+    '''Get Row Class for the Variables of a Result'''
+    variables = tuple(variables)
+    return type('Row', (Row,), {'__slots__': (), 'variables': variables, 'index': {var: idx for idx, var in enumerate(variables)}})
+
+def accept():
+    '''Get Accept Header for SPARQL SELECT Results in sparql_results_format'''
+    return RESULT_TYPES.get(sparql_results_format, RESULT_TYPES['json'])
+
+def rows(response):
+    '''Iterate Rows of SPARQL SELECT Response.
+
+       TSV and CSV Results are parsed line by line while they are read (pass
+       stream=True to the Request), JSON Results (Endpoints ignoring the Accept
+       Header) as a whole, their Bindings are returned as they are.'''
+    content_type = response.headers.get('Content-Type', '')
+    parser = parsers.get(content_type.split(';')[0].strip().lower())
+    if parser is None:
+        return iter(response.json().get('results',{}).get('bindings',[]))
+    if 'charset' not in content_type.lower():
+        # SPARQL TSV and CSV Results are UTF-8
+        response.encoding = 'utf-8'
+    return parser(response)
+
+def chunks(response):
+    '''Iterate decoded Text of response'''
+    if hasattr(response, 'iter_content'):
+        return response.iter_content(chunk_size=CHUNK_SIZE, decode_unicode=True)
+    # httpx Responses are read already
+    return [response.text]
+
+def lines(chunks, keepends=False):
+    '''Split Text into Lines at \\n only, Literals may hold other Line Separators'''
+    rest = ''
+    for chunk in chunks:
+        rest += chunk
+        *complete, rest = rest.split('\n')
+        for line in complete:
+            yield line + '\n' if keepends else line
+    if rest:
+        yield rest
+
+def parseTSV(response):
+    '''Iterate Rows of text/tab-separated-values Response'''
+    text = lines(chunks(response))
+    header = next(text, '').rstrip('\r')
+    if not header:
+        return
+    Row = rowType(var.lstrip('?$') for var in header.split('\t'))
+    width = len(Row.variables)
+    for line in text:
+        line = line.rstrip('\r')
+        if line:
+            values = [term(field) for field in line.split('\t')]
+            yield Row(values + [None] * (width - len(values)))
+
+def parseCSV(response):
+    '''Iterate Rows of text/csv Response, Literals lose Language and Datatype'''
+    reader = csv.reader(lines(chunks(response), keepends=True))
+    header = next(reader, None)
+    if not header:
+        return
+    Row = rowType(header)
+    width = len(Row.variables)
+    for values in reader:
+        if values:
+            yield Row([value or None for value in values] + [None] * (width - len(values)))
+
+def term(field):
+    '''Get Value of RDF Term in TSV Results, None if unbound'''
+    if not field:
+        return None
+    if field[0] == '<' and field[-1] == '>':
+        return field[1:-1]
+    if field[0] in '"\'':
+        quote = field[0] * 3 if field.startswith(field[0] * 3) and len(field) >= 6 else field[0]
+        end = field.rfind(quote)
+        if end >= len(quote):
+            value = field[len(quote):end]
+            return ESCAPE.sub(unescape, value) if '\\' in value else value
+    if field.startswith('_:'):
+        return field[2:]
+    # Numbers and Booleans may be written without Quotes and Datatype
+    return field
+
+def unescape(match):
+    escape = match.group(1)
+    if escape[0] in 'uU' and len(escape) > 1:
+        return chr(int(escape[1:], 16))
+    return ESCAPES.get(escape, escape)
+
+parsers = {RESULT_TYPES['tsv']: parseTSV, RESULT_TYPES['csv']: parseCSV}
@@ -0,0 +1,162 @@
+import atexit
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+
+from . import client
+from .cache import TTLCache
+from .config import search_workers, search_timeout, search_cache_ttl, entity_cache_ttl, entity_cache_negative_ttl, entity_cache_size
+
+# Executor for upstream Requests, separate from pool.executor since Searches may run there and wait for upstream
+executor = ThreadPoolExecutor(max_workers=search_workers, thread_name_prefix='MaRDMO-search')
+
+@atexit.register
+def shutdown():
+    executor.shutdown(wait=False, cancel_futures=True)
+
+class SearchCoalescer:
+    '''Coalesces Autocomplete Searches against an upstream Service.
+
+       Identical concurrent Searches share one upstream Request (single-flight).
+       Results of a Search which did not hit the upstream limit are complete, so
+       they answer longer Search Terms with the same Prefix by local filtering
+       (a Result for "navier-sto" answers "navier-stok"). Searches are coalesced
+       and cached case-insensitively, upstream gets the Term as entered. A Search
+       waits on an Event, set once the upstream Request completes or the same User
+       starts a newer Search, which abandons it.'''
+
+    def __init__(self, fetch, limit, match, ttl=search_cache_ttl, maxsize=256, minimum=3):
+        self.fetch = fetch
+        self.limit = limit
+        self.match = match
+        self.minimum = minimum
+        self._results = TTLCache(ttl=ttl, maxsize=maxsize)
+        self._inflight = {}
+        self._latest = {}
+        self._lock = threading.Lock()
+
+    def search(self, term, user=None):
+        '''Get upstream Results for term, [] if abandoned or not answered within search_timeout'''
+        term = term.strip()
+        key = term.lower()
+        token = self._supersede(user)
+        try:
+            results = self._cached(key)
+            if results is not None:
+                return results
+
+            with self._lock:
+                future = self._inflight.get(key)
+                if future is None:
+                    future = executor.submit(self._load, key, term)
+                    self._inflight[key] = future
+
+            wake = token if token is not None else threading.Event()
+            future.add_done_callback(lambda future: wake.set())
+            wake.wait(search_timeout)
+            if not future.done():
+                # Timed out or superseded, the upstream Request continues in the Background and fills the Cache
+                return []
+            try:
+                return future.result()
+            except Exception:
+                return []
+        finally:
+            self._release(user, token)
+
+    def _load(self, key, term):
+        try:
+            results = self.fetch(term)
+            self._results.set(key, (results, len(results) < self.limit))
+            return results
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def _cached(self, term):
+        entry = self._results.get(term)
+        if entry is not None:
+            return entry[0]
+        # Reuse complete Results of a Prefix
+        for end in range(len(term) - 1, self.minimum - 1, -1):
+            entry = self._results.get(term[:end])
+            if entry is not None and entry[1]:
+                return [result for result in entry[0] if self.match(result, term)]
+        return None
+
+    def _supersede(self, user):
+        if user is None:
+            return None
+        token = threading.Event()
+        with self._lock:
+            previous = self._latest.get(user)
+            self._latest[user] = token
+        if previous is not None:
+            # Wake the older Search of the User, which is abandoned
+            previous.set()
+        return token
+
+    def _release(self, user, token):
+        # Keep Users only while their latest Search runs
+        if user is None:
+            return
+        with self._lock:
+            if self._latest.get(user) is token:
+                del self._latest[user]
+
+class EntitySearch:
+    '''Shared wbsearchentities Lookups with LRU + TTL Cache.
+
+       Lookups are keyed by (api, language, search term, limit). Empty Results are
+       cached as well, but only for a shorter Time, since new Entities may appear.
+       Hits and Misses are counted for Monitoring.'''
+
+    def __init__(self, ttl, negative_ttl, maxsize):
+        self._results = TTLCache(ttl=ttl, maxsize=maxsize)
+        self._empty = TTLCache(ttl=negative_ttl, maxsize=maxsize)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def search(self, api, search, language='en', limit=10, retries=None):
+        '''Get wbsearchentities Results for search term (retries=0 for interactive Callers)'''
+        if not search:
+            return []
+        key = (api, language, search, limit)
+        results = self._results.get(key)
+        if results is None:
+            results = self._empty.get(key)
+        with self._lock:
+            if results is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        if results is not None:
+            return results
+
+        response = client.get(api, params={
+            'action': 'wbsearchentities',
+            'format': 'json',
+            'language': language,
+            'type': 'item',
+            'limit': limit,
+            'search': search
+        }, retries=retries)
+        results = response.json().get('search', [])
+        if response.status_code == 200:
+            (self._results if results else self._empty).set(key, results)
+        return results
+
+    def invalidate(self, api=None, search=None):
+        '''Drop cached Lookups of api and / or search term (all if none given), e.g. after creating an Entity'''
+        def matches(key):
+            return (api is None or key[0] == api) and (search is None or key[2] == search)
+        self._results.invalidate_if(matches)
+        self._empty.invalidate_if(matches)
+
+    def stats(self):
+        '''Get Hit / Miss Counters'''
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses}
+
+entitySearch = EntitySearch(entity_cache_ttl, entity_cache_negative_ttl, entity_cache_size)
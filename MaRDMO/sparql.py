@@ -1,4 +1,4 @@
-from .config import wd, wdt 
+from .config import wd, wdt, mathmoddb_query_shape
 
 #SPARQL Query Base and components for Workflow Search
 
@@ -48,6 +48,47 @@ LIMIT {2}'''
 mini='''
 PREFIX wdt:'''+wdt+''' PREFIX wd:'''+wd+wini
 
+#SPARQL Query to resolve Items by English Label and Description (one VALUES row per Item)
+
+items_query = '''
+PREFIX wd:'''+wd+'''
+SELECT ?label ?description ?qid
+WHERE {{
+VALUES (?label ?description) {{
+{0}
+}}
+?item rdfs:label ?label;
+      schema:description ?description.
+BIND(STRAFTER(STR(?item),STR(wd:)) AS ?qid).
+}}'''
+
+items_row = '({0}@en {1}@en)'
+
+subgraph_query = '''PREFIX : <https://mardi4nfdi.de/mathmoddb#>
+PREFIX rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#>
+PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
+CONSTRUCT {{ ?s ?p ?o. ?o rdfs:label ?ol. ?o a ?oc. }}
+WHERE {{
+       {{ SELECT DISTINCT ?s WHERE {{ {0} }} }}
+       ?s ?p ?o.
+       OPTIONAL {{ ?o rdfs:label ?ol. }}
+       OPTIONAL {{ ?o a ?oc. }}
+      }}'''
+
+def subgraph(ids, depth):
+    '''CONSTRUCT Query for the Statements about ids and all Entities less than depth Relations away,
+       plus Labels and Types of the Entities they point to'''
+    branches = []
+    for level in range(depth):
+        path = ''.join(f'?x{no} ?p{no} ?x{no+1}. FILTER (isIRI(?x{no+1}) && ?p{no} != rdf:type) ' for no in range(level))
+        branches.append(f'{{ VALUES ?x0 {{{ids}}} {path}BIND(?x{level} AS ?s) }}')
+    return subgraph_query.format(' UNION '.join(branches))
+
+def sparql_literal(text):
+    '''Quote text as SPARQL String Literal'''
+    text = str(text).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n').replace('\r', '\\r').replace('\t', '\\t')
+    return f'"{text}"'
+
 #SPARQL Query for additional entities
 
 pl_vars = '?qid ?label ?quote'
@@ -176,6 +217,114 @@ queryPublication = {
 
 ### SPARQL queries to get additional information from MathModDB during export
 
+def documentationRelation(subject, name, prop, var):
+    '''Relation of a Class Query to labelled Entities, concatenated as "ID >|< Label"'''
+    return (name,
+            f"?{subject} :{prop} ?{var}. ?{var} rdfs:label ?{var}L. FILTER (lang(?{var}L) = 'en')",
+            f'CONCAT(STR(?{var}), " >|< ", STR(?{var}L))')
+
+def flagDocumentation(subject):
+    '''Description and Properties of a Mathematical Model or Formulation: (Variables, Pattern)'''
+    return (['quote', 'isLinear', 'isNotLinear', 'isConvex', 'isNotConvex', 'isDynamic', 'isStatic', 'isDeterministic', 'isStochastic',
+             'isDimensionless', 'isDimensional', 'isTimeContinuous', 'isTimeDiscrete', 'isTimeIndependent', 'isSpaceContinuous', 'isSpaceDiscrete', 'isSpaceIndependent'],
+            f'''OPTIONAL {{ ?{subject} rdfs:comment ?quote.
+                            FILTER (lang(?quote) = 'en')}}
+                OPTIONAL {{ ?{subject} :isLinear ?isLinear.
+                            BIND(IF(?isLinear = false, true, false) AS ?isNotLinear)}}
+                OPTIONAL {{ ?{subject} :isConvex ?isConvex.
+                            BIND(IF(?isConvex = false, true, false) AS ?isNotConvex)}}
+                OPTIONAL {{ ?{subject} :isDynamic ?isDynamic.
+                            BIND(IF(?isDynamic = false, true, false) AS ?isStatic)}}
+                OPTIONAL {{ ?{subject} :isDeterministic ?isDeterministic.
+                            BIND(IF(?isDeterministic = false, true, false) AS ?isStochastic)}}
+                OPTIONAL {{ ?{subject} :isDimensionless ?isDimensionless.
+                            BIND(IF(?isDimensionless = false, true, false) AS ?isDimensional)}}
+                OPTIONAL {{ ?{subject} :isTimeContinuous ?isTimeContinuous.
+                            BIND(IF(BOUND(?isTimeContinuous) && ?isTimeContinuous = false, true, false) AS ?isTimeDiscrete)}}
+                BIND(IF(!BOUND(?isTimeContinuous), true, false) AS ?isTimeIndependent)
+                OPTIONAL {{ ?{subject} :isSpaceContinuous ?isSpaceContinuous.
+                            BIND(IF(BOUND(?isSpaceContinuous) && ?isSpaceContinuous = false, true, false) AS ?isSpaceDiscrete)}}
+                BIND(IF(!BOUND(?isSpaceContinuous), true, false) AS ?isSpaceIndependent)''')
+
+taskDocumentation = (['subclass', 'quote', 'isLinear', 'isNotLinear'],
+                     '''OPTIONAL { ?sclass rdfs:subClassOf :Task.
+                                  ?Task a ?sclass .
+                                  BIND(STRAFTER(STR(?sclass), "#") AS ?subclass)}
+                      OPTIONAL { ?Task rdfs:comment ?quote.
+                                  FILTER (lang(?quote) = 'en')}
+                      OPTIONAL { ?Task :isLinear ?isLinear.
+                                  BIND(IF(?isLinear = false, true, false) AS ?isNotLinear)}''')
+
+containedRelations = [('containsFormulation', 'f'), ('containsAssumption', 'a'), ('containsBoundaryCondition', 'bc'), ('containsConstraintCondition', 'cc'),
+                      ('containsCouplingCondition', 'cpc'), ('containsInitialCondition', 'ic'), ('containsFinalCondition', 'fc')]
+
+modelDocumentationRelations = ([documentationRelation('MathematicalModel', 'models', 'models', 'p')]
+                               + [documentationRelation('MathematicalModel', prop, prop, var) for prop, var in containedRelations]
+                               + [documentationRelation('MathematicalModel', 'containsModel', 'containsModel', 'cmm'),
+                                  documentationRelation('MathematicalModel', 'AppliedByTask', 'appliedByTask', 'ta')])
+
+formulationDocumentationRelations = ([documentationRelation('MathematicalFormulation', prop, prop, var) for prop, var in containedRelations]
+                                     + [('formula_elements', '?MathematicalFormulation :inDefiningFormulation ?elements.', 'STR(?elements)'),
+                                        ('formula', '?MathematicalFormulation :definingFormulation ?formulas.', 'STR(?formulas)'),
+                                        ('ContainsQuantity',
+                                         """?MathematicalFormulation :containsQuantity ?qID.
+                                            ?qID rdfs:label ?qL;
+                                                 a ?qc.
+                                            FILTER (?qc IN (:Quantity, :QuantityKind))
+                                            FILTER (lang(?qL) = 'en')
+                                            BIND(STRAFTER(STR(?qc), "#") AS ?qC)""",
+                                         'CONCAT(STR(?qID), " >|< ", STR(?qL), " >|< ", STR(?qC))')])
+
+taskDocumentationRelations = ([documentationRelation('Task', 'appliesModel', 'appliesModel', 'mm')]
+                              + [documentationRelation('Task', prop, prop, var) for prop, var in containedRelations]
+                              + [documentationRelation('Task', prop, prop, var) for prop, var in [('containsTask', 'ct'), ('containedInTask', 'ict'), ('containsInput', 'in'),
+                                                                                                 ('containsOutput', 'o'), ('containsObjective', 'ob'),
+                                                                                                 ('containsParameter', 'pa'), ('containsConstant', 'co')]])
+
+def documentationQuery(subject, scalars, relations, shape):
+    '''queryModelDocumentation Query for Class subject, its IDs inserted via format.
+
+       scalars are (Variables, Pattern) of single-valued Information, relations
+       (Variable, Pattern, Value) of Relations concatenated with " <|> ". The
+       shape decides how the Relations are matched:
+         optional  - one OPTIONAL per Relation, the Endpoint groups the Cartesian Product of all Relations
+         union     - one Sub-SELECT with a UNION Branch per Relation, grouped by Relation, the Endpoint groups their Sum
+         subselect - one Sub-SELECT per Relation, each aggregated on its own'''
+    variables = ' '.join(f'?{variable}' for variable in scalars[0])
+    values = f'VALUES ?{subject} {{\x00}}'
+    group = f'GROUP BY ?{subject} {variables}'
+    if shape == 'subselect':
+        select = [f'(COALESCE(?{name}Values, "") AS ?{name})' for name, _, _ in relations]
+        where = [f'''OPTIONAL {{ SELECT ?{subject} (GROUP_CONCAT(DISTINCT({value}); separator=" <|> ") AS ?{name}Values)
+                           WHERE {{ {values}
+                                   {pattern} }}
+                           GROUP BY ?{subject} }}''' for name, pattern, value in relations]
+        group = ''
+    elif shape == 'union':
+        # Each Relation yields one Row with its concatenated Values, which is picked by MAX (other Rows give "")
+        select = [f'(MAX(IF(BOUND(?relation) && ?relation = "{name}", ?values, "")) AS ?{name})' for name, _, _ in relations]
+        branches = '\n                                   UNION '.join(f'{{ {pattern}\n                                     BIND("{name}" AS ?relation) BIND({value} AS ?value) }}' for name, pattern, value in relations)
+        where = [f'''OPTIONAL {{ SELECT ?{subject} ?relation (GROUP_CONCAT(DISTINCT(?value); separator=" <|> ") AS ?values)
+                           WHERE {{ {values}
+                                   {branches} }}
+                           GROUP BY ?{subject} ?relation }}''']
+    else:
+        select = [f'(GROUP_CONCAT(DISTINCT({value}); separator=" <|> ") AS ?{name})' for name, _, value in relations]
+        where = [f'OPTIONAL {{ {pattern} }}' for _, pattern, _ in relations]
+    query = '\n'.join(['PREFIX : <https://mardi4nfdi.de/mathmoddb#>',
+                       'PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>',
+                       '',
+                       f'SELECT {"DISTINCT " if shape == "subselect" else ""}?{subject} {variables}',
+                       *(f'       {aggregate}' for aggregate in select),
+                       'WHERE {',
+                       f'       {values}',
+                       *(f'       {line.strip()}' for line in scalars[1].splitlines()),
+                       *(f'       {pattern}' for pattern in where),
+                       '      }',
+                       group])
+    # Escape Braces for format, IDs are inserted at the Marker
+    return query.replace('{', '{{').replace('}', '}}').replace('\x00', '{0}')
+
 queryModelDocumentation = {
     
                   'IDCheck': '''PREFIX : <https://mardi4nfdi.de/mathmoddb#>
@@ -331,85 +480,8 @@ queryModelDocumentation = {
                                         GROUP BY ?q ?qlabel ?MathematicalFormulation ?label ?quote ?isLinear ?isNotLinear ?isConvex ?isNotConvex ?isDynamic ?isStatic ?isDeterministic ?isStochastic 
                                                  ?isDimensionless ?isDimensional ?isTimeContinuous ?isTimeDiscrete ?isTimeIndependent ?isSpaceContinuous ?isSpaceDiscrete ?isSpaceIndependent''',
                                     
-                  'Task': '''PREFIX : <https://mardi4nfdi.de/mathmoddb#>
-                                 PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
-                  
-                                 SELECT ?Task ?subclass ?quote ?isLinear ?isNotLinear
-                                        (GROUP_CONCAT(DISTINCT(CONCAT(STR(?mm), " >|< ", STR(?mmL))); separator=" <|> ") AS ?appliesModel)
-                                        (GROUP_CONCAT(DISTINCT(CONCAT(STR(?f), " >|< ", STR(?fL))); separator=" <|> ") AS ?containsFormulation)
-                                        (GROUP_CONCAT(DISTINCT(CONCAT(STR(?a), " >|< ", STR(?aL))); separator=" <|> ") AS ?containsAssumption)
-                                        (GROUP_CONCAT(DISTINCT(CONCAT(STR(?bc), " >|< ", STR(?bcL))); separator=" <|> ") AS ?containsBoundaryCondition)
-                                        (GROUP_CONCAT(DISTINCT(CONCAT(STR(?cc), " >|< ", STR(?ccL))); separator=" <|> ") AS ?containsConstraintCondition)
-                                        (GROUP_CONCAT(DISTINCT(CONCAT(STR(?cpc), " >|< ", STR(?cpcL))); separator=" <|> ") AS ?containsCouplingCondition)
-                                        (GROUP_CONCAT(DISTINCT(CONCAT(STR(?ic), " >|< ", STR(?icL))); separator=" <|> ") AS ?containsInitialCondition)
-                                        (GROUP_CONCAT(DISTINCT(CONCAT(STR(?fc), " >|< ", STR(?fcL))); separator=" <|> ") AS ?containsFinalCondition)
-                                        (GROUP_CONCAT(DISTINCT(CONCAT(STR(?ct), " >|< ", STR(?ctL))); separator=" <|> ") AS ?containsTask)
-                                        (GROUP_CONCAT(DISTINCT(CONCAT(STR(?ict), " >|< ", STR(?ictL))); separator=" <|> ") AS ?containedInTask)
-                                        (GROUP_CONCAT(DISTINCT(CONCAT(STR(?in), " >|< ", STR(?inL))); separator=" <|> ") AS ?containsInput)
-                                        (GROUP_CONCAT(DISTINCT(CONCAT(STR(?o), " >|< ", STR(?oL))); separator=" <|> ") AS ?containsOutput)
-                                        (GROUP_CONCAT(DISTINCT(CONCAT(STR(?ob), " >|< ", STR(?obL))); separator=" <|> ") AS ?containsObjective)
-                                        (GROUP_CONCAT(DISTINCT(CONCAT(STR(?pa), " >|< ", STR(?paL))); separator=" <|> ") AS ?containsParameter)
-                                        (GROUP_CONCAT(DISTINCT(CONCAT(STR(?co), " >|< ", STR(?coL))); separator=" <|> ") AS ?containsConstant)
-                                        
-                                 WHERE {{
-                                        VALUES ?Task {{{0}}}
-                  
-                                        OPTIONAL {{ ?sclass rdfs:subClassOf :Task.
-                                                    ?Task a ?sclass .
-                                                    BIND(STRAFTER(STR(?sclass), "#") AS ?subclass)}}
-                                        OPTIONAL {{ ?Task rdfs:comment ?quote.
-                                                    FILTER (lang(?quote) = 'en')}}
-                                        OPTIONAL {{ ?Task :isLinear ?isLinear.
-                                                    BIND(IF(?isLinear = false, true, false) AS ?isNotLinear)}}
-                                        OPTIONAL {{ ?Task :appliesModel ?mm. 
-                                                    ?mm rdfs:label ?mmL.
-                                                    FILTER (lang(?mmL) = 'en')}}
-                                        OPTIONAL {{ ?Task :containsFormulation ?f. 
-                                                    ?f rdfs:label ?fL.
-                                                    FILTER (lang(?fL) = 'en')}}
-                                        OPTIONAL {{ ?Task :containsAssumption ?a. 
-                                                    ?a rdfs:label ?aL.
-                                                    FILTER (lang(?aL) = 'en')}}
-                                       OPTIONAL {{ ?Task :containsBoundaryCondition ?bc. 
-                                                    ?bc rdfs:label ?bcL.
-                                                    FILTER (lang(?bcL) = 'en')}}
-                                        OPTIONAL {{ ?Task :containsConstraintCondition ?cc. 
-                                                    ?cc rdfs:label ?ccL.
-                                                    FILTER (lang(?ccL) = 'en')}}
-                                        OPTIONAL {{ ?Task :containsCouplingCondition ?cpc. 
-                                                    ?cpc rdfs:label ?cpcL.
-                                                    FILTER (lang(?cpcL) = 'en')}}
-                                        OPTIONAL {{ ?Task :containsInitialCondition ?ic. 
-                                                    ?ic rdfs:label ?icL.
-                                                    FILTER (lang(?icL) = 'en')}}
-                                        OPTIONAL {{ ?Task :containsFinalCondition ?fc. 
-                                                    ?fc rdfs:label ?fcL.
-                                                    FILTER (lang(?fcL) = 'en')}}
-                                        OPTIONAL {{ ?Task :containsTask ?ct. 
-                                                    ?ct rdfs:label ?ctL.
-                                                    FILTER (lang(?ctL) = 'en')}}
-                                        OPTIONAL {{ ?Task :containedInTask ?ict. 
-                                                    ?ict rdfs:label ?ictL.
-                                                    FILTER (lang(?ictL) = 'en')}}
-                                        OPTIONAL {{ ?Task :containsInput ?in.
-                                                    ?in rdfs:label ?inL.
-                                                    FILTER (lang(?inL) = 'en')}}
-                                        OPTIONAL {{ ?Task :containsOutput ?o.
-                                                    ?o rdfs:label ?oL.   
-                                                    FILTER (lang(?oL) = 'en')}}
-                                        OPTIONAL {{ ?Task :containsObjective ?ob.
-                                                    ?ob rdfs:label ?obL.
-                                                    FILTER (lang(?obL) = 'en')}}
-                                        OPTIONAL {{ ?Task :containsParameter ?pa.
-                                                    ?pa rdfs:label ?paL.
-                                                    FILTER (lang(?paL) = 'en')}}
-                                        OPTIONAL {{ ?Task :containsConstant ?co.
-                                                    ?co rdfs:label ?coL.
-                                                    FILTER (lang(?coL) = 'en')}}
-                                       }}
-                  
-                                 GROUP BY ?Task ?subclass ?quote ?isLinear ?isNotLinear''',
-                  
+                  'Task': documentationQuery('Task', taskDocumentation, taskDocumentationRelations, mathmoddb_query_shape),
+
                   'IntraClass': '''PREFIX : <https://mardi4nfdi.de/mathmoddb#>
                                         PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
                   
@@ -524,160 +596,10 @@ queryModelDocumentation = {
                   
                                   GROUP BY ?t ?tc ?tC ?TC''',
                 
-                  'MathematicalModel': '''PREFIX : <https://mardi4nfdi.de/mathmoddb#>
-                                 PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
-                  
-                                 SELECT ?MathematicalModel ?quote ?isLinear ?isNotLinear ?isConvex ?isNotConvex ?isDynamic ?isStatic ?isDeterministic ?isStochastic 
-                                        ?isDimensionless ?isDimensional ?isTimeContinuous ?isTimeDiscrete ?isTimeIndependent ?isSpaceContinuous ?isSpaceDiscrete ?isSpaceIndependent 
-                                        (GROUP_CONCAT(DISTINCT(CONCAT(STR(?p), " >|< ", STR(?pL))); separator=" <|> ") AS ?models)
-                                        (GROUP_CONCAT(DISTINCT(CONCAT(STR(?f), " >|< ", STR(?fL))); separator=" <|> ") AS ?containsFormulation)
-                                        (GROUP_CONCAT(DISTINCT(CONCAT(STR(?a), " >|< ", STR(?aL))); separator=" <|> ") AS ?containsAssumption)
-                                        (GROUP_CONCAT(DISTINCT(CONCAT(STR(?bc), " >|< ", STR(?bcL))); separator=" <|> ") AS ?containsBoundaryCondition)
-                                        (GROUP_CONCAT(DISTINCT(CONCAT(STR(?cc), " >|< ", STR(?ccL))); separator=" <|> ") AS ?containsConstraintCondition)
-                                        (GROUP_CONCAT(DISTINCT(CONCAT(STR(?cpc), " >|< ", STR(?cpcL))); separator=" <|> ") AS ?containsCouplingCondition)
-                                        (GROUP_CONCAT(DISTINCT(CONCAT(STR(?ic), " >|< ", STR(?icL))); separator=" <|> ") AS ?containsInitialCondition)
-                                        (GROUP_CONCAT(DISTINCT(CONCAT(STR(?fc), " >|< ", STR(?fcL))); separator=" <|> ") AS ?containsFinalCondition)
-                                        (GROUP_CONCAT(DISTINCT(CONCAT(STR(?cmm), " >|< ", STR(?cmmL))); separator=" <|> ") AS ?containsModel)
-                                        (GROUP_CONCAT(DISTINCT(CONCAT(STR(?ta), " >|< ", STR(?taL))); separator=" <|> ") AS ?AppliedByTask)
-                  
-                                 WHERE {{
-                                        
-                                        VALUES ?MathematicalModel {{{0}}}
-                                        
-                                        OPTIONAL {{ ?MathematicalModel rdfs:comment ?quote.
-                                                    FILTER (lang(?quote) = 'en')}}
-                                        
-                                        OPTIONAL {{ ?MathematicalModel :isLinear ?isLinear.
-                                                    BIND(IF(?isLinear = false, true, false) AS ?isNotLinear)}}
-                                        OPTIONAL {{ ?MathematicalModel :isConvex ?isConvex.
-                                                    BIND(IF(?isConvex = false, true, false) AS ?isNotConvex)}}  
-                                        OPTIONAL {{ ?MathematicalModel :isDynamic ?isDynamic.
-                                                    BIND(IF(?isDynamic = false, true, false) AS ?isStatic)}}                             
-                                        OPTIONAL {{ ?MathematicalModel :isDeterministic ?isDeterministic.
-                                                    BIND(IF(?isDeterministic = false, true, false) AS ?isStochastic)}}
-                          		     OPTIONAL {{ ?MathematicalModel :isDimensionless ?isDimensionless.
-                                                    BIND(IF(?isDimensionless = false, true, false) AS ?isDimensional)}}
-                                        OPTIONAL {{ ?MathematicalModel :isTimeContinuous ?isTimeContinuous.
-                                                    BIND(IF(BOUND(?isTimeContinuous) && ?isTimeContinuous = false, true, false) AS ?isTimeDiscrete)}}
-                                                    BIND(IF(!BOUND(?isTimeContinuous), true, false) AS ?isTimeIndependent)
-                                        OPTIONAL {{ ?MathematicalModel :isSpaceContinuous ?isSpaceContinuous.
-                                                    BIND(IF(BOUND(?isSpaceContinuous) && ?isSpaceContinuous = false, true, false) AS ?isSpaceDiscrete)}}
-                                                    BIND(IF(!BOUND(?isSpaceContinuous), true, false) AS ?isSpaceIndependent)
-                                        
-                                        OPTIONAL {{ ?MathematicalModel :models ?p.
-                                                    ?p rdfs:label ?pL.
-                                                    Filter (lang(?pL) = 'en')}}
-                                        
-                                        OPTIONAL {{ ?MathematicalModel :containsFormulation ?f. 
-                                                    ?f rdfs:label ?fL.
-                                                    FILTER (lang(?fL) = 'en')}}
-                                        OPTIONAL {{ ?MathematicalModel :containsAssumption ?a. 
-                                                    ?a rdfs:label ?aL.
-                                                    FILTER (lang(?aL) = 'en')}}
-                                        OPTIONAL {{ ?MathematicalModel :containsBoundaryCondition ?bc. 
-                                                    ?bc rdfs:label ?bcL.
-                                                    FILTER (lang(?bcL) = 'en')}}
-                                        OPTIONAL {{ ?MathematicalModel :containsConstraintCondition ?cc. 
-                                                    ?cc rdfs:label ?ccL.
-                                                    FILTER (lang(?ccL) = 'en')}}
-                                        OPTIONAL {{ ?MathematicalModel :containsCouplingCondition ?cpc. 
-                                                    ?cpc rdfs:label ?cpcL.
-                                                    FILTER (lang(?cpcL) = 'en')}}
-                                        OPTIONAL {{ ?MathematicalModel :containsInitialCondition ?ic. 
-                                                    ?ic rdfs:label ?icL.
-                                                    FILTER (lang(?icL) = 'en')}}
-                                        OPTIONAL {{ ?MathematicalModel :containsFinalCondition ?fc. 
-                                                    ?fc rdfs:label ?fcL.
-                                                    FILTER (lang(?fcL) = 'en')}}
-                  
-                                        OPTIONAL {{ ?MathematicalModel :containsModel ?cmm. 
-                                                    ?cmm rdfs:label ?cmmL.
-                                                    FILTER (lang(?cmmL) = 'en')}}
-                                        OPTIONAL {{ ?MathematicalModel :appliedByTask ?ta.
-                                                    ?ta rdfs:label ?taL.
-                                                    FILTER (lang(?taL) = 'en')}}
-                                       }}
-                  
-                                 GROUP BY ?MathematicalModel ?quote ?isLinear ?isNotLinear ?isConvex ?isNotConvex ?isDynamic ?isStatic ?isDeterministic ?isStochastic ?isDimensionless 
-                                          ?isDimensional ?isTimeContinuous ?isTimeDiscrete ?isTimeIndependent ?isSpaceContinuous ?isSpaceDiscrete ?isSpaceIndependent 
-                                          ''',               
-                  
-                  'MathematicalFormulation': '''PREFIX : <https://mardi4nfdi.de/mathmoddb#>
-                                 PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
-                  
-                                 SELECT ?MathematicalFormulation ?quote ?isLinear ?isNotLinear ?isConvex ?isNotConvex ?isDynamic ?isStatic ?isDeterministic ?isStochastic 
-                                        ?isDimensionless ?isDimensional ?isTimeContinuous ?isTimeDiscrete ?isTimeIndependent ?isSpaceContinuous ?isSpaceDiscrete ?isSpaceIndependent
-                                        (GROUP_CONCAT(DISTINCT(CONCAT(STR(?f), " >|< ", STR(?fL))); separator=" <|> ") AS ?containsFormulation)
-                                        (GROUP_CONCAT(DISTINCT(CONCAT(STR(?a), " >|< ", STR(?aL))); separator=" <|> ") AS ?containsAssumption)
-                                        (GROUP_CONCAT(DISTINCT(CONCAT(STR(?bc), " >|< ", STR(?bcL))); separator=" <|> ") AS ?containsBoundaryCondition)
-                                        (GROUP_CONCAT(DISTINCT(CONCAT(STR(?cc), " >|< ", STR(?ccL))); separator=" <|> ") AS ?containsConstraintCondition)
-                                        (GROUP_CONCAT(DISTINCT(CONCAT(STR(?cpc), " >|< ", STR(?cpcL))); separator=" <|> ") AS ?containsCouplingCondition)
-                                        (GROUP_CONCAT(DISTINCT(CONCAT(STR(?ic), " >|< ", STR(?icL))); separator=" <|> ") AS ?containsInitialCondition)
-                                        (GROUP_CONCAT(DISTINCT(CONCAT(STR(?fc), " >|< ", STR(?fcL))); separator=" <|> ") AS ?containsFinalCondition)
-                                        (GROUP_CONCAT(DISTINCT(?elements); separator=" <|> ") AS ?formula_elements) (GROUP_CONCAT(DISTINCT(?formulas); separator=" <|> ") AS ?formula)
-                                        (GROUP_CONCAT(DISTINCT(CONCAT(STR(?qID), " >|< ", STR(?qL), " >|< ", STR(?qC))); separator=" <|> ") AS ?ContainsQuantity)
-                  
-                                 WHERE {{
-                                        
-                                        VALUES ?MathematicalFormulation {{{0}}}
-                  
-                                        OPTIONAL {{ ?MathematicalFormulation rdfs:comment ?quote.
-                                                    FILTER (lang(?quote) = 'en')}}
-                  
-                                        OPTIONAL {{ ?MathematicalFormulation :isLinear ?isLinear.
-                                                    BIND(IF(?isLinear = false, true, false) AS ?isNotLinear)}}
-                                        OPTIONAL {{ ?MathematicalFormulation :isConvex ?isConvex.
-                                                    BIND(IF(?isConvex = false, true, false) AS ?isNotConvex)}}  
-                                        OPTIONAL {{ ?MathematicalFormulation :isDynamic ?isDynamic.
-                                                    BIND(IF(?isDynamic = false, true, false) AS ?isStatic)}}                             
-                                        OPTIONAL {{ ?MathematicalFormulation :isDeterministic ?isDeterministic.
-                                                    BIND(IF(?isDeterministic = false, true, false) AS ?isStochastic)}}
-                          		          OPTIONAL {{ ?MathematicalFormulation :isDimensionless ?isDimensionless.
-                                                    BIND(IF(?isDimensionless = false, true, false) AS ?isDimensional)}}
-                                        OPTIONAL {{ ?MathematicalFormulation :isTimeContinuous ?isTimeContinuous.
-                                                    BIND(IF(BOUND(?isTimeContinuous) && ?isTimeContinuous = false, true, false) AS ?isTimeDiscrete)}}
-                                                    BIND(IF(!BOUND(?isTimeContinuous), true, false) AS ?isTimeIndependent)
-                                        OPTIONAL {{ ?MathematicalFormulation :isSpaceContinuous ?isSpaceContinuous.
-                                                    BIND(IF(BOUND(?isSpaceContinuous) && ?isSpaceContinuous = false, true, false) AS ?isSpaceDiscrete)}}
-                                                    BIND(IF(!BOUND(?isSpaceContinuous), true, false) AS ?isSpaceIndependent)
+                  'MathematicalModel': documentationQuery('MathematicalModel', flagDocumentation('MathematicalModel'), modelDocumentationRelations, mathmoddb_query_shape),
+
+                  'MathematicalFormulation': documentationQuery('MathematicalFormulation', flagDocumentation('MathematicalFormulation'), formulationDocumentationRelations, mathmoddb_query_shape),
 
-                                        OPTIONAL {{ ?MathematicalFormulation :containsFormulation ?f.
-                                                    ?f rdfs:label ?fL.
-                                                    FILTER (lang(?fL) = 'en')}}
-                                        OPTIONAL {{ ?MathematicalFormulation :containsAssumption ?a.
-                                                    ?a rdfs:label ?aL.
-                                                    FILTER (lang(?aL) = 'en')}}
-                                        OPTIONAL {{ ?MathematicalFormulation :containsBoundaryCondition ?bc.
-                                                    ?bc rdfs:label ?bcL.
-                                                    FILTER (lang(?bcL) = 'en')}}
-                                        OPTIONAL {{ ?MathematicalFormulation :containsConstraintCondition ?cc.
-                                                    ?cc rdfs:label ?ccL.
-                                                    FILTER (lang(?ccL) = 'en')}}
-                                        OPTIONAL {{ ?MathematicalFormulation :containsCouplingCondition ?cpc.
-                                                    ?cpc rdfs:label ?cpcL.
-                                                    FILTER (lang(?cpcL) = 'en')}}
-                                        OPTIONAL {{ ?MathematicalFormulation :containsInitialCondition ?ic.
-                                                    ?ic rdfs:label ?icL.
-                                                    FILTER (lang(?icL) = 'en')}}
-                                        OPTIONAL {{ ?MathematicalFormulation :containsFinalCondition ?fc.
-                                                    ?fc rdfs:label ?fcL.
-                                                    FILTER (lang(?fcL) = 'en')}}
-                  
-                                        OPTIONAL {{ ?MathematicalFormulation :definingFormulation ?formulas.}}
-                                        OPTIONAL {{ ?MathematicalFormulation :inDefiningFormulation ?elements.}}
-                  
-                                        OPTIONAL {{ ?MathematicalFormulation :containsQuantity ?qID.
-                                                    ?qID rdfs:label ?qL;
-                                                                a ?qc.
-                                                    FILTER (?qc IN (:Quantity, :QuantityKind))
-                                                    FILTER (lang(?qL) = 'en')
-                                                    BIND(STRAFTER(STR(?qc), "#") AS ?qC)}}
-                  
-                                        }}
-                  
-                                        GROUP BY ?MathematicalFormulation ?quote ?isLinear ?isNotLinear ?isConvex ?isNotConvex ?isDynamic ?isStatic ?isDeterministic ?isStochastic ?isDimensionless 
-                                                 ?isDimensional ?isTimeContinuous ?isTimeDiscrete ?isTimeIndependent ?isSpaceContinuous ?isSpaceDiscrete ?isSpaceIndependent''',
-                  
                   'PublicationModel': '''PREFIX : <https://mardi4nfdi.de/mathmoddb#>
                                  PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
                   
@@ -850,6 +772,59 @@ queryProvider = {
                                 GROUP BY ?answer ?class ?label'''
                 }
 
+# Classes of the Entities listed by the queryProvider Class Listings
+listingClasses = {'RF': ['ResearchField'], 'RP': ['ResearchProblem'], 'MM': ['MathematicalModel'], 'MF': ['MathematicalFormulation'],
+                  'Q': ['Quantity'], 'QK': ['QuantityKind'], 'T': ['ComputationalTask'], 'P': ['Publication'], 'QQK': ['Quantity', 'QuantityKind']}
+
+# Class Listing restricted to Entities whose Option Text (Labels joined by " / ", Quantities and Quantity Kinds
+# suffixed by Class, see mathmoddb.listingEntries) contains a search Term, sorted by Label
+listingSearch = '''PREFIX : <https://mardi4nfdi.de/mathmoddb#>
+                    PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
+
+                    SELECT ?answer {variables}(GROUP_CONCAT(DISTINCT(?l); SEPARATOR=" / ") AS ?label)
+                    WHERE {{
+                            {classes}
+                            ?answer rdfs:label ?l .
+                            FILTER (lang(?l) = 'en')
+                          }}
+                    GROUP BY ?answer {variables}
+                    HAVING (CONTAINS(LCASE(CONCAT(GROUP_CONCAT(DISTINCT(?l); SEPARATOR=" / "){suffix})), {search}))
+                    ORDER BY ?label
+                    LIMIT {limit}'''
+
+def listing_search(key, search, limit):
+    '''Query for the Entities of Class Listing key whose Option Text contains search (case-insensitive), at most limit'''
+    classes = listingClasses[key]
+    if len(classes) == 1:
+        return listingSearch.format(variables='', classes=f'?answer a :{classes[0]} .', suffix='', search=sparql_literal(search.lower()), limit=limit)
+    union = ' UNION '.join(f'{{ ?answer a :{Class} . BIND(:{Class} AS ?class) }}' for Class in classes)
+    suffix = ', IF(?class = :Quantity, " (Quantity)", " (Quantity Kind)")'
+    return listingSearch.format(variables='?class ', classes=union, suffix=suffix, search=sparql_literal(search.lower()), limit=limit)
+
+# Highest Number N of the mardmo<N> IRIs of Entities added by MaRDMO (high-water Mark of the Class Listings)
+listingMark = '''PREFIX xsd: <http://www.w3.org/2001/XMLSchema#>
+
+                  SELECT (MAX(?number) AS ?mark)
+                  WHERE {
+                          ?id ?p ?o.
+                          FILTER (STRSTARTS(STR(?id), "https://mardi4nfdi.de/mathmoddb#mardmo"))
+                          BIND (xsd:integer(SUBSTR(STR(?id), STRLEN("https://mardi4nfdi.de/mathmoddb#mardmo") + 1)) AS ?number)
+                        }'''
+
+# Entities among given MathModDB IRIs with their Classes and Labels (Delta of the Class Listings)
+listingDelta = '''PREFIX : <https://mardi4nfdi.de/mathmoddb#>
+                   PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
+
+                   SELECT ?answer ?class (GROUP_CONCAT(DISTINCT(?l); SEPARATOR=" / ") AS ?label)
+                   WHERE {{
+                           VALUES ?answer {{{0}}}
+                           FILTER EXISTS {{ ?answer ?p ?o }}
+                           OPTIONAL {{ ?answer a ?class. }}
+                           OPTIONAL {{ ?answer rdfs:label ?l.
+                                       FILTER (lang(?l) = 'en') }}
+                         }}
+                   GROUP BY ?answer ?class'''
+
 queryModelHandler = {
     
        'All':   '''PREFIX : <https://mardi4nfdi.de/mathmoddb#>
@@ -0,0 +1,7 @@
+from django.urls import path
+
+from . import views
+
+urlpatterns = [
+    path('projects/<int:project_id>/jobs/', views.job_status, name='mardmo_job_status'),
+]
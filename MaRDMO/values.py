@@ -0,0 +1,146 @@
+from django.db import connections, transaction
+from django.db.models.signals import post_save
+from django.utils.timezone import now
+
+from rdmo.domain.models import Attribute
+from rdmo.options.models import Option
+from rdmo.projects.models import Value
+
+from . import catalog
+
+class ValueWriter:
+    '''Collects Value Upserts of a Project and writes them in bulk.
+
+       Each add() corresponds to a former Value.objects.update_or_create call: the
+       Value of the Attribute is looked up by the given indexes, updated if present
+       and created otherwise. flush() resolves all Attributes and Options (from the
+       Catalog Cache or with one Query each), writes all Values with bulk_create /
+       bulk_update in a single Transaction and sends post_save for each written
+       Value, so that Handlers depending on these Values still fire.'''
+
+    def __init__(self, project):
+        self.project = project
+        self.pending = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.flush()
+
+    def add(self, uri, text=None, external_id=None, option=None, collection_index=None, set_index=None, set_prefix=None):
+        '''Queue Value of Attribute uri (Arguments as for valueEditor)'''
+        fields = {}
+        if text is not None:
+            fields['text'] = self.clean('text', text)
+        if external_id is not None:
+            fields['external_id'] = self.clean('external_id', external_id)
+        if option is not None:
+            # Options may be passed as Object or URI
+            fields['option'] = getattr(option, 'uri', option)
+        self.pending.append((uri, self.lookup(collection_index, set_index, set_prefix), fields))
+
+    def flush(self):
+        '''Write all queued Values'''
+        if not self.pending:
+            return
+        pending, self.pending = self.pending, []
+
+        # Resolve Attributes and Options
+        attributes = catalog.attributes.get_many({uri for uri, _, _ in pending})
+        options = catalog.options.get_many({fields['option'] for _, _, fields in pending if 'option' in fields})
+
+        # Get existing Values of these Attributes
+        existing = {}
+        for value in Value.objects.filter(project=self.project, snapshot=None, attribute__in=list(attributes.values())).order_by('id'):
+            existing.setdefault(value.attribute_id, []).append(value)
+
+        timestamp = now()
+        written = {}
+        updated_fields = {'updated'}
+        for uri, lookup, fields in pending:
+            attribute = attributes.get(uri)
+            if attribute is None:
+                raise Attribute.DoesNotExist(f'Attribute {uri} does not exist.')
+            if 'option' in fields:
+                if fields['option'] not in options:
+                    raise Option.DoesNotExist(f"Option {fields['option']} does not exist.")
+                fields = dict(fields, option=options[fields['option']])
+
+            candidates = existing.setdefault(attribute.id, [])
+            value = next((candidate for candidate in candidates if all(getattr(candidate, key) == val for key, val in lookup.items())), None)
+            if value is None:
+                value = Value(project=self.project, attribute=attribute, created=timestamp, **lookup)
+                candidates.append(value)
+                written[id(value)] = (value, True)
+            else:
+                value.attribute = attribute
+                written.setdefault(id(value), (value, False))
+                updated_fields.update(fields)
+
+            for key, val in fields.items():
+                setattr(value, key, val)
+            value.updated = timestamp
+
+        with transaction.atomic():
+            created = [value for value, new in written.values() if new]
+            Value.objects.bulk_create(created)
+            if created and not connections[Value.objects.db].features.can_return_rows_from_bulk_insert:
+                self.fetch_pks(created, timestamp)
+            if any(value.pk is None for value, _ in written.values()):
+                raise Value.DoesNotExist('Primary keys of created Values are unknown.')
+            Value.objects.bulk_update([value for value, new in written.values() if not new], list(updated_fields))
+            for value, created in written.values():
+                post_save.send(sender=Value, instance=value, created=created, update_fields=None, raw=False, using=Value.objects.db)
+
+    def fetch_pks(self, values, timestamp):
+        '''Set Primary Keys of values created in bulk, which Backends not returning
+           Rows from bulk Inserts (e.g. MySQL) leave unset, by the Fields identifying them'''
+        fields = ('attribute_id', 'set_prefix', 'set_index', 'collection_index')
+        keys = {tuple(getattr(value, field) for field in fields): value for value in values}
+        rows = Value.objects.filter(project=self.project, snapshot=None, created=timestamp, attribute_id__in={value.attribute_id for value in values}).order_by('pk')
+        for pk, *key in rows.values_list('pk', *fields):
+            if tuple(key) in keys:
+                keys[tuple(key)].pk = pk
+
+    @classmethod
+    def lookup(cls, collection_index, set_index, set_prefix):
+        '''Fields identifying the Value, as previously used by valueEditor'''
+        if collection_index is not None and set_index is not None and set_prefix is None:
+            lookup = {'collection_index': collection_index, 'set_index': set_index}
+        elif collection_index is not None and set_index is None and set_prefix is None:
+            lookup = {'collection_index': collection_index}
+        elif set_index is not None and collection_index is None and set_prefix is None:
+            lookup = {'set_index': set_index}
+        elif set_index is not None and collection_index is None and set_prefix is not None:
+            lookup = {'set_prefix': set_prefix, 'set_index': set_index}
+        else:
+            lookup = {}
+        return {key: cls.clean(key, val) for key, val in lookup.items()}
+
+    @staticmethod
+    def clean(field, value):
+        '''Convert value to the Python Type of the Value field, so that it compares like in the Database'''
+        return Value._meta.get_field(field).to_python(value)
+
+def projectValues(project, uris):
+    '''Get current Values of a Project for several Attributes with one Query.
+
+       Returns one list of Values per URI (in the order of uris), each ordered like
+       project.values.filter(snapshot=None, attribute=...) would be.'''
+    attributes = catalog.attributes.get_many(uris)
+    values = {attribute.id: [] for attribute in attributes.values()}
+    for value in project.values.filter(snapshot=None, attribute__in=list(attributes.values())):
+        values[value.attribute_id].append(value)
+    return [values[attributes[uri].id] if uri in attributes else [] for uri in uris]
+
+def groupValues(values, field):
+    '''Group Values by field (e.g. set_prefix, set_index) for joins between Attributes.
+
+       Returns dict field value -> list of (idx, value), idx being the position of
+       the Value in values.'''
+    groups = {}
+    for idx, value in enumerate(values):
+        groups.setdefault(getattr(value, field), []).append((idx, value))
+    return groups
@@ -0,0 +1,16 @@
+from django.contrib.auth.decorators import login_required
+from django.core.exceptions import PermissionDenied
+from django.http import JsonResponse
+from django.shortcuts import get_object_or_404
+
+from rdmo.projects.models import Project
+
+from . import jobs
+
+@login_required
+def job_status(request, project_id):
+    '''Number of queued, running and failed Jobs of a Project and the latest Errors, polled by the UI'''
+    project = get_object_or_404(Project, pk=project_id)
+    if not request.user.has_perm('projects.view_project_object', project):
+        raise PermissionDenied
+    return JsonResponse(jobs.status(project.pk))
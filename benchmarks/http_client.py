@@ -0,0 +1,113 @@
+'''Benchmark outbound HTTP: bare requests.get (previous calls) vs. MaRDMO.client against a local stand-in server.
+
+   Usage: python benchmarks/http_client.py [--number N] [--tls CERT KEY]
+
+   The server counts accepted connections (each one costs a TCP, with --tls also a
+   TLS handshake) and offers endpoints answering immediately (/ok), never within the
+   read timeout (/slow), with 503 + Retry-After (/busy) and with a huge Retry-After
+   (/limited). The client settings are read from MaRDMO.config (defaults without
+   Django).'''
+
+import argparse
+import os
+import ssl
+import sys
+import threading
+import time
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from MaRDMO import client
+from MaRDMO.config import http_read_timeout, http_max_delay, http_deadline
+
+connections = 0
+connectionsLock = threading.Lock()
+
+class Handler(BaseHTTPRequestHandler):
+
+    protocol_version = 'HTTP/1.1'
+    # Headers and Body are written separately, do not let Nagle delay the Body on kept-alive Connections
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        global connections
+        with connectionsLock:
+            connections += 1
+        super().setup()
+
+    def do_GET(self):
+        if self.path == '/slow':
+            time.sleep(http_read_timeout + 5)
+            return self.reply(200)
+        if self.path == '/busy':
+            return self.reply(503, {'Retry-After': '1'})
+        if self.path == '/limited':
+            return self.reply(429, {'Retry-After': '3600'})
+        return self.reply(200)
+
+    def reply(self, status, headers={}):
+        body = b'{"results": {"bindings": []}}'
+        self.send_response(status)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+def measure(label, call, number):
+    global connections
+    connections = 0
+    start = time.perf_counter()
+    for _ in range(number):
+        call()
+    elapsed = time.perf_counter() - start
+    print(f'{label:<20} {number / elapsed:10.1f} req/s {connections:6d} connections')
+
+def worstCase(label, url, verify=True):
+    start = time.perf_counter()
+    try:
+        status = client.get(url, verify=verify).status_code
+    except requests.RequestException as error:
+        status = type(error).__name__
+    print(f'{label:<20} {time.perf_counter() - start:8.2f} s    ({status})')
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--number', type=int, default=500)
+    parser.add_argument('--tls', nargs=2, metavar=('CERT', 'KEY'), help='serve via TLS with this certificate (self-signed is fine)')
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    server.daemon_threads = True
+    scheme = 'http'
+    verify = True
+    if args.tls:
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(*args.tls)
+        server.socket = context.wrap_socket(server.socket, server_side=True)
+        scheme = 'https'
+        verify = False
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f'{scheme}://127.0.0.1:{server.server_address[1]}'
+
+    print('Throughput')
+    measure('requests.get', lambda: requests.get(base + '/ok', verify=verify), args.number)
+    measure('client.get', lambda: client.get(base + '/ok', verify=verify), args.number)
+
+    print(f'\nWorst case (deadline: {http_deadline} s, waits capped at {http_max_delay} s)')
+    worstCase('/busy', base + '/busy', verify)
+    worstCase('/limited', base + '/limited', verify)
+    worstCase('/slow', base + '/slow', verify)
+
+    server.shutdown()
+
+if __name__ == '__main__':
+    main()
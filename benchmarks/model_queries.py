@@ -0,0 +1,150 @@
+'''Benchmark the shapes of the queryModelDocumentation class queries (optional, union, subselect) on a synthetic large model.
+
+   Usage: python benchmarks/model_queries.py [--relations N] [--number N] [--shapes SHAPE ...] [--endpoint URL] [--dump FILE]
+
+   The synthetic model has N entities in each of its relations (research problems,
+   formulations, assumptions, conditions, models, tasks), each of its formulations
+   and tasks has N entities in each of their relations as well. Without --endpoint
+   the queries run on a local rdflib graph (pip install rdflib), with --endpoint on a
+   SPARQL endpoint the synthetic data was loaded into (write it with --dump, e.g. for
+   a local Fuseki). Reported are the time per query, the rows the endpoint groups and
+   the rows returned; all shapes have to return the same results.
+
+   The optional shape grows with N to the power of the number of relations (10 for
+   models and formulations, 15 for tasks), keep N small or leave it out.'''
+
+import argparse
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from MaRDMO.sparql import documentationQuery, flagDocumentation, taskDocumentation, modelDocumentationRelations, formulationDocumentationRelations, taskDocumentationRelations
+
+SHAPES = ['optional', 'union', 'subselect']
+
+CLASSES = {'MathematicalModel': (flagDocumentation('MathematicalModel'), modelDocumentationRelations),
+           'MathematicalFormulation': (flagDocumentation('MathematicalFormulation'), formulationDocumentationRelations),
+           'Task': (taskDocumentation, taskDocumentationRelations)}
+
+MATHMODDB = 'https://mardi4nfdi.de/mathmoddb#'
+RDF = 'http://www.w3.org/1999/02/22-rdf-syntax-ns#'
+RDFS = 'http://www.w3.org/2000/01/rdf-schema#'
+
+CONTAINED = ['containsFormulation', 'containsAssumption', 'containsBoundaryCondition', 'containsConstraintCondition',
+             'containsCouplingCondition', 'containsInitialCondition', 'containsFinalCondition']
+
+def synthetic(n):
+    '''Synthetic Model with n Entities per Relation as N-Triples, IDs of the documented Model, Formulations and Tasks'''
+    triples = []
+    def entity(name, Class, comment=True):
+        triples.append(f'<{MATHMODDB}{name}> <{RDF}type> <{MATHMODDB}{Class}> .')
+        triples.append(f'<{MATHMODDB}{name}> <{RDFS}label> "{name}"@en .')
+        if comment:
+            triples.append(f'<{MATHMODDB}{name}> <{RDFS}comment> "Description of {name}"@en .')
+    def relate(subject, prop, obj):
+        triples.append(f'<{MATHMODDB}{subject}> <{MATHMODDB}{prop}> <{MATHMODDB}{obj}> .')
+    def flags(subject):
+        for flag in ['isLinear', 'isConvex', 'isDynamic', 'isDeterministic', 'isDimensionless', 'isTimeContinuous', 'isSpaceContinuous']:
+            triples.append(f'<{MATHMODDB}{subject}> <{MATHMODDB}{flag}> "true"^^<http://www.w3.org/2001/XMLSchema#boolean> .')
+
+    triples.append(f'<{MATHMODDB}ComputationalTask> <{RDFS}subClassOf> <{MATHMODDB}Task> .')
+    entity('Model', 'MathematicalModel')
+    flags('Model')
+    formulations, tasks = [], []
+    for i in range(n):
+        entity(f'Problem{i}', 'ResearchProblem')
+        relate('Model', 'models', f'Problem{i}')
+        entity(f'SubModel{i}', 'MathematicalModel')
+        relate('Model', 'containsModel', f'SubModel{i}')
+        entity(f'Task{i}', 'ComputationalTask')
+        relate('Model', 'appliedByTask', f'Task{i}')
+        tasks.append(f'Task{i}')
+        for prop in CONTAINED:
+            entity(f'{prop}{i}', 'MathematicalFormulation')
+            relate('Model', prop, f'{prop}{i}')
+            formulations.append(f'{prop}{i}')
+    for formulation in formulations:
+        flags(formulation)
+        for i in range(n):
+            for prop in CONTAINED:
+                entity(f'{formulation}{prop}{i}', 'MathematicalFormulation', comment=False)
+                relate(formulation, prop, f'{formulation}{prop}{i}')
+            entity(f'{formulation}Quantity{i}', 'Quantity', comment=False)
+            relate(formulation, 'containsQuantity', f'{formulation}Quantity{i}')
+            triples.append(f'<{MATHMODDB}{formulation}> <{MATHMODDB}definingFormulation> "{formulation} = {i}" .')
+            triples.append(f'<{MATHMODDB}{formulation}> <{MATHMODDB}inDefiningFormulation> "{formulation}, element {i}" .')
+    for task in tasks:
+        triples.append(f'<{MATHMODDB}{task}> <{MATHMODDB}isLinear> "false"^^<http://www.w3.org/2001/XMLSchema#boolean> .')
+        for i in range(n):
+            relate(task, 'appliesModel', 'Model')
+            for prop in CONTAINED + ['containsTask', 'containedInTask', 'containsInput', 'containsOutput', 'containsObjective', 'containsParameter', 'containsConstant']:
+                entity(f'{task}{prop}{i}', 'Quantity', comment=False)
+                relate(task, prop, f'{task}{prop}{i}')
+    return '\n'.join(triples), {'MathematicalModel': ['Model'], 'MathematicalFormulation': formulations, 'Task': tasks}
+
+def counting(query):
+    '''Query counting the Rows the Endpoint groups (before GROUP BY)'''
+    query = re.sub(r'SELECT .*?\nWHERE', 'SELECT (COUNT(*) AS ?rows)\nWHERE', query, count=1, flags=re.S)
+    return re.sub(r'GROUP BY [^\n]*$', '', query)
+
+def localEndpoint(data):
+    '''Run Queries on an rdflib Graph holding data'''
+    import rdflib
+    graph = rdflib.Graph()
+    graph.parse(data=data, format='nt')
+    def run(query):
+        result = graph.query(query)
+        return [{str(var): str(row[var]) for var in result.vars if row[var] is not None} for row in result]
+    return run
+
+def remoteEndpoint(url):
+    '''Run Queries on a SPARQL Endpoint'''
+    import requests
+    def run(query):
+        response = requests.post(url, data=query, headers={'Content-Type': 'application/sparql-query', 'Accept': 'application/sparql-results+json'})
+        response.raise_for_status()
+        return [{var: value['value'] for var, value in row.items()} for row in response.json()['results']['bindings']]
+    return run
+
+def normalised(results):
+    '''Results independent of the Order of Rows and of concatenated Values'''
+    return sorted(sorted((var, ' <|> '.join(sorted(value.split(' <|> ')))) for var, value in row.items() if value) for row in results)
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--relations', type=int, default=2, help='entities per relation of the synthetic model')
+    parser.add_argument('--number', type=int, default=3, help='runs per query')
+    parser.add_argument('--shapes', nargs='+', choices=SHAPES, default=SHAPES)
+    parser.add_argument('--endpoint', help='SPARQL endpoint holding the synthetic data, instead of a local rdflib graph')
+    parser.add_argument('--dump', help='write the synthetic data as N-Triples to this file and exit')
+    args = parser.parse_args()
+
+    data, ids = synthetic(args.relations)
+    if args.dump:
+        with open(args.dump, 'w') as dump:
+            dump.write(data + '\n')
+        return
+    run = remoteEndpoint(args.endpoint) if args.endpoint else localEndpoint(data)
+
+    print(f'{"Class":<24} {"Shape":<10} {"Time":>10} {"Grouped":>10} {"Rows":>6}')
+    for Class, (scalars, relations) in CLASSES.items():
+        search = ' '.join(f':{Id}' for Id in ids[Class])
+        reference = None
+        for shape in args.shapes:
+            query = documentationQuery(Class, scalars, relations, shape).format(search)
+            start = time.perf_counter()
+            for _ in range(args.number):
+                results = run(query)
+            elapsed = (time.perf_counter() - start) / args.number
+            grouped = run(counting(query))[0]['rows']
+            print(f'{Class:<24} {shape:<10} {elapsed * 1000:8.1f} ms {grouped:>10} {len(results):>6}')
+            if reference is None:
+                reference = normalised(results)
+            elif normalised(results) != reference:
+                print(f'{"":<24} {shape:<10} results differ from {args.shapes[0]}')
+
+if __name__ == '__main__':
+    main()
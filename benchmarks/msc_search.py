@@ -0,0 +1,52 @@
+'''Benchmark MSC2020 search: linear scan (previous MSCProvider) vs. MSCIndex.
+
+   Usage: python benchmarks/msc_search.py [--save]
+
+   With --save the index is stored as sidecar file (MaRDMO/data/msc2020.idx),
+   which MSCProvider loads instead of building the index at first use, as long as
+   msc2020.json is unchanged. Both searches must return the same options.'''
+
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from MaRDMO.index import MSCIndex
+
+SOURCE = os.path.join(os.path.dirname(__file__), '..', 'MaRDMO', 'data', 'msc2020.json')
+SIDECAR = os.path.splitext(SOURCE)[0] + '.idx'
+QUERIES = ['navier', 'Heat equation', 'stochastic differential', 'graph', 'xyzzy', '35K', '76D05']
+NUMBER = 200
+
+def linear(msc, search):
+    '''Search as previously done by MSCProvider'''
+    options = [{'id': msc[key]['id'] + ' - ' + key , 'text': f"{key} ({msc[key]['id']})"} for key in msc if search.lower() in key.lower()]
+    return options[:20]
+
+def main():
+    with open(SOURCE, 'r') as json_file:
+        msc = json.load(json_file)
+
+    build = timeit.timeit(lambda: MSCIndex.build(msc), number=5) / 5
+    index = MSCIndex.build(msc)
+    print(f"build index from JSON: {build * 1e3:8.1f} ms")
+
+    if '--save' in sys.argv:
+        # Written if missing or built from other data
+        MSCIndex.load(SIDECAR, SOURCE)
+    if os.path.exists(SIDECAR):
+        load = timeit.timeit(lambda: MSCIndex.load(SIDECAR, SOURCE), number=5) / 5
+        print(f"load index from sidecar: {load * 1e3:6.1f} ms")
+
+    print(f"\n{'query':25} {'linear [us]':>12} {'index [us]':>12} {'speedup':>8} {'hits':>5}")
+    for query in QUERIES:
+        t_linear = timeit.timeit(lambda: linear(msc, query), number=NUMBER) / NUMBER
+        t_index = timeit.timeit(lambda: index.search(query, 20), number=NUMBER) / NUMBER
+        hits = len(index.search(query, 20))
+        assert [option['text'] for option in linear(msc, query)] == [f"{label} ({code})" for label, code in index.search(query, 20)], query
+        print(f"{query:25} {t_linear * 1e6:12.1f} {t_index * 1e6:12.1f} {t_linear / t_index:8.0f} {hits:5}")
+
+if __name__ == '__main__':
+    main()
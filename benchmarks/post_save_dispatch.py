@@ -0,0 +1,77 @@
+'''Benchmark Value saves: one post_save Receiver per Handler (previous handlers.py) vs. dispatchValue.
+
+   Run from the rdmo-app directory of an RDMO installation with MaRDMO installed:
+
+       DJANGO_SETTINGS_MODULE=config.settings python /path/to/benchmarks/post_save_dispatch.py [--value PK] [--number N]
+
+   Saves an existing Value (by default the first one whose Attribute has no MaRDMO
+   Handler, i.e. the common case) N times in both modes. All saves happen inside a
+   transaction which is rolled back afterwards.'''
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.getcwd())
+
+import django
+
+django.setup()
+
+from django.db import transaction
+from django.db.models.signals import post_save
+
+from rdmo.projects.models import Value
+
+from MaRDMO.handlers import dispatchValue, valueHandlers
+
+def legacyReceiver(uri):
+    '''Receiver as previously registered for each Handler, comparing the Attribute URI itself'''
+    def receiver(sender, **kwargs):
+        instance = kwargs.get("instance", None)
+        if instance and instance.attribute.uri == uri:
+            valueHandlers[uri](sender, **kwargs)
+    return receiver
+
+def run(pk, number):
+    '''Save Value pk number times, reloading it each time so that its Attribute is not cached'''
+    start = time.perf_counter()
+    for _ in range(number):
+        Value.objects.get(pk=pk).save()
+    return number / (time.perf_counter() - start)
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--value', type=int, help='primary key of the Value to save')
+    parser.add_argument('--number', type=int, default=1000)
+    args = parser.parse_args()
+
+    pk = args.value
+    if pk is None:
+        pk = Value.objects.exclude(attribute__uri__in=list(valueHandlers)).exclude(attribute=None).values_list('pk', flat=True).first()
+    if pk is None:
+        sys.exit('No Value found, pass --value')
+
+    legacy = [legacyReceiver(uri) for uri in valueHandlers]
+
+    with transaction.atomic():
+        # Previous Setup, one Receiver per Handler
+        post_save.disconnect(dispatchValue, sender=Value)
+        for receiver in legacy:
+            post_save.connect(receiver, sender=Value, weak=False)
+        before = run(pk, args.number)
+
+        # Current Setup, single Dispatcher
+        for receiver in legacy:
+            post_save.disconnect(receiver, sender=Value)
+        post_save.connect(dispatchValue, sender=Value)
+        after = run(pk, args.number)
+
+        transaction.set_rollback(True)
+
+    print(f'{len(valueHandlers)} receivers: {before:10.1f} saves/s')
+    print(f'dispatcher:   {after:10.1f} saves/s')
+
+if __name__ == '__main__':
+    main()
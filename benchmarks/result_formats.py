@@ -0,0 +1,94 @@
+'''Benchmark parsing SPARQL SELECT results: sparql-results+json as a whole vs. TSV and CSV row by row (MaRDMO.results).
+
+   Usage: python benchmarks/result_formats.py [--rows N] [--number N] [--endpoint URL]
+
+   Without --endpoint a synthetic class listing (answer, label, class) of N rows is
+   serialised in each format and parsed from memory, with --endpoint a listing query
+   is sent to a SPARQL endpoint (e.g. MathModDB) once per format. Reported are the
+   size of the response, the time to parse it, the peak memory while parsing and the
+   memory the parsed rows keep.'''
+
+import argparse
+import csv
+import io
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from MaRDMO.results import RESULT_TYPES, rows
+
+MATHMODDB = 'https://mardi4nfdi.de/mathmoddb#'
+
+QUERY = '''PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
+SELECT ?answer ?label ?class
+WHERE { ?answer a ?class ; rdfs:label ?label . FILTER (lang(?label) = 'en') }'''
+
+class Response:
+    '''Response holding body, read in chunks as by requests'''
+
+    def __init__(self, media_type, body):
+        self.headers = {'Content-Type': media_type}
+        self.body = body
+        self.encoding = None
+
+    def iter_content(self, chunk_size, decode_unicode):
+        for start in range(0, len(self.body), chunk_size):
+            yield self.body[start:start + chunk_size].decode(self.encoding)
+
+    def json(self):
+        return json.loads(self.body)
+
+def synthetic(n):
+    '''Synthetic Listing of n Rows as Body per Format'''
+    listing = [(f'{MATHMODDB}mardmo{i}', f'Entity {i} with a label of usual length', f'{MATHMODDB}Quantity') for i in range(n)]
+    variables = ['answer', 'label', 'class']
+    bindings = [{'answer': {'type': 'uri', 'value': answer},
+                 'label': {'type': 'literal', 'xml:lang': 'en', 'value': label},
+                 'class': {'type': 'uri', 'value': Class}} for answer, label, Class in listing]
+    tsv = '\n'.join(['\t'.join(f'?{var}' for var in variables)] + [f'<{answer}>\t"{label}"@en\t<{Class}>' for answer, label, Class in listing])
+    text = io.StringIO()
+    writer = csv.writer(text)
+    writer.writerow(variables)
+    writer.writerows(listing)
+    return {'json': json.dumps({'head': {'vars': variables}, 'results': {'bindings': bindings}}).encode(),
+            'tsv': tsv.encode(),
+            'csv': text.getvalue().encode()}
+
+def remote(url):
+    '''Listing as returned by url per Format'''
+    import requests
+    bodies = {}
+    for name, media_type in RESULT_TYPES.items():
+        response = requests.post(url, data=QUERY, headers={'Content-Type': 'application/sparql-query', 'Accept': media_type})
+        response.raise_for_status()
+        bodies[name] = response.content
+    return bodies
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=100000, help='rows of the synthetic listing')
+    parser.add_argument('--number', type=int, default=3, help='runs per format')
+    parser.add_argument('--endpoint', help='SPARQL endpoint to fetch a listing from, instead of the synthetic one')
+    args = parser.parse_args()
+
+    bodies = remote(args.endpoint) if args.endpoint else synthetic(args.rows)
+
+    print(f'{"Format":<8} {"Size":>10} {"Time":>10} {"Peak":>10} {"Kept":>10} {"Rows":>8}')
+    for name, body in bodies.items():
+        start = time.perf_counter()
+        for _ in range(args.number):
+            results = list(rows(Response(RESULT_TYPES[name], body)))
+        elapsed = (time.perf_counter() - start) / args.number
+        del results
+        tracemalloc.start()
+        results = list(rows(Response(RESULT_TYPES[name], body)))
+        kept, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f'{name:<8} {len(body) / 2**20:7.1f} MB {elapsed * 1000:7.1f} ms {peak / 2**20:7.1f} MB {kept / 2**20:7.1f} MB {len(results):>8}')
+
+if __name__ == '__main__':
+    main()